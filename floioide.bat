@@ -12,6 +12,11 @@ call .venv\Scripts\activate.bat
 python.exe -m pip install --upgrade pip
 pip install -r requirements.txt
 
+:: On range les images dans les pages d'atlas (une seule fois)
+if not exist "data\atlas\manifeste.json" (
+    python sources/paquets.py
+)
+
 :: On lance le jeu
 python sources/main.py
 pause
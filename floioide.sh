@@ -9,4 +9,9 @@ if [ ! -d "$VENV_DIR" ]; then
 fi
 
 "$VENV_DIR/bin/pip" install -r "requirements.txt"
+# pages d'atlas des images (une seule fois)
+if [ ! -f "data/atlas/manifeste.json" ]; then
+    "$VENV_DIR/bin/python" sources/paquets.py
+fi
+
 "$VENV_DIR/bin/python" sources/main.py
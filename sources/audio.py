@@ -0,0 +1,138 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# sons du jeu, une seule banque partagee par toutes les vues
+# - les bruitages (SONS) sont decodes une fois au chargement et rejoues sans
+#   relire le fichier ; chacun a un nombre maximum de voix en meme temps et
+#   n'est pas relance deux fois de suite a moins de ECART_MIN_SON
+# - les musiques (MUSIQUES) sont lues en flux (decodees au fur et a mesure)
+#   par un seul lecteur : relancer la musique en cours ne fait rien
+# - les sons en boucle (pas) gardent un seul lecteur mis en pause et relance,
+#   et ne s'arretent qu'apres DELAI_ARRET_BOUCLE : un etat qui clignote d'une
+#   frame a l'autre ne cree pas de lecteur
+
+import os
+import time
+import arcade
+import demarrage
+from constantes import DOSSIER_DATA, ECART_MIN_SON, DELAI_ARRET_BOUCLE
+
+_DOSSIER = os.path.join(DOSSIER_DATA, "sounds")
+
+# bruitages : fichier, voix maximum
+SONS = {
+    "saut": ("saut.wav", 2),
+    "pas": ("deplacement.ogg", 1),
+}
+
+# musiques longues (lues en flux)
+MUSIQUES = {
+    "combat": "FLOIOIDE_bossfight_1.mp3",
+}
+
+_sons = {}      # nom -> son decode
+_voix = {}      # nom -> lecteurs en cours
+_derniers = {}  # nom -> heure du dernier lancement
+_boucles = {}   # nom -> Boucle
+_musique = {"nom": None, "lecteur": None}
+_muet = {"actif": False}   # simulation sans fenetre : aucun son n'est charge ni joue
+
+
+def couper():
+    """ plus aucun son (simulation sans fenetre, voir simulation.py) """
+    arreter_musique()
+    _muet["actif"] = True
+
+
+def son(nom):
+    """ bruitage decode (charge une seule fois) """
+    s = _sons.get(nom)
+    if s is None:
+        with demarrage.mesurer("son"):
+            s = _sons.setdefault(nom, arcade.load_sound(os.path.join(_DOSSIER, SONS[nom][0])))
+    return s
+
+
+def precharger(noms=None):
+    """ decode d'avance les bruitages (tous par defaut), peut tourner sur le thread de chargement """
+    if _muet["actif"]:
+        return
+    for nom in noms if noms is not None else SONS:
+        son(nom)
+
+
+def jouer(nom, volume=1.0):
+    """ joue un bruitage si une voix est libre, renvoie le lecteur (ou None) """
+    if _muet["actif"]:
+        return None
+    maintenant = time.perf_counter()
+    if maintenant - _derniers.get(nom, -ECART_MIN_SON) < ECART_MIN_SON:
+        return None
+    lecteurs = [l for l in _voix.get(nom, ()) if l.playing]
+    if len(lecteurs) >= SONS[nom][1]:
+        _voix[nom] = lecteurs
+        return None
+    lecteur = arcade.play_sound(son(nom), volume=volume)
+    if lecteur is not None:
+        lecteurs.append(lecteur)
+    _voix[nom] = lecteurs
+    _derniers[nom] = maintenant
+    return lecteur
+
+
+class Boucle:
+    """ son en boucle allume ou eteint a chaque frame, avec un seul lecteur """
+
+    def __init__(self, nom, volume=1.0):
+        self.nom = nom
+        self.volume = volume
+        self.lecteur = None
+        self.active = False
+        self.temps_eteint = 0.0
+
+    def mettre(self, actif, delta_time):
+        if actif:
+            self.temps_eteint = 0.0
+            if not self.active:
+                self.active = True
+                if self.lecteur is None:
+                    self.lecteur = arcade.play_sound(son(self.nom), volume=self.volume, loop=True)
+                else:
+                    self.lecteur.play()
+        elif self.active:
+            # couper seulement si l'etat reste eteint un moment
+            self.temps_eteint += delta_time
+            if self.temps_eteint >= DELAI_ARRET_BOUCLE:
+                self.active = False
+                if self.lecteur is not None:
+                    self.lecteur.pause()
+
+
+def boucle(nom, actif, delta_time, volume=1.0):
+    """ a appeler a chaque frame : le son en boucle joue tant que actif est vrai """
+    if _muet["actif"]:
+        return
+    b = _boucles.get(nom)
+    if b is None:
+        b = _boucles[nom] = Boucle(nom, volume)
+    b.mettre(actif, delta_time)
+
+
+def musique(nom, volume=1.0):
+    """ lance la musique en boucle, lue en flux ; continue si c'est deja elle """
+    if _muet["actif"]:
+        return
+    if _musique["nom"] == nom and _musique["lecteur"] is not None:
+        return
+    arreter_musique()
+    with demarrage.mesurer("musique"):
+        flux = arcade.load_sound(os.path.join(_DOSSIER, MUSIQUES[nom]), streaming=True)
+    _musique["nom"] = nom
+    _musique["lecteur"] = arcade.play_sound(flux, volume=volume, loop=True)
+
+
+def arreter_musique():
+    if _musique["lecteur"] is not None:
+        arcade.stop_sound(_musique["lecteur"])
+    _musique["nom"] = None
+    _musique["lecteur"] = None
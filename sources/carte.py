@@ -0,0 +1,329 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# cache binaire de la carte tiled
+# map.tmj est un json de 3 mo (15 calques x 60000 tuiles en texte)
+# on le compile une fois en tableaux d'entiers lus directement avec mmap
+# le nom du fichier cache contient un hash du contenu : si la carte change
+# le cache est reconstruit tout seul au prochain lancement
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+from array import array
+
+import arcade
+from constantes import DOSSIER_MAPS, DOSSIER_CACHE
+
+VERSION_CACHE = 1
+MAGIC = b"FLMC"
+# magic, version, type des gids ("H" ou "I"), taille des metadonnees json
+ENTETE = struct.Struct("<4sHcxI")
+
+# bits de retournement tiled (gid > 2^29)
+FLIP_H = 0x80000000
+FLIP_V = 0x40000000
+FLIP_D = 0x20000000
+MASQUE_GID = 0x1FFFFFFF
+
+
+class CarteCompilee:
+    """ Carte lue depuis le cache : un tableau d'entiers par calque """
+
+    def __init__(self, meta, tampon=None, fichier=None):
+        self.cle = meta["cle"]
+        self.largeur = meta["largeur"]       # en tuiles
+        self.hauteur = meta["hauteur"]
+        self.largeur_tuile = meta["largeur_tuile"]  # en pixels (avant scaling)
+        self.hauteur_tuile = meta["hauteur_tuile"]
+        self.tileset = meta["tileset"]
+        self.ordre = [c["nom"] for c in meta["calques"]]
+        self.opacites = {c["nom"]: c["opacite"] for c in meta["calques"]}
+        self.visibles = {c["nom"]: c["visible"] for c in meta["calques"]}
+
+        # garder le fichier et le mmap ouverts tant que la carte vit
+        self._fichier = fichier
+        self._tampon = tampon
+
+        self.calques = {}
+        type_gid = meta["type_gid"]
+        taille = array(type_gid).itemsize
+        nb = self.largeur * self.hauteur
+        vue = self._vue = memoryview(tampon)
+        for c in meta["calques"]:
+            morceau = vue[c["decalage"]:c["decalage"] + nb * taille]
+            if sys.byteorder == "little":
+                self.calques[c["nom"]] = morceau.cast(type_gid)
+            else:
+                # machine big endian : copie + inversion des octets
+                tab = array(type_gid, morceau.tobytes())
+                tab.byteswap()
+                self.calques[c["nom"]] = tab
+
+    def gid(self, nom_calque, colonne, ligne):
+        """ gid de la tuile (ligne 0 = haut de la carte comme dans tiled) """
+        return self.calques[nom_calque][ligne * self.largeur + colonne]
+
+    def fermer(self):
+        # liberer les vues avant de fermer le mmap (sinon BufferError)
+        for tab in self.calques.values():
+            if isinstance(tab, memoryview):
+                tab.release()
+        self.calques = {}
+        self._vue.release()
+        if self._tampon is not None and isinstance(self._tampon, mmap.mmap):
+            self._tampon.close()
+        if self._fichier is not None:
+            self._fichier.close()
+        self._tampon = None
+        self._fichier = None
+
+
+def _lire_tileset(dossier_map, ts):
+    """ renvoie les infos du tileset (externe .tsj ou integre a la carte) """
+    infos = dict(ts)
+    dossier_image = dossier_map
+    if "source" in ts:
+        chemin_tsj = os.path.join(dossier_map, ts["source"])
+        with open(chemin_tsj, "r", encoding="utf-8") as f:
+            infos.update(json.load(f))
+        dossier_image = os.path.dirname(chemin_tsj)
+    return {
+        "firstgid": infos["firstgid"],
+        # chemin de l'image par rapport au dossier de la carte
+        "image": os.path.relpath(os.path.join(dossier_image, infos["image"]), dossier_map),
+        "colonnes": infos["columns"],
+        "nb_tuiles": infos["tilecount"],
+        "largeur_tuile": infos["tilewidth"],
+        "hauteur_tuile": infos["tileheight"],
+        "marge": infos.get("margin", 0),
+        "espacement": infos.get("spacing", 0),
+    }
+
+
+def calculer_cle(chemin_map):
+    """ hash de la carte et des tilesets .tsj du meme dossier (sans parser le json) """
+    h = hashlib.sha1(f"v{VERSION_CACHE}".encode())
+    with open(chemin_map, "rb") as f:
+        h.update(f.read())
+    dossier_map = os.path.dirname(chemin_map)
+    for nom in sorted(os.listdir(dossier_map)):
+        if nom.endswith(".tsj"):
+            with open(os.path.join(dossier_map, nom), "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def chemin_cache(chemin_map, cle, dossier_cache=DOSSIER_CACHE):
+    nom = os.path.splitext(os.path.basename(chemin_map))[0]
+    return os.path.join(dossier_cache, f"{nom}-{cle}.flmc")
+
+
+def compiler_carte(chemin_map, dossier_cache=DOSSIER_CACHE, cle=None):
+    """ transforme map.tmj en fichier binaire et renvoie son chemin """
+    if cle is None:
+        cle = calculer_cle(chemin_map)
+    with open(chemin_map, "r", encoding="utf-8") as f:
+        donnees = json.load(f)
+
+    if len(donnees["tilesets"]) != 1:
+        raise ValueError("le cache ne gere qu'un seul tileset par carte")
+    tileset = _lire_tileset(os.path.dirname(chemin_map), donnees["tilesets"][0])
+
+    largeur, hauteur = donnees["width"], donnees["height"]
+    calques = [c for c in donnees["layers"] if c["type"] == "tilelayer"]
+
+    # gids sur 16 bits si possible (aucun retournement et gid < 65536)
+    plus_grand = max((max(c["data"]) for c in calques), default=0)
+    type_gid = "H" if plus_grand < 0x10000 else "I"
+
+    infos_calques = []
+    tableaux = []
+    decalage = 0
+    for c in calques:
+        if len(c["data"]) != largeur * hauteur:
+            raise ValueError(f"calque '{c['name']}' : taille inattendue")
+        tab = array(type_gid, c["data"])
+        if sys.byteorder != "little":
+            tab.byteswap()
+        infos_calques.append({
+            "nom": c["name"],
+            "opacite": c.get("opacity", 1),
+            "visible": c.get("visible", True),
+            "decalage": decalage,
+        })
+        tableaux.append(tab)
+        decalage += len(tab) * tab.itemsize
+
+    meta = {
+        "cle": cle,
+        "largeur": largeur,
+        "hauteur": hauteur,
+        "largeur_tuile": donnees["tilewidth"],
+        "hauteur_tuile": donnees["tileheight"],
+        "type_gid": type_gid,
+        "tileset": tileset,
+        "calques": infos_calques,
+    }
+    octets_meta = json.dumps(meta).encode("utf-8")
+    # aligner le debut des donnees sur 4 octets pour le cast memoryview
+    bourrage = (-(ENTETE.size + len(octets_meta))) % 4
+    octets_meta += b" " * bourrage
+
+    os.makedirs(dossier_cache, exist_ok=True)
+    chemin = chemin_cache(chemin_map, cle, dossier_cache)
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "wb") as f:
+        f.write(ENTETE.pack(MAGIC, VERSION_CACHE, type_gid.encode(), len(octets_meta)))
+        f.write(octets_meta)
+        for tab in tableaux:
+            tab.tofile(f)
+    os.replace(temporaire, chemin)
+
+    # supprimer les anciens caches de cette carte
+    prefixe = os.path.basename(chemin).rsplit("-", 1)[0] + "-"
+    for nom in os.listdir(dossier_cache):
+        if nom.startswith(prefixe) and nom.endswith(".flmc") and nom != os.path.basename(chemin):
+            os.remove(os.path.join(dossier_cache, nom))
+    return chemin
+
+
+def lire_cache(chemin, dossier_map=DOSSIER_MAPS):
+    """ ouvre un fichier cache avec mmap (rien n'est copie en memoire) """
+    fichier = open(chemin, "rb")
+    tampon = None
+    try:
+        tampon = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, type_gid, taille_meta = ENTETE.unpack_from(tampon, 0)
+        if magic != MAGIC or version != VERSION_CACHE:
+            raise ValueError(f"cache invalide : {chemin}")
+        debut = ENTETE.size
+        meta = json.loads(tampon[debut:debut + taille_meta].decode("utf-8"))
+        debut_donnees = debut + taille_meta
+        meta["type_gid"] = type_gid.decode()
+        for c in meta["calques"]:
+            c["decalage"] += debut_donnees
+        meta["tileset"]["image"] = os.path.join(dossier_map, meta["tileset"]["image"])
+    except Exception:
+        if tampon is not None:
+            tampon.close()
+        fichier.close()
+        raise
+    return CarteCompilee(meta, tampon, fichier)
+
+
+def charger_carte(chemin_map=None, dossier_cache=DOSSIER_CACHE):
+    """ charge la carte depuis le cache (compile d'abord si besoin) """
+    if chemin_map is None:
+        chemin_map = os.path.join(DOSSIER_MAPS, "map.tmj")
+    cle = calculer_cle(chemin_map)
+    chemin = chemin_cache(chemin_map, cle, dossier_cache)
+    dossier_map = os.path.dirname(chemin_map)
+    if not os.path.exists(chemin):
+        compiler_carte(chemin_map, dossier_cache, cle)
+    try:
+        return lire_cache(chemin, dossier_map)
+    except (ValueError, OSError, struct.error):
+        # cache abime : on le refait
+        compiler_carte(chemin_map, dossier_cache, cle)
+        return lire_cache(chemin, dossier_map)
+
+
+class TexturesTuiles:
+    """ decoupe le tileset a la demande et garde une texture par gid """
+
+    def __init__(self, carte):
+        self.tileset = carte.tileset
+        self.feuille = arcade.SpriteSheet(self.tileset["image"])
+        self.cache = {}
+
+    def texture(self, gid):
+        tex = self.cache.get(gid)
+        if tex is None:
+            ts = self.tileset
+            index = (gid & MASQUE_GID) - ts["firstgid"]
+            colonne = index % ts["colonnes"]
+            ligne = index // ts["colonnes"]
+            x = ts["marge"] + colonne * (ts["largeur_tuile"] + ts["espacement"])
+            y = ts["marge"] + ligne * (ts["hauteur_tuile"] + ts["espacement"])
+            tex = self.feuille.get_texture(arcade.LBWH(x, y, ts["largeur_tuile"], ts["hauteur_tuile"]))
+            # meme ordre que arcade pour les retournements
+            if gid & FLIP_D: tex = tex.flip_diagonally()
+            if gid & FLIP_H: tex = tex.flip_horizontally()
+            if gid & FLIP_V: tex = tex.flip_vertically()
+            self.cache[gid] = tex
+        return tex
+
+    def precharger(self, carte, noms):
+        """ decoupe d'avance toutes les tuiles des calques donnes
+        (calcul des hit box compris, peut tourner hors du thread principal) """
+        for nom in noms:
+            if nom in carte.calques:
+                for gid in set(carte.calques[nom]):
+                    if gid:
+                        self.texture(gid)
+
+
+def creer_sprites_calque(carte, textures, nom_calque, scaling, colonnes=None, lignes=None, opacite=None):
+    """ cree les sprites d'un calque (ou d'un rectangle de tuiles) """
+    donnees = carte.calques[nom_calque]
+    if opacite is None:
+        opacite = carte.opacites[nom_calque]
+    largeur = carte.largeur
+    tw = carte.largeur_tuile * scaling
+    th = carte.hauteur_tuile * scaling
+    if colonnes is None:
+        colonnes = range(carte.largeur)
+    if lignes is None:
+        lignes = range(carte.hauteur)
+
+    sprites = []
+    for ligne in lignes:
+        base = ligne * largeur
+        y = (carte.hauteur - ligne - 1) * th + th / 2
+        for colonne in colonnes:
+            gid = donnees[base + colonne]
+            if gid == 0:
+                continue
+            sprite = arcade.Sprite(textures.texture(gid), scale=scaling)
+            sprite.center_x = colonne * tw + tw / 2
+            sprite.center_y = y
+            if opacite:
+                sprite.alpha = int(opacite * 255)
+            sprites.append(sprite)
+    return sprites
+
+
+def construire_scene(carte, scaling=1.0, layer_options=None, textures=None, noms=None, opacites=None):
+    """ equivalent de arcade.Scene.from_tilemap mais depuis le cache
+    noms : calques a mettre dans la scene (tous par defaut)
+    opacites : opacite a utiliser a la place de celle de tiled """
+    scene = arcade.Scene()
+    for _ in remplir_scene(scene, carte, scaling, layer_options, textures, noms, opacites):
+        pass
+    return scene
+
+
+def remplir_scene(scene, carte, scaling=1.0, layer_options=None, textures=None, noms=None, opacites=None):
+    """ generateur : ajoute un calque a la scene par tour (ecran de chargement) """
+    layer_options = layer_options or {}
+    opacites = opacites or {}
+    textures = textures or TexturesTuiles(carte)
+    for nom in carte.ordre:
+        if noms is not None and nom not in noms:
+            continue
+        options = layer_options.get(nom, {})
+        liste = arcade.SpriteList(use_spatial_hash=options.get("use_spatial_hash", False))
+        liste.extend(creer_sprites_calque(carte, textures, nom, scaling, opacite=opacites.get(nom)))
+        liste.visible = carte.visibles[nom]
+        scene.add_sprite_list(nom, sprite_list=liste)
+        yield nom
+
+
+if __name__ == "__main__":
+    # compilation manuelle : python sources/carte.py [chemin/map.tmj]
+    chemin_map = sys.argv[1] if len(sys.argv) > 1 else os.path.join(DOSSIER_MAPS, "map.tmj")
+    print(f"cache ecrit : {compiler_carte(chemin_map)}")
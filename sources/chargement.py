@@ -0,0 +1,119 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# chargement d'une vue en plusieurs etapes
+# les etapes sans opengl (lecture de la carte, decodage des images et des sons)
+# tournent sur un thread a part, les envois a la carte graphique restent sur
+# le thread principal et sont etales sur plusieurs frames
+# l'ecran de chargement avance le chargement a chaque frame et affiche la progression
+
+import time
+import demarrage
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Etape:
+    """ une etape du chargement
+    sur_thread : la fonction tourne sur le thread de chargement (pas d'opengl)
+    sinon elle tourne sur le thread principal ; si c'est un generateur il avance
+    un morceau par appel (il peut renvoyer la part deja faite entre 0 et 1) """
+
+    def __init__(self, nom, fonction, sur_thread=False, poids=1.0):
+        self.nom = nom
+        self.fonction = fonction
+        self.sur_thread = sur_thread
+        self.poids = poids
+        self.fait = 0.0   # part de l'etape terminee
+
+
+class Chargement:
+    """ fait avancer une liste d'etapes dans l'ordre """
+
+    def __init__(self, etapes):
+        self.etapes = [e if isinstance(e, Etape) else Etape(*e) for e in etapes]
+        self.index = 0
+        self._thread = None
+        self._futur = None
+        self._generateur = None
+        self._debut_etape = None
+
+    @property
+    def termine(self):
+        return self.index >= len(self.etapes)
+
+    @property
+    def etape(self):
+        """ nom de l'etape en cours """
+        return None if self.termine else self.etapes[self.index].nom
+
+    @property
+    def progression(self):
+        """ part du chargement terminee (0 a 1), ponderee par le poids des etapes """
+        total = sum(e.poids for e in self.etapes)
+        if not total:
+            return 1.0
+        return min(1.0, sum(e.poids * e.fait for e in self.etapes) / total)
+
+    def _suivante(self):
+        # duree reelle de l'etape, frames d'attente comprises (FLOIOIDE_TRACE=1)
+        demarrage.noter("etape " + self.etapes[self.index].nom, time.perf_counter() - self._debut_etape)
+        self._debut_etape = None
+        self.etapes[self.index].fait = 1.0
+        self.index += 1
+        self._futur = None
+        self._generateur = None
+
+    def _pas(self, etape):
+        """ un morceau d'une etape du thread principal, vrai quand elle est finie """
+        if self._generateur is None:
+            resultat = etape.fonction()
+            if not hasattr(resultat, "__next__"):
+                return True
+            self._generateur = resultat
+        try:
+            part = next(self._generateur)
+        except StopIteration:
+            return True
+        if isinstance(part, (int, float)):
+            etape.fait = min(1.0, max(etape.fait, part))
+        return False
+
+    def avancer(self, budget=1 / 60):
+        """ a appeler a chaque frame : avance tant que le budget (secondes) n'est pas
+        depasse et rend la main pendant que le thread travaille ; vrai quand tout est fini """
+        debut = time.perf_counter()
+        while not self.termine:
+            etape = self.etapes[self.index]
+            if self._debut_etape is None:
+                self._debut_etape = time.perf_counter()
+            if etape.sur_thread:
+                if self._futur is None:
+                    if self._thread is None:
+                        self._thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chargement")
+                    self._futur = self._thread.submit(etape.fonction)
+                if not self._futur.done():
+                    break
+                # relance l'erreur du thread ici
+                self._futur.result()
+                self._suivante()
+            else:
+                if self._pas(etape):
+                    self._suivante()
+            if time.perf_counter() - debut >= budget:
+                break
+
+        if self.termine and self._thread is not None:
+            self._thread.shutdown(wait=False)
+            self._thread = None
+        return self.termine
+
+    def executer(self):
+        """ tout charger d'un coup sur le thread principal (mode dev, tests) """
+        for etape in self.etapes[self.index:]:
+            with demarrage.mesurer("etape " + etape.nom):
+                resultat = etape.fonction()
+                if hasattr(resultat, "__next__"):
+                    for _ in resultat:
+                        pass
+            etape.fait = 1.0
+        self.index = len(self.etapes)
@@ -0,0 +1,121 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# decoupage des calques de decor en morceaux (chunks) de tuiles
+# seuls les chunks proches de la camera ont des sprites en memoire
+# les chunks trop loin sont supprimes : le cout depend de l'ecran
+# et plus de la taille du monde
+
+import arcade
+from carte import TexturesTuiles, creer_sprites_calque
+
+TAILLE_CHUNK = 16   # en tuiles (16 x 64 px = 1024 px a l'ecran)
+MARGE_CHARGEMENT = 1  # chunks autour de la vue a preparer
+MARGE_EVICTION = 2    # au dela on libere le chunk (evite de recharger en boucle)
+
+
+class CalqueEnChunks:
+    """ un calque tiled decoupe en chunks de TAILLE_CHUNK x TAILLE_CHUNK tuiles """
+
+    def __init__(self, carte, textures, nom, scaling, opacite=None):
+        self.carte = carte
+        self.textures = textures
+        self.nom = nom
+        self.scaling = scaling
+        self.opacite = opacite
+        self.taille_px_x = TAILLE_CHUNK * carte.largeur_tuile * scaling
+        self.taille_px_y = TAILLE_CHUNK * carte.hauteur_tuile * scaling
+        self.nb_x = -(-carte.largeur // TAILLE_CHUNK)
+        self.nb_y = -(-carte.hauteur // TAILLE_CHUNK)
+        self.visible = carte.visibles[nom]
+
+        # chunks charges : (cx, cy) -> SpriteList
+        # cy = 0 en bas du monde comme les coordonnees arcade
+        self.charges = {}
+
+        # reperer une fois les chunks qui ont au moins une tuile
+        donnees = carte.calques[nom]
+        self.non_vides = set()
+        for ligne in range(carte.hauteur):
+            cy = (carte.hauteur - 1 - ligne) // TAILLE_CHUNK
+            base = ligne * carte.largeur
+            for colonne in range(carte.largeur):
+                if donnees[base + colonne]:
+                    self.non_vides.add((colonne // TAILLE_CHUNK, cy))
+
+    def _creer_chunk(self, cx, cy):
+        carte = self.carte
+        colonnes = range(cx * TAILLE_CHUNK, min((cx + 1) * TAILLE_CHUNK, carte.largeur))
+        # lignes tiled comptees depuis le haut
+        bas = cy * TAILLE_CHUNK
+        haut = min(bas + TAILLE_CHUNK, carte.hauteur)
+        lignes = range(carte.hauteur - haut, carte.hauteur - bas)
+        liste = arcade.SpriteList()
+        liste.extend(creer_sprites_calque(carte, self.textures, self.nom, self.scaling, colonnes, lignes, self.opacite))
+        return liste
+
+    def chunks_autour(self, x, y, demi_l, demi_h, marge):
+        """ chunks (cx, cy) qui touchent le rectangle vu + marge """
+        cx_min = max(0, int((x - demi_l) // self.taille_px_x) - marge)
+        cx_max = min(self.nb_x - 1, int((x + demi_l) // self.taille_px_x) + marge)
+        cy_min = max(0, int((y - demi_h) // self.taille_px_y) - marge)
+        cy_max = min(self.nb_y - 1, int((y + demi_h) // self.taille_px_y) + marge)
+        return cx_min, cx_max, cy_min, cy_max
+
+    def mettre_a_jour(self, x, y, demi_l, demi_h):
+        # 1 charger les chunks proches
+        cx_min, cx_max, cy_min, cy_max = self.chunks_autour(x, y, demi_l, demi_h, MARGE_CHARGEMENT)
+        for cx in range(cx_min, cx_max + 1):
+            for cy in range(cy_min, cy_max + 1):
+                if (cx, cy) not in self.charges and (cx, cy) in self.non_vides:
+                    self.charges[(cx, cy)] = self._creer_chunk(cx, cy)
+
+        # 2 liberer les chunks trop loin
+        cx_min, cx_max, cy_min, cy_max = self.chunks_autour(x, y, demi_l, demi_h, MARGE_EVICTION)
+        for cle in list(self.charges):
+            cx, cy = cle
+            if cx < cx_min or cx > cx_max or cy < cy_min or cy > cy_max:
+                del self.charges[cle]
+
+    def draw(self):
+        if not self.visible:
+            return
+        for liste in self.charges.values():
+            liste.draw()
+
+    def __len__(self):
+        return sum(len(liste) for liste in self.charges.values())
+
+
+class GestionnaireChunks:
+    """ regroupe les calques streames et les met a jour selon leur camera """
+
+    def __init__(self, carte, noms, scaling=1.0, textures=None, opacites=None):
+        self.textures = textures or TexturesTuiles(carte)
+        opacites = opacites or {}
+        self.calques = {}
+        for nom in noms:
+            if nom in carte.calques:
+                self.calques[nom] = CalqueEnChunks(carte, self.textures, nom, scaling, opacites.get(nom))
+
+    def __contains__(self, nom):
+        return nom in self.calques
+
+    def __getitem__(self, nom):
+        return self.calques[nom]
+
+    def mettre_a_jour(self, cameras):
+        """ cameras : nom du calque -> camera qui le dessine """
+        for nom, calque in self.calques.items():
+            camera = cameras[nom]
+            zoom = camera.zoom or 1
+            demi_l = camera.viewport_width / (2 * zoom)
+            demi_h = camera.viewport_height / (2 * zoom)
+            calque.mettre_a_jour(camera.position.x, camera.position.y, demi_l, demi_h)
+
+    def dessiner(self, nom):
+        if nom in self.calques:
+            self.calques[nom].draw()
+
+    def nb_sprites(self):
+        return sum(len(c) for c in self.calques.values())
@@ -0,0 +1,328 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# collisions avec le decor a partir du calque hit-box de la carte
+# une grille d'octets (0 vide, 1 pleine, 2 forme de pente) remplace les
+# 28000 sprites de murs : chaque test ne lit que les cases sous l'entite
+# MoteurPlateforme reprend PhysicsEnginePlatformer d'arcade sur cette grille
+
+import math
+import numpy as np
+from arcade.geometry import are_polygons_intersecting, is_point_in_polygon
+
+VIDE = 0
+PLEINE = 1
+PARTIELLE = 2
+
+
+class Boite:
+    """ mur touche : memes bords qu'un sprite de tuile (left right bottom top) """
+
+    def __init__(self, left, bottom, right, top):
+        self.left = left
+        self.bottom = bottom
+        self.right = right
+        self.top = top
+
+    def __repr__(self):
+        return f"Boite({self.left}, {self.bottom}, {self.right}, {self.top})"
+
+
+def polygone_sprite(sprite):
+    """ hit box du sprite a sa position actuelle
+    (une hit box reassignee garde l'ancienne position jusqu'au prochain deplacement) """
+    hit_box = sprite.hit_box
+    dx = sprite.center_x - hit_box.position[0]
+    dy = sprite.center_y - hit_box.position[1]
+    points = hit_box.get_adjusted_points()
+    if dx or dy:
+        points = [(px + dx, py + dy) for px, py in points]
+    return points
+
+
+class GrilleCollision:
+    """ cases solides du calque hit-box (colonne, ligne depuis le bas) """
+
+    def __init__(self, carte, nom="hit-box", scaling=1.0, textures=None):
+        # textures (TexturesTuiles) : forme exacte des pentes, sinon tout est plein
+        self.largeur = carte.largeur
+        self.hauteur = carte.hauteur
+        self.taille_x = carte.largeur_tuile * scaling
+        self.taille_y = carte.hauteur_tuile * scaling
+        self.cases = bytearray(self.largeur * self.hauteur)
+        self._cumul = None   # sommes cumulees pour les tests groupes (voir compter)
+        # case partielle -> (polygone monde, boite de la forme)
+        self.formes = {}
+        if nom not in carte.calques:
+            return
+
+        donnees = carte.calques[nom]
+        demi_x = carte.largeur_tuile / 2
+        demi_y = carte.hauteur_tuile / 2
+        plein = ((-demi_x, -demi_y), (demi_x, -demi_y), (demi_x, demi_y), (-demi_x, demi_y))
+        points_gid = {}
+        for ligne_tiled in range(self.hauteur):
+            y = self.hauteur - 1 - ligne_tiled
+            base = ligne_tiled * self.largeur
+            for x in range(self.largeur):
+                gid = donnees[base + x]
+                if not gid:
+                    continue
+                if textures is None:
+                    self.cases[y * self.largeur + x] = PLEINE
+                    continue
+                if gid not in points_gid:
+                    points_gid[gid] = tuple(textures.texture(gid).hit_box_points)
+                points = points_gid[gid]
+                if len(points) == 4 and set(points) == set(plein):
+                    self.cases[y * self.largeur + x] = PLEINE
+                    continue
+
+                # pente ou tuile rognee : garder le polygone comme le sprite
+                cx = (x + 0.5) * self.taille_x
+                cy = (y + 0.5) * self.taille_y
+                polygone = tuple((cx + px * scaling, cy + py * scaling) for px, py in points)
+                xs = [p[0] for p in polygone]
+                ys = [p[1] for p in polygone]
+                self.cases[y * self.largeur + x] = PARTIELLE
+                self.formes[(x, y)] = (polygone, Boite(min(xs), min(ys), max(xs), max(ys)))
+
+    # cases
+
+    def case(self, x, y):
+        """ contenu de la case (VIDE hors de la carte) """
+        if 0 <= x < self.largeur and 0 <= y < self.hauteur:
+            return self.cases[y * self.largeur + x]
+        return VIDE
+
+    def case_en(self, px, py):
+        """ case qui contient le point monde """
+        return int(px // self.taille_x), int(py // self.taille_y)
+
+    def _plage(self, gauche, bas, droite, haut):
+        x0 = max(0, int(gauche // self.taille_x))
+        x1 = min(self.largeur - 1, int(droite // self.taille_x))
+        y0 = max(0, int(bas // self.taille_y))
+        y1 = min(self.hauteur - 1, int(haut // self.taille_y))
+        return x0, x1, y0, y1
+
+    # requetes
+
+    def point(self, px, py):
+        """ le point est dans un mur """
+        x, y = self.case_en(px, py)
+        contenu = self.case(x, y)
+        if contenu == PARTIELLE:
+            return is_point_in_polygon(px, py, self.formes[(x, y)][0])
+        return contenu == PLEINE
+
+    def rect(self, gauche, bas, droite, haut, polygone=None):
+        """ le rectangle chevauche un mur (bords qui se touchent = pas de contact)
+        polygone : forme exacte a tester contre les pentes """
+        return bool(self._touches(gauche, bas, droite, haut, polygone, premier=True))
+
+    def polygone(self, polygone, premier=False):
+        """ murs touches par un polygone (liste de points monde) """
+        xs = [p[0] for p in polygone]
+        ys = [p[1] for p in polygone]
+        return self._touches(min(xs), min(ys), max(xs), max(ys), polygone, premier)
+
+    def touche(self, sprite):
+        """ remplace check_for_collision_with_list(sprite, murs) quand seul oui/non compte """
+        return bool(self.polygone(polygone_sprite(sprite), premier=True))
+
+    def collisions(self, sprite):
+        """ murs touches par le sprite, avec leurs bords comme des sprites de tuile """
+        return self.polygone(polygone_sprite(sprite))
+
+    def _touches(self, gauche, bas, droite, haut, polygone, premier=False):
+        touches = []
+        x0, x1, y0, y1 = self._plage(gauche, bas, droite, haut)
+        tx, ty = self.taille_x, self.taille_y
+        cases, largeur = self.cases, self.largeur
+        for y in range(y0, y1 + 1):
+            b = y * ty
+            h = b + ty
+            if not (bas < h and haut > b):
+                continue
+            base = y * largeur
+            for x in range(x0, x1 + 1):
+                contenu = cases[base + x]
+                if contenu == VIDE:
+                    continue
+                g = x * tx
+                d = g + tx
+                if contenu == PLEINE:
+                    if not (gauche < d and droite > g):
+                        continue
+                    boite = Boite(g, b, d, h)
+                else:
+                    forme, boite = self.formes[(x, y)]
+                    if not (gauche < boite.right and droite > boite.left and bas < boite.top and haut > boite.bottom):
+                        continue
+                    if polygone is not None and not are_polygons_intersecting(polygone, forme):
+                        continue
+                touches.append(boite)
+                if premier:
+                    return touches
+        return touches
+
+    def _sommes(self):
+        # sommes cumulees des cases pleines et partielles (tables d'aires)
+        if self._cumul is None:
+            cases = np.frombuffer(self.cases, dtype=np.uint8).reshape(self.hauteur, self.largeur)
+            self._cumul = []
+            for contenu in (PLEINE, PARTIELLE):
+                cumul = np.zeros((self.hauteur + 1, self.largeur + 1), dtype=np.int32)
+                cumul[1:, 1:] = (cases == contenu).cumsum(0).cumsum(1)
+                self._cumul.append(cumul)
+        return self._cumul
+
+    def _plages(self, gauche, bas, droite, haut):
+        # cases chevauchees par des tableaux de rectangles (fin exclue, bords qui se touchent exclus)
+        x0 = np.clip(np.floor(gauche / self.taille_x), 0, self.largeur).astype(np.intp)
+        x1 = np.clip(np.ceil(droite / self.taille_x), 0, self.largeur).astype(np.intp)
+        y0 = np.clip(np.floor(bas / self.taille_y), 0, self.hauteur).astype(np.intp)
+        y1 = np.clip(np.ceil(haut / self.taille_y), 0, self.hauteur).astype(np.intp)
+        return x0, np.maximum(x1, x0), y0, np.maximum(y1, y0)
+
+    def compter(self, gauche, bas, droite, haut):
+        """ pour des tableaux de rectangles : nombre de cases pleines et de cases
+        partielles chevauchees (sans partielle, pleines > 0 <=> rect vrai) """
+        x0, x1, y0, y1 = self._plages(gauche, bas, droite, haut)
+        return tuple(c[y1, x1] - c[y0, x1] - c[y1, x0] + c[y0, x0] for c in self._sommes())
+
+    def vide(self, gauche, bas, droite, haut):
+        """ aucune case pleine ou partielle sous le rectangle (test rapide avant touche) """
+        x0 = min(max(0, math.floor(gauche / self.taille_x)), self.largeur)
+        x1 = min(max(x0, math.ceil(droite / self.taille_x)), self.largeur)
+        y0 = min(max(0, math.floor(bas / self.taille_y)), self.hauteur)
+        y1 = min(max(y0, math.ceil(haut / self.taille_y)), self.hauteur)
+        for c in self._sommes():
+            if c[y1, x1] - c[y0, x1] - c[y1, x0] + c[y0, x0]:
+                return False
+        return True
+
+    def ligne_basse(self, gauche, bas, droite, haut):
+        """ pour des tableaux de rectangles : ligne de la plus basse case pleine
+        chevauchee, -1 si aucune (le premier mur rendu par collisions) """
+        x0, x1, y0, y1 = self._plages(gauche, bas, droite, haut)
+        c = self._sommes()[0]
+        ligne = np.full(len(x0), -1, dtype=np.intp)
+        for k in range(int((y1 - y0).max(initial=0))):
+            y = y0 + k
+            dedans = y < y1
+            y = np.minimum(y, self.hauteur - 1)
+            pleines = c[y + 1, x1] - c[y, x1] - c[y + 1, x0] + c[y, x0]
+            trouve = dedans & (ligne < 0) & (pleines > 0)
+            ligne[trouve] = y[trouve]
+        return ligne
+
+    def colonne(self, px, y_haut, y_bas):
+        """ balayage vertical : haut du premier mur sous y_haut (jusqu'a y_bas), sinon None """
+        x = int(px // self.taille_x)
+        if not 0 <= x < self.largeur:
+            return None
+        y = min(self.hauteur - 1, int(y_haut // self.taille_y))
+        fin = max(0, int(y_bas // self.taille_y))
+        while y >= fin:
+            contenu = self.cases[y * self.largeur + x]
+            if contenu == PLEINE:
+                return (y + 1) * self.taille_y
+            if contenu == PARTIELLE:
+                return self.formes[(x, y)][1].top
+            y -= 1
+        return None
+
+    def au_sol(self, sprite, distance=5):
+        """ un mur juste sous le sprite (meme test que can_jump d'arcade) """
+        return bool(self.polygone([(px, py - distance) for px, py in polygone_sprite(sprite)], premier=True))
+
+
+class MoteurPlateforme:
+    """ PhysicsEnginePlatformer d'arcade (gravite, pentes, saut) sur une GrilleCollision """
+
+    def __init__(self, sprite, grille, gravity_constant=0.5):
+        self.sprite = sprite
+        self.grille = grille
+        self.gravity_constant = gravity_constant
+
+    def can_jump(self, y_distance=5):
+        return self.grille.au_sol(self.sprite, y_distance)
+
+    def _decoincer(self):
+        # meme methode qu'arcade : essayer 8 directions de plus en plus loin
+        sprite = self.sprite
+        o_x, o_y = sprite.position
+        distance = 1
+        while True:
+            for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)):
+                sprite.position = o_x + dx * distance, o_y + dy * distance
+                if not self.grille.touche(sprite):
+                    return
+            distance *= 2
+
+    def update(self):
+        sprite = self.sprite
+        touche = self.grille.touche
+        sprite.change_y -= self.gravity_constant
+
+        if touche(sprite):
+            self._decoincer()
+
+        original_x, original_y = sprite.position
+
+        # 1 deplacement vertical
+        sprite.center_y += sprite.change_y
+        murs = self.grille.collisions(sprite)
+        if murs:
+            if sprite.change_y > 0:
+                while touche(sprite):
+                    sprite.center_y -= 1
+            elif sprite.change_y < 0:
+                while touche(sprite):
+                    sprite.center_y += 0.25
+            sprite.change_y = 0.0
+        sprite.center_y = round(sprite.center_y, 2)
+
+        # 2 deplacement horizontal avec montee des pentes (recherche par dichotomie)
+        if sprite.change_x:
+            presque_y = sprite.center_y
+            direction = math.copysign(1, sprite.change_x)
+            dx = abs(sprite.change_x)
+            borne_haute = dx
+            borne_basse = 0
+            dy = 0
+            while True:
+                sprite.center_x = original_x + dx * direction
+                if touche(sprite):
+                    # essayer de monter la pente
+                    dy = dx
+                    sprite.center_y = original_y + dy
+                    bloque = touche(sprite)
+                    if bloque:
+                        dy -= dx
+                    else:
+                        while not bloque and dy > 0:
+                            dy -= 1
+                            sprite.center_y = presque_y + dy
+                            bloque = touche(sprite)
+                        dy += 1
+                        bloque = False
+
+                    if bloque:
+                        borne_haute = dx - 1
+                        if borne_haute - borne_basse <= 0:
+                            dx = borne_basse
+                            break
+                        dx = (borne_haute + borne_basse) // 2
+                    else:
+                        break
+                else:
+                    borne_basse = dx
+                    if borne_haute - borne_basse <= 0:
+                        break
+                    dx = (borne_haute + borne_basse) // 2 + (borne_haute + borne_basse) % 2
+
+            sprite.position = original_x + dx * direction, presque_y + dy
+        return murs
@@ -13,8 +13,10 @@ TITRE = "FLOIOIDE"
 CHEMIN_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DOSSIER_DATA = os.path.join(CHEMIN_BASE, "data")
 DOSSIER_MAPS = os.path.join(DOSSIER_DATA, "maps")
+DOSSIER_CACHE = os.path.join(DOSSIER_MAPS, "cache") # cartes compilees (genere)
 DOSSIER_ATTAQUES = os.path.join(DOSSIER_DATA, "player", "attaque")
 DOSSIER_BOSS = os.path.join(DOSSIER_DATA, "boss")
+DOSSIER_ATLAS = os.path.join(DOSSIER_DATA, "atlas") # pages d'images empaquetees (genere)
 
 #reglages du joueur
 VITESSE_MARCHE = 5
@@ -31,4 +33,56 @@ MAX_MOBS_AIR = 5
 
 #du monde
 TAILLE_TUILE = 64
-GRAVITE = 0.5
\ No newline at end of file
+GRAVITE = 0.5
+
+#ennemis, boss, projectiles ennemis et coups du joueur passaient deux fois par image
+#dans la boucle d'origine : en une passe par tick, leur temps avance d'autant de pas
+#et leurs deplacements par passe sont multiplies d'autant (gravite au carre, memes sauts)
+PASSES_PAR_TICK = 2
+GRAVITE_ENNEMIS = GRAVITE * PASSES_PAR_TICK ** 2
+
+#calques de decor charges par morceaux autour de la camera (voir chunks.py)
+CALQUES_STREAMES = ["font-bouge_1", "font-bouge_0", "back-ground", "back-ground arbre etc", "hit-box", "front"]
+#vitesse des fonds parallax par rapport a la camera du jeu (1 = suit le monde)
+VITESSES_PARALLAX = {"font-bouge_0": 0.85, "font-bouge_1": 0.60}
+#calques dessines par shader si la carte graphique le permet (voir rendu_gpu.py)
+CALQUES_GPU = ["back-ground", "back-ground arbre etc", "hit-box", "front", "font-bouge_0", "font-bouge_1"]
+
+#calques de declenchement ranges dans l'index de zones (voir zones.py)
+CALQUES_ZONES = ["fontaine", "tron", "ver de terre", "bot", "boss fin", "dvd", "ending", "mobs"]
+
+#cinematiques : images decodees d'avance sur un thread (voir flux_images.py)
+AVANCE_CINEMATIQUE = 4 # images lues en plus de celles affichees
+
+#images rangees dans des pages d'atlas d'avance (voir paquets.py)
+#un groupe par dossier (chemin depuis data), une ou plusieurs pages par groupe
+GROUPES_ATLAS = ["player", "mobs", "chargement", "boss/Boss arbre", "boss/Boss robot", "boss/boss fin", "boss/Ver de terre", "boss/DVD", "boss/test"]
+TAILLE_PAGE_ATLAS = 4096
+
+#sons (voir audio.py)
+ECART_MIN_SON = 0.05 # secondes : un bruitage n'est pas relance plus vite (double appel)
+DELAI_ARRET_BOUCLE = 0.15 # secondes sans marcher avant de couper le son des pas
+
+#temps maximum du lancement a la premiere image du menu (voir demarrage.py)
+BUDGET_DEMARRAGE = 2.0 # secondes
+
+#simulation a pas fixe (voir pas_fixe.py)
+PAS_SIMULATION = 1 / 60 # secondes par tick, quelle que soit la frequence d'affichage
+MAX_PAS_PAR_FRAME = 5 # au dela le jeu ralentit au lieu de rattraper sans fin
+SAUT_INTERPOLATION = 256 # pixels en un tick : au dela c'est une teleportation, pas interpolee
+
+#mobs et projectiles ranges en tableaux (voir mobs.py, projectiles.py)
+MARGE_VUE = 200 # pixels autour de la vue ou leurs sprites suivent leur position
+
+#separation des mobs : grille de voisinage refaite a chaque tick (voir logic.py, mobs.py)
+CASE_SEPARATION = 128 # pixels, plus grand qu'un mob pour ne le ranger que dans peu de cases
+FORCE_SEPARATION = 2.0 # pixels par tick dont deux mobs qui se chevauchent sont ecartes
+
+#mises a jour selon la distance a la camera (voir proximite.py)
+#distances en demi-vues : 1 = bord de l'ecran, suit le zoom de camera_jeu
+LOD_PLEIN = 1.5 # en dessous : mise a jour a chaque tick
+LOD_REDUIT = 4.0 # en dessous : un tick sur LOD_PERIODE, au dela : gele
+LOD_PERIODE = 4
+
+#enregistrement et rejeu des parties (voir enregistrement.py)
+CONTROLE_REJEU = 60 # ticks entre deux releves de l'etat du joueur, compares au rejeu
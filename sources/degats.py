@@ -0,0 +1,238 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# tous les coups du tick en une seule phase
+# - les groupes qui peuvent frapper ou etre frappes (joueur, attaques, balles,
+#   mobs, boss, projectiles, zones du boss...) donnent leurs boites une fois par
+#   tick : tableaux numpy pour les mobs et les projectiles, boites calculees
+#   d'avance pour les petites listes de sprites
+# - MATRICE dit quels groupes se frappent et avec quelle regle ; les autres
+#   paires de groupes ne sont jamais testees
+# - pour chaque paire de groupes, le plus petit groupe interroge l'autre
+#   (le joueur demande les projectiles proches, pas l'inverse)
+# - chaque paire de sprites n'est testee exactement qu'une fois par tick
+# - les coups trouves (phase collisions) sont appliques ensuite par les regles
+#   (phase degats), dans l'ordre de MATRICE
+
+import arcade
+from collisions import polygone_sprite
+from entities import BossDVD, MobSol
+
+# (groupe qui frappe, groupe frappe) -> regle, dans l'ordre ou les degats sont appliques
+MATRICE = {
+    ("boss", "joueur"): "contact_boss",
+    ("zones_boss", "joueur"): "contact_boss",
+    ("attaques", "ennemis"): "attaque",
+    ("attaques", "mobs"): "attaque",
+    ("attaques", "boss"): "attaque",
+    ("balles", "ennemis"): "balle",
+    ("balles", "mobs"): "balle",
+    ("balles", "boss"): "balle",
+    ("mobs", "joueur"): "contact_mob",
+    ("ennemis", "joueur"): "contact_ennemi",
+    ("projectiles", "joueur"): "projectile",
+    ("tirs_ennemis", "joueur"): "tir",
+}
+
+
+class GroupeSprites:
+    """ petite liste de sprites : boites calculees une fois, a la creation (une fois par tick) """
+
+    def __init__(self, sprites):
+        self._boites = []
+        for sprite in sprites:
+            points = polygone_sprite(sprite)
+            xs = [p[0] for p in points]
+            ys = [p[1] for p in points]
+            self._boites.append((sprite, min(xs), min(ys), max(xs), max(ys)))
+
+    def __len__(self):
+        return len(self._boites)
+
+    def boites(self):
+        return self._boites
+
+    def proches(self, gauche, bas, droite, haut):
+        return [s for s, g, b, d, h in self._boites
+                if g <= droite and d >= gauche and b <= haut and h >= bas]
+
+    def placer(self, sprite):
+        pass # sprites deja a leur place
+
+
+class Collisions:
+    """ detection (un test par paire de sprites et par tick) puis application des coups """
+
+    def __init__(self):
+        self.coups = []      # (regle, source, cible) du tick
+        self.tests = 0       # tests exacts du dernier tick, pour le menu F3
+        self.candidats = 0   # paires sorties de la broadphase
+        self.nb_coups = 0
+
+    # phase collisions
+
+    def detecter(self, groupes):
+        """ groupes : nom -> groupe (boites(), proches(g, b, d, h), placer(sprite), len)
+        proches() rend des sprites a leur place, ceux de boites() ne sont places
+        (placer) qu'au moment d'un test exact """
+        self.coups = []
+        self.tests = 0
+        self.candidats = 0
+        resultats = {}   # (id, id) -> touche, pour ne tester une paire qu'une fois
+        for (nom_source, nom_cible), regle in MATRICE.items():
+            sources = groupes.get(nom_source)
+            cibles = groupes.get(nom_cible)
+            if not sources or not cibles:
+                continue
+            inverse = len(cibles) < len(sources)
+            interrogeant, interroge = (cibles, sources) if inverse else (sources, cibles)
+            for sprite, g, b, d, h in interrogeant.boites():
+                place = False
+                for autre in interroge.proches(g, b, d, h):
+                    if autre is sprite:
+                        continue
+                    self.candidats += 1
+                    cle = (id(sprite), id(autre)) if id(sprite) < id(autre) else (id(autre), id(sprite))
+                    touche = resultats.get(cle)
+                    if touche is None:
+                        if not place:
+                            interrogeant.placer(sprite)
+                            place = True
+                        touche = resultats[cle] = arcade.check_for_collision(sprite, autre)
+                        self.tests += 1
+                    if touche:
+                        self.coups.append((regle, autre, sprite) if inverse else (regle, sprite, autre))
+        self.nb_coups = len(self.coups)
+
+    # phase degats
+
+    def resoudre(self, joueur, tiroirs):
+        """ applique les coups trouves par detecter (ni les sprites retires entre-temps,
+        ni deux fois la meme paire) """
+        self.joueur = joueur
+        self.tiroirs = tiroirs
+        self.retires = set()
+        balles = []
+        for regle, source, cible in self.coups:
+            if id(source) in self.retires or id(cible) in self.retires:
+                continue
+            if regle == "balle":
+                balles.append(source)
+            getattr(self, "_" + regle)(source, cible)
+        # la balle disparait apres l'impact (sur toutes ses cibles du tick)
+        for balle in balles:
+            balle.remove_from_sprite_lists()
+        self.coups = []
+
+    def _retirer(self, sprite):
+        self.retires.add(id(sprite))
+        sprite.remove_from_sprite_lists()
+
+    def _mort(self, ennemi, multiplicateur):
+        """ butin et remplacants (au_deces) d'un ennemi a 0 pv """
+        joueur = self.joueur
+        if getattr(ennemi, "vie", 0) > 0:
+            return
+        # boss dvd : 10 pieces a la mort
+        if isinstance(ennemi, BossDVD):
+            joueur.monnaie += 10 * multiplicateur
+            self._retirer(ennemi)
+            return
+        if hasattr(ennemi, "drop_death"): joueur.monnaie += (ennemi.drop_death * multiplicateur)
+        elif not hasattr(ennemi, "invul_timer"): joueur.monnaie += (2 * multiplicateur)
+
+        if hasattr(ennemi, "au_deces"):
+            nouveaux = ennemi.au_deces()
+            if nouveaux:
+                for n in nouveaux:
+                    if "boss" in self.tiroirs: self.tiroirs["boss"].append(n)
+                    else: self.tiroirs["ennemis"].append(n)
+        joueur.monnaie += 5
+        self._retirer(ennemi)
+
+    # regles : (source, cible)
+
+    def _attaque(self, attaque, ennemi):
+        # une attaque ne touche chaque ennemi qu'une fois
+        if ennemi in attaque.deja_touche:
+            return
+        joueur = self.joueur
+        multiplicateur = 2 if "argentx2.png" in joueur.inventaire_charmes else 1
+
+        # boss dvd : 30 pieces au touche, sans invulnerabilite
+        if isinstance(ennemi, BossDVD):
+            joueur.monnaie += 30 * multiplicateur
+            ennemi.vie -= 1
+            attaque.deja_touche.add(ennemi)
+            self._mort(ennemi, multiplicateur)
+            return
+
+        # invulnerabilite du mob s'il en a une
+        if hasattr(ennemi, "invul_timer"):
+            if ennemi.invul_timer <= 0:
+                if hasattr(ennemi, "vie"): ennemi.vie -= 1
+                elif hasattr(ennemi, "points_de_vie"): ennemi.points_de_vie -= 1
+
+                gains = getattr(ennemi, "drop_hit", 1)
+                joueur.monnaie += (gains * multiplicateur)
+                ennemi.invul_timer = getattr(ennemi, "temps_invul", 0.5)
+                attaque.deja_touche.add(ennemi)
+        else:
+            if hasattr(ennemi, "vie"): ennemi.vie -= 1
+            elif hasattr(ennemi, "points_de_vie"): ennemi.points_de_vie -= 1
+
+            joueur.monnaie += (1 * multiplicateur)
+            attaque.deja_touche.add(ennemi)
+
+        self._mort(ennemi, multiplicateur)
+
+    def _balle(self, balle, cible):
+        if hasattr(cible, "vie"):
+            cible.vie -= balle.degats
+            self._mort(cible, 2 if "argentx2.png" in self.joueur.inventaire_charmes else 1)
+
+    def _contact_boss(self, boss, joueur):
+        # chaque boss (ou zone d'attaque) a ses propres degats de contact, s'il en a
+        toucher = getattr(boss, "toucher_joueur", None)
+        if toucher is not None:
+            toucher()
+
+    def _contact_mob(self, mob, joueur):
+        if isinstance(mob, MobSol):
+            joueur.vie -= mob.degats
+        # premier contact : 10 pv, recul, le mob sol est detruit
+        if getattr(mob, "touche_joueur", 0) == 0:
+            joueur.vie -= 10
+            mob.touche_joueur = 1
+            mob.timer_touche_joueur = 1.0 # delai de 1s avant prochaine attaque mob
+
+            direction = 1 if joueur.center_x > mob.center_x else -1
+            joueur.center_x += direction * 50
+
+            if isinstance(mob, MobSol):
+                self._retirer(mob)
+
+    def _contact_ennemi(self, ennemi, joueur):
+        if getattr(ennemi, "degats_contact", 0) > 0 and joueur.invul_timer <= 0:
+            joueur.vie -= ennemi.degats_contact
+            joueur.invul_timer = 1.0
+
+    def _projectile(self, sprite, joueur):
+        # degats a chaque contact, ou invulnerabilite selon le type (voir projectiles.py)
+        invul = sprite.pool.type["invul"]
+        if invul is None:
+            joueur.vie -= sprite.degats
+        elif joueur.invul_timer <= 0:
+            joueur.vie -= sprite.degats
+            joueur.invul_timer = invul
+        self._retirer(sprite)
+
+    def _tir(self, tir, joueur):
+        if joueur.invul_timer <= 0:
+            joueur.vie -= tir.degats
+            joueur.invul_timer = 1.0 # 1 seconde de pause avant prochain coup
+        self._retirer(tir)
+
+    def rapport(self):
+        """ ligne pour l'affichage de debug """
+        return f"collisions : {self.candidats} candidats, {self.tests} tests, {self.nb_coups} coups"
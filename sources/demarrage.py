@@ -0,0 +1,133 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# mesure du temps de demarrage
+# active avec la variable d'environnement FLOIOIDE_TRACE=1 : chaque morceau
+# mesure (imports, fenetre, constructeurs des vues, chargement des images et des
+# sons, etapes du chargement) est note avec sa duree, imbrique dans le morceau
+# en cours, et un rapport est affiche a la premiere image puis a la fin de
+# chaque ecran de chargement
+# les mesures repetees (une par image chargee...) sont additionnees sur une ligne
+# python demarrage.py : demarre le jeu sans fenetre visible jusqu'a la premiere
+# image, affiche le rapport et sort en erreur si BUDGET_DEMARRAGE est depasse
+
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+
+ACTIF = os.environ.get("FLOIOIDE_TRACE", "") not in ("", "0")
+
+_debut = time.perf_counter()
+_local = threading.local()
+_verrou = threading.Lock()
+_mesures = {}   # (thread, noms imbriques...) -> [nombre, duree]
+_premiere_image = []
+
+
+def _pile():
+    pile = getattr(_local, "pile", None)
+    if pile is None:
+        nom = threading.current_thread().name
+        pile = _local.pile = [] if nom == "MainThread" else ["(" + nom.split("_")[0] + ")"]
+    return pile
+
+
+def noter(nom, duree):
+    """ ajoute une duree (secondes) sous le morceau en cours """
+    if not ACTIF:
+        return
+    cle = tuple(_pile() + [nom])
+    with _verrou:
+        m = _mesures.setdefault(cle, [0, 0.0])
+        m[0] += 1
+        m[1] += duree
+
+
+@contextmanager
+def mesurer(nom):
+    """ with mesurer("nom") : mesure le bloc (les mesures dedans sont rangees dessous) """
+    if not ACTIF:
+        yield
+        return
+    pile = _pile()
+    with _verrou:
+        # place reservee avant les mesures du bloc : le rapport suit l'ordre de depart
+        _mesures.setdefault(tuple(pile + [nom]), [0, 0.0])
+    debut = time.perf_counter()
+    pile.append(nom)
+    try:
+        yield
+    finally:
+        pile.pop()
+        noter(nom, time.perf_counter() - debut)
+
+
+def mesure(cls):
+    """ decorateur de classe : mesure le constructeur sous le nom de la classe """
+    init = cls.__init__
+
+    def __init__(self, *args, **kwargs):
+        with mesurer(cls.__name__):
+            init(self, *args, **kwargs)
+
+    cls.__init__ = __init__
+    return cls
+
+
+def rapport(titre, seuil=0.001):
+    """ affiche les mesures depuis le dernier rapport (plus longues que seuil) puis les oublie """
+    if not ACTIF:
+        return
+    with _verrou:
+        mesures = dict(_mesures)
+        _mesures.clear()
+    print(f"--- {titre} ---")
+    affiches = set()
+    for cle, (nombre, duree) in mesures.items():
+        if duree < seuil:
+            continue
+        # parents sans mesure propre (thread de chargement) ou deja oublies
+        for i in range(1, len(cle)):
+            if cle[:i] not in affiches and cle[:i] not in mesures:
+                print(f"{'  ' * (i - 1)}{cle[i - 1]}")
+            affiches.add(cle[:i])
+        affiches.add(cle)
+        fois = f" x{nombre}" if nombre > 1 else ""
+        print(f"{'  ' * (len(cle) - 1)}{cle[-1]}{fois} : {duree * 1000:.0f} ms")
+
+
+def premiere_image():
+    """ a appeler quand le premier ecran est dessine : note le temps depuis le
+    lancement du programme (une seule fois) et affiche le rapport, renvoie ce temps """
+    if _premiere_image:
+        return _premiere_image[0]
+    total = time.perf_counter() - _debut
+    _premiere_image.append(total)
+    if ACTIF:
+        from constantes import BUDGET_DEMARRAGE
+        rapport("demarrage")
+        depasse = "  (budget depasse !)" if total > BUDGET_DEMARRAGE else ""
+        print(f"premiere image : {total * 1000:.0f} ms / budget {BUDGET_DEMARRAGE * 1000:.0f} ms{depasse}")
+    return total
+
+
+def verifier():
+    """ demarre le jeu jusqu'a la premiere image, 1 si le budget est depasse """
+    global ACTIF
+    ACTIF = True
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import main
+    from constantes import BUDGET_DEMARRAGE
+    fenetre = main.demarrer()
+    fenetre.current_view.on_draw()
+    fenetre.flip()
+    return 1 if premiere_image() > BUDGET_DEMARRAGE else 0
+
+
+if __name__ == "__main__":
+    # le module importe par main.py, pour que les mesures arrivent au meme endroit
+    import demarrage
+    sys.exit(demarrage.verifier())
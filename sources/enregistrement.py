@@ -0,0 +1,251 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# enregistrement d'une partie et rejeu a l'identique
+# - le monde ne depend que de ses ticks (voir pas_fixe.py), du hasard et des
+#   evenements clavier / souris recus par MonJeu : on note la graine de random
+#   (appliquee au premier tick) et chaque evenement avec le numero du tick qu'il
+#   precede ; au rejeu ils sont renvoyes a MonJeu juste avant ce tick, quelle
+#   que soit la duree des frames
+# - les mouvements de souris d'un meme tick ne comptent que par le dernier
+#   (ils ne font que placer la souris), un seul est garde
+# - l'etat des touches (InputHandler) est note a chaque changement, et l'etat du
+#   joueur tous les CONTROLE_REJEU ticks : le rejeu les compare et signale le
+#   premier tick ou la partie s'ecarte de l'enregistrement
+# - fichier json compresse (gzip)
+#
+# FLOIOIDE_ENREGISTRER=partie.json.gz python sources/main.py : joue et enregistre
+# python sources/enregistrement.py partie.json.gz : rejeu sans fenetre
+# python sources/enregistrement.py partie.json.gz --fenetre : rejeu a l'ecran
+
+import os
+import sys
+import gzip
+import json
+import time
+import random
+import atexit
+import functools
+from constantes import CONTROLE_REJEU
+
+VERSION = 1
+
+# evenements rejouables, numerotes dans le fichier
+EVENEMENTS = ["on_key_press", "on_key_release", "on_mouse_press", "on_mouse_motion", "on_mouse_scroll", "on_text"]
+NUMEROS = {nom: i for i, nom in enumerate(EVENEMENTS)}
+MOUVEMENT = NUMEROS["on_mouse_motion"]
+
+# un seul enregistreur vivant : celui de la derniere partie lancee, sauve a la sortie
+_actif = {"enregistreur": None}
+
+
+def _sauver_actif():
+    if _actif["enregistreur"] is not None:
+        _actif["enregistreur"].sauver()
+
+
+atexit.register(_sauver_actif)
+
+
+def entree(methode):
+    """ a mettre sur les evenements clavier / souris de MonJeu : notes pendant un
+    enregistrement, ignores pendant un rejeu (seul le rejeu les envoie) """
+    numero = NUMEROS[methode.__name__]
+
+    @functools.wraps(methode)
+    def recevoir(jeu, *args, rejeu=False):
+        entrees = jeu.entrees
+        if entrees is not None and not rejeu:
+            if entrees.rejoue:
+                return
+            entrees.noter(numero, args)
+        return methode(jeu, *args)
+    return recevoir
+
+
+def touches(inputs):
+    """ etat d'InputHandler en un entier (un bit par touche) """
+    return inputs.gauche | inputs.droite << 1 | inputs.haut << 2 | inputs.bas << 3 | inputs.shift << 4
+
+
+def releve(jeu):
+    """ etat du joueur compare au rejeu """
+    fleur = jeu.fleur
+    return [round(fleur.center_x, 3), round(fleur.center_y, 3), round(fleur.vie, 3), fleur.monnaie]
+
+
+class Enregistreur:
+    """ note les entrees d'une partie, ecrites dans chemin a la sortie du jeu
+    (une nouvelle partie remplace la precedente, qui n'est plus sauvee) """
+    rejoue = False
+
+    def __init__(self, chemin, mode_dev=False, graine=None):
+        self.chemin = chemin
+        self.mode_dev = mode_dev
+        self.graine = random.randrange(2 ** 32) if graine is None else graine
+        self.tick = 0
+        self.evenements = []   # [tick, numero, arguments...]
+        self.touches = []      # [tick, etat] a chaque changement
+        self.controles = []    # [tick, releve...]
+        _actif["enregistreur"] = self
+
+    def noter(self, numero, args):
+        dernier = self.evenements[-1] if self.evenements else None
+        if numero == MOUVEMENT and dernier is not None and dernier[0] == self.tick and dernier[1] == MOUVEMENT:
+            self.evenements.pop()
+        self.evenements.append([self.tick, numero, *args])
+
+    def frame(self, jeu, delta_time):
+        pass
+
+    def avant_tick(self, jeu):
+        pass
+
+    def debut_tick(self, jeu):
+        """ au debut de chaque tick simule """
+        if self.tick == 0:
+            random.seed(self.graine)
+        etat = touches(jeu.inputs)
+        if not self.touches or self.touches[-1][1] != etat:
+            self.touches.append([self.tick, etat])
+        if self.tick % CONTROLE_REJEU == 0:
+            self.controles.append([self.tick] + releve(jeu))
+        self.tick += 1
+
+    def sauver(self):
+        donnees = {
+            "version": VERSION, "graine": self.graine, "mode_dev": self.mode_dev, "ticks": self.tick,
+            "evenements": self.evenements, "touches": self.touches, "controles": self.controles,
+        }
+        with gzip.open(self.chemin, "wt", encoding="utf-8") as f:
+            json.dump(donnees, f, separators=(",", ":"))
+
+
+class Rejoueur:
+    """ renvoie a MonJeu les entrees d'un enregistrement, tick par tick """
+    rejoue = True
+
+    def __init__(self, chemin):
+        with gzip.open(chemin, "rt", encoding="utf-8") as f:
+            donnees = json.load(f)
+        if donnees["version"] != VERSION:
+            raise ValueError(f"{chemin} : enregistrement version {donnees['version']}, attendu {VERSION}")
+        self.graine = donnees["graine"]
+        self.mode_dev = donnees["mode_dev"]
+        self.ticks = donnees["ticks"]
+        self.evenements = donnees["evenements"]
+        self.touches = dict(donnees["touches"])
+        self.controles = {c[0]: c[1:] for c in donnees["controles"]}
+        self.tick = 0
+        self.suivant = 0        # prochain evenement a envoyer
+        self.quitte = False     # partie quittee pour le menu pendant le rejeu
+        self.ecart = None       # (tick, ce qui differe) au premier ecart
+        self.etat_touches = 0
+        self.frames = []        # duree des frames, rejeu a l'ecran
+
+    @property
+    def fini(self):
+        return self.quitte or (self.tick >= self.ticks and self.suivant >= len(self.evenements))
+
+    def noter(self, numero, args):
+        pass
+
+    def frame(self, jeu, delta_time):
+        """ a chaque frame du rejeu a l'ecran (meme en pause, pour y envoyer les evenements) """
+        self.frames.append(delta_time)
+        self.avant_tick(jeu)
+
+    def avant_tick(self, jeu):
+        """ envoie les evenements notes avant le tick en cours """
+        evenements = self.evenements
+        while self.suivant < len(evenements) and evenements[self.suivant][0] <= self.tick:
+            _, numero, *args = evenements[self.suivant]
+            self.suivant += 1
+            getattr(jeu, EVENEMENTS[numero])(*args, rejeu=True)
+            if jeu.window.current_view is not jeu:
+                # partie quittee (menu) : le reste de l'enregistrement n'est plus a cette vue
+                self.quitte = True
+                return
+
+    def debut_tick(self, jeu):
+        """ au debut de chaque tick simule : graine puis comparaison a l'enregistrement """
+        if self.tick == 0:
+            random.seed(self.graine)
+        self.etat_touches = self.touches.get(self.tick, self.etat_touches)
+        if self.ecart is None:
+            if touches(jeu.inputs) != self.etat_touches:
+                self.ecart = (self.tick, "touches")
+            elif self.tick in self.controles and releve(jeu) != self.controles[self.tick]:
+                self.ecart = (self.tick, f"joueur {releve(jeu)} au lieu de {self.controles[self.tick]}")
+        self.tick += 1
+
+    def rapport(self):
+        """ lignes pour la fin du rejeu """
+        lignes = [f"{self.tick} ticks rejoues sur {self.ticks}, {self.suivant} evenements sur {len(self.evenements)}"]
+        if self.ecart is None:
+            lignes.append("partie identique a l'enregistrement")
+        else:
+            lignes.append(f"ecart au tick {self.ecart[0]} : {self.ecart[1]}")
+        if self.frames:
+            frames = sorted(self.frames)
+            moyenne = sum(frames) / len(frames)
+            pire = frames[min(len(frames) - 1, int(len(frames) * 0.99))]
+            lignes.append(f"{len(frames)} frames : {moyenne * 1000:.2f} ms en moyenne, {pire * 1000:.2f} ms au 99e centile")
+        return lignes
+
+
+def depuis_environnement(mode_dev):
+    """ Enregistreur si FLOIOIDE_ENREGISTRER donne un fichier, sinon None """
+    chemin = os.environ.get("FLOIOIDE_ENREGISTRER", "")
+    return Enregistreur(chemin, mode_dev) if chemin else None
+
+
+def rejouer_sans_fenetre(rejoueur):
+    # imports ici : main importe ce module
+    from simulation import Simulation
+    debut = time.perf_counter()
+    simulation = Simulation(rejoueur.mode_dev, entrees=rejoueur)
+    chargement = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    while rejoueur.tick < rejoueur.ticks and not rejoueur.quitte:
+        if simulation.avancer(rejoueur.ticks - rejoueur.tick) == 0:
+            break # plus de tick possible (pause, mort, fin du jeu) : la partie s'est ecartee
+    if not rejoueur.quitte:
+        rejoueur.avant_tick(simulation.jeu) # evenements apres le dernier tick
+    duree = time.perf_counter() - debut
+
+    print(f"chargement : {chargement:.2f} s")
+    print(f"{rejoueur.tick} ticks en {duree:.2f} s : {rejoueur.tick / max(duree, 1e-9):.0f} ticks/s")
+    print("\n".join(simulation.jeu.planificateur.rapport()))
+
+
+def rejouer_fenetre(rejoueur):
+    import arcade
+    import main
+    fenetre = arcade.Window(main.LARGEUR, main.HAUTEUR, main.TITRE)
+    fenetre.show_view(main.EcranChargementView(functools.partial(main.MonJeu, rejoueur.mode_dev, entrees=rejoueur)))
+
+    def verifier(delta_time):
+        if rejoueur.fini:
+            arcade.exit()
+    arcade.schedule(verifier, 0.25)
+    arcade.run()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("python enregistrement.py partie.json.gz [--fenetre]")
+        sys.exit(1)
+    rejoueur = Rejoueur(sys.argv[1])
+    if "--fenetre" in sys.argv[2:]:
+        rejouer_fenetre(rejoueur)
+    else:
+        rejouer_sans_fenetre(rejoueur)
+    print("\n".join(rejoueur.rapport()))
+    if rejoueur.ecart is not None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
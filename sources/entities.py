@@ -6,8 +6,11 @@ import math
 import random 
 import os
 import arcade
-from constantes import DOSSIER_BOSS, LARGEUR, HAUTEUR, VITESSE_MARCHE, VITESSE_DASH, VITESSE_SAUT, VITESSE_TIR, DISTANCE_MAX_TIR, DOSSIER_DATA, TAILLE_TUILE, VITESSE_MOB, GRAVITE
+from constantes import DOSSIER_BOSS, LARGEUR, HAUTEUR, VITESSE_MARCHE, VITESSE_DASH, VITESSE_SAUT, VITESSE_TIR, DISTANCE_MAX_TIR, DOSSIER_DATA, TAILLE_TUILE, GRAVITE, GRAVITE_ENNEMIS, PASSES_PAR_TICK
 from arcade.hitbox import HitBox
+import ressources
+from mobs import ChampMob
+from reserves import Recyclable
 
 
 class EntiteAnimee(arcade.Sprite):
@@ -34,6 +37,48 @@ class Joueur(EntiteAnimee):
     def __init__(self, x, y):
         self.flip_left_right = False
 
+        # initialisation avec scale 0 1
+        super().__init__(x, y, scale=0.1)
+        
+        self.texture = ressources.texture("joueur")
+
+        # 1 textures base (registre partage, voir ressources)
+        self.tex_idle = ressources.texture("joueur")
+        self.tex_saut = ressources.texture("joueur_saut")
+        self.tex_dash = ressources.texture("joueur_dash")
+        
+        # animations marche (1 a 4), grimper (1 a 3), attaque (1 a 12)
+        self.anims_marche = ressources.animation("joueur_marche")
+        self.anims_grimper = ressources.animation("joueur_grimper")
+        self.textures_attaque = ressources.animation("attaque")
+
+        # chaque etat dans les deux sens, index par face_gauche (miroirs calcules une fois)
+        self.sens = {
+            "DASH": ressources.deux_sens("joueur_dash"),
+            "ATTAQUE": ressources.deux_sens("attaque"),
+            "GRIMPER": ressources.deux_sens("joueur_grimper"),
+            "SAUT": ressources.deux_sens("joueur_saut"),
+            "MARCHE": ressources.deux_sens("joueur_marche"),
+            "IDLE": ressources.deux_sens("joueur"),
+        }
+
+        # 3 hitbox fixe obligatoire pour arcade 3 0
+        self.hit_box_algorithm = None
+        t = 45 
+        self.hit_box_perso = HitBox([(-t, -t), (t, -t), (t, t), (-t, t)])
+
+        self.reinitialiser(x, y)
+
+    def reinitialiser(self, x, y):
+        """ remet le joueur au depart (stats inventaire etats) sans recharger les images """
+        self.position = (x, y)
+        self.change_x = 0
+        self.change_y = 0
+        self.alpha = 255
+        self.frame_actuelle = 0
+        self.temps_ecoule = 0
+        self.etat = "IDLE"
+        self.texture = self.tex_idle
 
         # systeme inventaire (4 cases)
         # 3 cases pour consommable/armes (dictionnaire)
@@ -47,38 +92,6 @@ class Joueur(EntiteAnimee):
         self.etat_suppression = False # confirmation abandon item
         self.index_inventaire = 0
 
-        # initialisation avec scale 0 1
-        super().__init__(x, y, scale=0.1)
-        
-        chemin = os.path.join(DOSSIER_DATA, "player", "player.png")
-        self.texture = arcade.load_texture(chemin)
-
-        # dossiers images
-        doss_p = os.path.join(DOSSIER_DATA, "player")
-        doss_m = os.path.join(doss_p, "mouvements")
-        
-        # 1 chargement textures base
-        self.tex_idle = arcade.load_texture(os.path.join(doss_p, "player.png"))
-        self.tex_saut = arcade.load_texture(os.path.join(doss_m, "saut.png"))
-        self.tex_dash = arcade.load_texture(os.path.join(doss_m, "Dash.png"))
-        
-        # animations marche (1 a 4)
-        self.anims_marche = []
-        for i in range(1, 5):
-            self.anims_marche.append(arcade.load_texture(os.path.join(doss_m, f"avancer ({i}).png")))
-            
-        # animations grimper (1 a 3)
-        self.anims_grimper = []
-        for i in range(1, 4):
-            self.anims_grimper.append(arcade.load_texture(os.path.join(doss_m, f"grimper ({i}).png")))
-
-        # animations attaque (1 a 12)
-        self.textures_attaque = []
-        for i in range(1, 13):
-            self.textures_attaque.append(arcade.load_texture(os.path.join(doss_p, "attaque", f"attaque{i}.png")))
-
-        
-        
         # 2 variables statistiques
 
         self.vie = 100
@@ -110,10 +123,6 @@ class Joueur(EntiteAnimee):
         self.puissance_saut = VITESSE_SAUT
         self.noclip = False
 
-        # 3 hitbox fixe obligatoire pour arcade 3 0
-        self.hit_box_algorithm = None
-        t = 45 
-        self.hit_box_perso = HitBox([(-t, -t), (t, -t), (t, t), (-t, t)])
         self.hit_box = self.hit_box_perso
 
         self.dash_cooldown = 0.0  # pour fleur (5 0 a 0)
@@ -146,26 +155,26 @@ class Joueur(EntiteAnimee):
         # 3 selection liste images (priorites)
         if self.en_dash:
             self.etat = "DASH"
-            textures_a_voir = [self.tex_dash]
+            textures_a_voir = self.sens["DASH"][self.face_gauche]
             vit = 0.1
         elif self.etat == "ATTAQUE":
             # attaque reste tant que animation pas finie
-            textures_a_voir = self.textures_attaque
+            textures_a_voir = self.sens["ATTAQUE"][self.face_gauche]
             vit = 0.05
         elif self.en_escalade:
-            textures_a_voir = self.anims_grimper
+            textures_a_voir = self.sens["GRIMPER"][self.face_gauche]
             vit = self.vitesse_animation
         elif abs(self.change_y) > 0.1: 
             self.etat = "SAUT"
-            textures_a_voir = [self.tex_saut]
+            textures_a_voir = self.sens["SAUT"][self.face_gauche]
             vit = 0.1
         elif abs(self.change_x) > 0.1:
             self.etat = "MARCHE"
-            textures_a_voir = self.anims_marche
+            textures_a_voir = self.sens["MARCHE"][self.face_gauche]
             vit = self.vitesse_animation
         else:
             self.etat = "IDLE"
-            textures_a_voir = [self.tex_idle]
+            textures_a_voir = self.sens["IDLE"][self.face_gauche]
             vit = self.vitesse_animation
 
         # 4 gestion timer animation
@@ -186,15 +195,9 @@ class Joueur(EntiteAnimee):
                 if self.etat == "ATTAQUE":
                     self.etat = "IDLE"
 
-        # 5 application finale texture et miroir
-        # recuperation image actuelle dans liste
-        base = textures_a_voir[self.frame_actuelle]
-        
-        # application miroir a chaque frame
-        if self.face_gauche:
-            self.texture = base.flip_left_right()
-        else:
-            self.texture = base
+        # 5 application finale texture
+        # liste deja dans le bon sens (pas de miroir a chaque frame)
+        self.texture = textures_a_voir[self.frame_actuelle]
 
         # securite hitbox
         self.hit_box = self.hit_box_perso
@@ -224,13 +227,13 @@ class Boss(EntiteAnimee):
         
         d = os.path.join(DOSSIER_DATA, "boss", "test")
         
-        if os.path.exists(d):
-            fichiers = sorted(os.listdir(d))
-            for f in fichiers:
-                if f.startswith("attaque") and f.endswith(".png"):
-                    self.textures_attaque.append(arcade.load_texture(os.path.join(d, f)))
-                elif f.startswith("pause") and f.endswith(".png"):
-                    self.textures_pause.append(arcade.load_texture(os.path.join(d, f)))
+        # frames du dossier dans l'ordre (manifeste des pages d'atlas ou disque)
+        for chemin, _ in ressources.frames(d):
+            f = os.path.basename(chemin)
+            if f.startswith("attaque"):
+                self.textures_attaque.append(ressources.charger(chemin))
+            elif f.startswith("pause"):
+                self.textures_pause.append(ressources.charger(chemin))
 
         self.etat = "ATTAQUE"
         self.vitesse_animation = 0.12
@@ -281,23 +284,6 @@ class Boss(EntiteAnimee):
     def logique_ia(self, joueur):
         pass
 
-class ProjectileEnnemi(arcade.Sprite):
-    def __init__(self, x, y, cible_x, cible_y, degats=1):
-        super().__init__(os.path.join(DOSSIER_DATA, "mobs", "projectile.png"), 0.5) # ajuster chemin
-        self.center_x = x
-        self.center_y = y
-        self.degats = degats
-        
-        # calcul trajectoire
-        angle = math.atan2(cible_y - y, cible_x - x)
-        self.change_x = math.cos(angle) * 5
-        self.change_y = math.sin(angle) * 5
-        self.angle = math.degrees(angle)
-
-    def update(self, delta_time=1/60): 
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-
 class Ennemi(EntiteAnimee):
     def __init__(self, x, y, dossier, nb_anim=4):
         super().__init__(x, y, scale=0.5)
@@ -306,8 +292,8 @@ class Ennemi(EntiteAnimee):
         self.textures_marche = []
         for i in range(1, nb_anim + 1):
             chemin = os.path.join(DOSSIER_DATA, "mobs", dossier, f"mob{i}.png")
-            if os.path.exists(chemin):
-                self.textures_marche.append(arcade.load_texture(chemin))
+            if ressources.existe(chemin):
+                self.textures_marche.append(ressources.charger(chemin))
         
         if self.textures_marche:
             self.texture = self.textures_marche[0]
@@ -322,7 +308,7 @@ class Ennemi(EntiteAnimee):
         self.change_x = self.vitesse * self.direction
         
         # inverse direction si touche mur
-        if arcade.check_for_collision_with_list(self, liste_murs):
+        if liste_murs.touche(self):
             self.direction *= -1
             self.center_x += self.direction * 5
 
@@ -355,12 +341,11 @@ class Ennemi(EntiteAnimee):
 class PNJ(arcade.Sprite):
     def __init__(self, x, y, nom="pnj"):
         super().__init__(center_x=x, center_y=y, scale=0.5)
-        chemin_pnj = os.path.join(DOSSIER_DATA, "mobs", "PNJ")
         self.est_marchand = True
         # securite si images n existent pas
         try:
-            self.tex1 = arcade.load_texture(os.path.join(chemin_pnj, "PNJ1.png"))
-            self.tex2 = arcade.load_texture(os.path.join(chemin_pnj, "PNJ2.png"))
+            self.tex1 = ressources.texture("pnj_1")
+            self.tex2 = ressources.texture("pnj_2")
         except:
             self.tex1 = arcade.make_soft_square_texture(50, arcade.color.BLUE)
             self.tex2 = arcade.make_soft_square_texture(50, arcade.color.LIGHT_BLUE)
@@ -407,10 +392,13 @@ class PNJ(arcade.Sprite):
                 border_width=3
             )
 
-class EffetAttaque(arcade.Sprite):
-    def __init__(self, joueur, dossier):
+class EffetAttaque(Recyclable, arcade.Sprite):
+    def __init__(self, joueur, animation="attaque"):
         super().__init__(scale=0.4)
-        
+        self.reinitialiser(joueur, animation)
+
+    def reinitialiser(self, joueur, animation="attaque"):
+        """ remise a neuf a chaque coup (reserve) """
         self.direction = -1 if joueur.face_gauche else 1
 
         self.center_x = joueur.center_x + (self.direction * 50)
@@ -423,21 +411,16 @@ class EffetAttaque(arcade.Sprite):
         # decaler effet devant joueur
         self.center_x += self.direction * 40
 
-        # chargement textures
-        self.textures = []
-        for i in range(1, 13):
-            chemin = os.path.join(dossier, f"attaque{i}.png")
-            tex = arcade.load_texture(chemin)
-            # si joueur retourne retourner effet
-            if self.direction == -1:
-                self.textures.append(tex.flip_left_right())
-            else:
-                self.textures.append(tex)
+        # textures du registre (chargees une fois)
+        # si joueur retourne effet retourne (miroir deja calcule)
+        self.textures = ressources.animation(animation, miroir=self.direction == -1)
         
         self.texture = self.textures[0]
+        self.sync_hit_box_to_texture() # hit box du sens du coup
         self.frame = 0
         self.timer = 0
         self.vitesse_frame = 0.03 # vitesse animation
+        self.deja_touche = set() # ennemis deja touches par ce coup (degats.py)
 
     def update_animation(self, delta_time=1/60):
         self.timer += delta_time
@@ -449,33 +432,9 @@ class EffetAttaque(arcade.Sprite):
             else:
                 self.remove_from_sprite_lists() # fin attaque
 
-class ProjectileEnnemi(arcade.Sprite):
-    def __init__(self, x, y, joueur, degats=1, vitesse=5, image="foret/air/boule_bleue.png"):
-        # construire chemin vers image
-        chemin_image = os.path.join(DOSSIER_DATA, "mobs", image)
-        super().__init__(chemin_image, scale=0.4)
-        
-        self.center_x = x
-        self.center_y = y
-        self.degats = degats
-        
-        # calcul angle vers joueur
-        diff_x = joueur.center_x - x
-        diff_y = joueur.center_y - y
-        angle = math.atan2(diff_y, diff_x)
-        
-        # application vitesse
-        self.change_x = math.cos(angle) * vitesse
-        self.change_y = math.sin(angle) * vitesse
-
-    def update(self, delta_time: float = 1/60):
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        # supprimer si hors ecran
-
 class EntiteBoss(arcade.Sprite):
     def __init__(self, x, y, image, scale=1.0):
-        super().__init__(image, scale)
+        super().__init__(ressources.charger(image) if isinstance(image, str) else image, scale)
         self.center_x = x
         self.center_y = y
         self.vie =1
@@ -524,7 +483,7 @@ class EntiteBoss(arcade.Sprite):
         self.timer_attaque = 0
         self.invul_timer = 0
 
-        collisions_y = arcade.check_for_collision_with_list(self, murs)
+        collisions_y = murs.collisions(self)
         for mur in collisions_y:
             if self.change_y > 0:
                 self.top = mur.bottom
@@ -533,7 +492,7 @@ class EntiteBoss(arcade.Sprite):
             self.change_y = 0
 
         self.center_x += self.change_x
-        collisions_x = arcade.check_for_collision_with_list(self, murs)
+        collisions_x = murs.collisions(self)
         for mur in collisions_x:
             if self.change_x > 0:
                 self.right = mur.left
@@ -549,9 +508,9 @@ class EntiteBossTron(arcade.Sprite):
 
     def appliquer_physique(self, murs):
         # gravite
-        self.change_y -= GRAVITE
+        self.change_y -= GRAVITE_ENNEMIS
         self.center_y += self.change_y
-        hit_list = arcade.check_for_collision_with_list(self, murs)
+        hit_list = murs.collisions(self)
         for mur in hit_list:
             if self.change_y < 0:
                 self.bottom = mur.top
@@ -562,7 +521,7 @@ class EntiteBossTron(arcade.Sprite):
                 
         # mouvement x
         self.center_x += self.change_x
-        hit_list = arcade.check_for_collision_with_list(self, murs)
+        hit_list = murs.collisions(self)
         for mur in hit_list:
             if self.change_x > 0: self.right = mur.left
             elif self.change_x < 0: self.left = mur.right
@@ -597,77 +556,15 @@ class EntiteBossTron(arcade.Sprite):
             )
             arcade.draw_rect_filled(rect_vie, arcade.color.GREEN)
 
-    def update_boss(self, delta_time, liste_projectiles, murs):
+    def update_boss(self, delta_time, projectiles, murs):
         """ gerer temps de securite pour degats """
         if self.invul_timer > 0:
             self.invul_timer -= delta_time
 
-class ProjectileBoss(arcade.Sprite):
-    def __init__(self, x, y, joueur): # passer objet joueur entier
-        super().__init__(scale=1.2)
-        
-        self.joueur = joueur
-        self.timer_vie = 0
-        self.degats = 4 # points de vie enleves
-        
-        # chargement animation (1 a 5)
-        chemin = os.path.join(DOSSIER_DATA, "boss", "boss arbre")
-        self.textures_animation = []
-        for i in range(1, 6):
-            try:
-                tex = arcade.load_texture(os.path.join(chemin, f"Attaque.{i}.png"))
-                self.textures_animation.append(tex)
-            except Exception as e:
-                print(f"erreur chargement image {i} {e}")
-        
-        # definir texture de depart
-        if self.textures_animation:
-            self.texture = self.textures_animation[0]
-        self.cur_texture_index = 0
-        self.animation_speed = 0.1 # vitesse changement image
-
-        # position et direction
-        self.center_x = x
-        self.center_y = y
-
-        vitesse = 7
-        diff_x = joueur.center_x - x
-        diff_y = joueur.center_y - y
-        angle = math.atan2(diff_y, diff_x)
-        
-        self.change_x = math.cos(angle) * vitesse
-        self.change_y = math.sin(angle) * vitesse
-        self.angle = math.degrees(angle)
-
-    def update(self, delta_time: float):
-        super().update()
-        self.timer_vie += delta_time
-
-        # 1 animation changer image selon temps
-        if self.textures_animation:
-            self.cur_texture_index += self.animation_speed
-            if self.cur_texture_index >= len(self.textures_animation):
-                self.cur_texture_index = 0
-            self.texture = self.textures_animation[int(self.cur_texture_index)]
-
-        # 2 collision avec joueur
-        if arcade.check_for_collision(self, self.joueur):
-            # verifier si joueur pas invulnerable
-            if self.joueur.invul_timer <= 0:
-                self.joueur.vie -= self.degats
-                self.joueur.invul_timer = 1.0 # 1 seconde invulnerabilite
-                print(f"aie vie restants {self.joueur.vie}")
-            
-            self.remove_from_sprite_lists() # projectile disparait apres impact
-
-        # 3 suppression si trop vieux (hors ecran)
-        if self.timer_vie > 4.0:
-            self.remove_from_sprite_lists()
-
 class BossArbreP1(EntiteBossTron):
     def __init__(self, x, y, joueur):
         super().__init__(scale=1.7)
-        self.texture = arcade.load_texture(os.path.join(DOSSIER_DATA, "boss", "boss arbre", "P1.png"))
+        self.texture = ressources.texture("arbre_p1")
         self.center_x = x
         self.center_y = y
         self.joueur = joueur
@@ -676,21 +573,16 @@ class BossArbreP1(EntiteBossTron):
         self.timer_tir = 0.0
         self.timer_attaque = 0
     
-    def lancer_baton(self, liste_projectiles):
+    def lancer_baton(self, projectiles):
         """ 
         creer objet et envoyer vers joueur
         """
         # creer projectile aux coordonnees boss
-        baton = ProjectileBoss(
-            self.center_x, 
-            self.center_y, 
-            self.joueur
-        )
-        liste_projectiles.append(baton)
-
-    def update_boss(self, delta_time, liste_projectiles, murs):
+        projectiles.tirer("baton", self.center_x, self.center_y, self.joueur.center_x, self.joueur.center_y)
+
+    def update_boss(self, delta_time, projectiles, murs):
         # 1 appeler logique de base (timer et invul)
-        super().update_boss(delta_time, liste_projectiles, murs)
+        super().update_boss(delta_time, projectiles, murs)
         self.timer_attaque += delta_time
 
         if self.invul_timer > 0:
@@ -704,20 +596,7 @@ class BossArbreP1(EntiteBossTron):
         if self.timer_attaque >= 5.0:
             print("boss essaie de tirer") # print de test
             self.timer_attaque = 0
-            self.lancer_baton(liste_projectiles)
-
-        # 2 si timer au dessus de 5s tirer
-        if self.timer_attaque >= 5.0:
-            self.timer_attaque = 0
-            # creer baton coordonnees boss vers joueur
-            nouveau_baton = ProjectileBoss(
-                self.center_x, 
-                self.center_y, 
-                self.joueur.center_x, 
-                self.joueur.center_y
-            )
-            liste_projectiles.append(nouveau_baton)
-            self.timer_attaque += delta_time
+            self.lancer_baton(projectiles)
 
     def au_deces(self):
         # libere deux p2
@@ -728,9 +607,8 @@ class BossArbreP1(EntiteBossTron):
 class BossArbreP2(EntiteBossTron):
     def __init__(self, x, y, joueur):
         super().__init__(scale=1.0)
-        chemin_base = os.path.join(DOSSIER_DATA, "boss", "boss arbre")
-        self.tex_sol = arcade.load_texture(os.path.join(chemin_base, "P2.png"))
-        self.tex_saut = arcade.load_texture(os.path.join(chemin_base, "P2.saut.png"))
+        self.tex_sol = ressources.texture("arbre_p2")
+        self.tex_saut = ressources.texture("arbre_p2_saut")
         self.texture = self.tex_sol
         self.center_x, self.center_y = x, y
         self.joueur = joueur
@@ -739,7 +617,7 @@ class BossArbreP2(EntiteBossTron):
         self.degats = 3
         self.timer_saut = 0.0
 
-    def update_boss(self, delta_time, liste_projectiles, murs):
+    def update_boss(self, delta_time, projectiles, murs):
         self.appliquer_physique(murs)
         if self.invul_timer > 0:
             self.invul_timer -= delta_time
@@ -749,15 +627,17 @@ class BossArbreP2(EntiteBossTron):
             self.timer_saut += delta_time
             if self.timer_saut >= 2.0:
                 self.timer_saut = 0.0
-                self.change_y = 12
-                self.change_x = 5 if self.joueur.center_x > self.center_x else -5
+                self.change_y = 12 * PASSES_PAR_TICK
+                self.change_x = (5 if self.joueur.center_x > self.center_x else -5) * PASSES_PAR_TICK
         else:
             self.texture = self.tex_saut
-        if arcade.check_for_collision(self, self.joueur):
-            if self.joueur.invul_timer <= 0:
-                self.joueur.vie -= self.degats # enleve 3 vies
-                self.joueur.invul_timer = 1.0
-                print(f"p2 touche vie restants {self.joueur.vie}")
+
+    def toucher_joueur(self):
+        """ contact avec le joueur (teste dans degats.py) """
+        if self.joueur.invul_timer <= 0:
+            self.joueur.vie -= self.degats # enleve 3 vies
+            self.joueur.invul_timer = 1.0
+            print(f"p2 touche vie restants {self.joueur.vie}")
 
     def au_deces(self):
         # libere deux p3 (donc 4 au total)
@@ -768,7 +648,7 @@ class BossArbreP2(EntiteBossTron):
 class BossArbreP3(EntiteBossTron):
     def __init__(self, x, y, joueur):
         super().__init__(scale=1.5)
-        self.texture = arcade.load_texture(os.path.join(DOSSIER_DATA, "boss", "boss arbre", "P3.png"))
+        self.texture = ressources.texture("arbre_p3")
         self.center_x, self.center_y = x, y
         self.joueur = joueur
         self.vie =2
@@ -776,7 +656,7 @@ class BossArbreP3(EntiteBossTron):
         self.degats = 1
         self.timer_saut = 0.0
 
-    def update_boss(self, delta_time, liste_projectiles, murs):
+    def update_boss(self, delta_time, projectiles, murs):
         if self.invul_timer > 0:
             self.invul_timer -= delta_time
         self.appliquer_physique(murs)
@@ -785,39 +665,37 @@ class BossArbreP3(EntiteBossTron):
             self.timer_saut += delta_time
             if self.timer_saut >= 1.5:
                 self.timer_saut = 0.0
-                self.change_y = 8
-                self.change_x = 4 if self.joueur.center_x > self.center_x else -4
-        if arcade.check_for_collision(self, self.joueur):
-            if self.joueur.invul_timer <= 0:
-                self.joueur.vie -= self.degats # enleve 1 vie
-                self.joueur.invul_timer = 1.0
-                print(f"p3 touche vie restants {self.joueur.vie}")
-
-class BouleBleue(arcade.Sprite):
-    def __init__(self, x, y, dest_x, dest_y, degats, chemin_texture):
-        super().__init__(chemin_texture, scale=1.0)
-        self.center_x = x
-        self.center_y = y
-        self.degats = degats
-        self.timer_vie = 0.0
-        
-        # calcul trajectoire
-        angle_rad = math.atan2(dest_y - y, dest_x - x)
-        vitesse_proj = 300 # va assez vite
-        self.change_x = math.cos(angle_rad) * vitesse_proj
-        self.change_y = math.sin(angle_rad) * vitesse_proj
-
-    def update_proj(self, delta_time):
-        self.center_x += self.change_x * delta_time
-        self.center_y += self.change_y * delta_time
-        self.timer_vie += delta_time
-        if self.timer_vie >= 5.0: # disparait au bout de 5s
-            self.remove_from_sprite_lists()
-
-class NouveauMobBase(EntiteAnimee):
-    def __init__(self, x, y, joueur, stats, textures_paths):
+                self.change_y = 8 * PASSES_PAR_TICK
+                self.change_x = (4 if self.joueur.center_x > self.center_x else -4) * PASSES_PAR_TICK
+
+    def toucher_joueur(self):
+        """ contact avec le joueur (teste dans degats.py) """
+        if self.joueur.invul_timer <= 0:
+            self.joueur.vie -= self.degats # enleve 1 vie
+            self.joueur.invul_timer = 1.0
+            print(f"p3 touche vie restants {self.joueur.vie}")
+
+class NouveauMobBase(Recyclable, EntiteAnimee):
+    # champs ranges dans les tableaux du gestionnaire de mobs (mobs.py)
+    vie = ChampMob()
+    invul_timer = ChampMob()
+    touche_joueur = ChampMob()
+    timer_touche_joueur = ChampMob()
+    anim_timer = ChampMob()
+    frame_actuelle = ChampMob()
+
+    def __init__(self, x, y, *args):
         # taille standard de 0 5 pour tous mobs
+        self.gestion = None
         super().__init__(x, y, scale=0.5) 
+        self.reinitialiser(x, y, *args)
+
+    def reinitialiser(self, x, y, joueur, stats, animation):
+        """ remise a neuf a chaque apparition (reserve) """
+        self.position = (x, y)
+        self.scale = 0.5
+        self.alpha = 255
+        self.frame_actuelle = 0
         self.joueur = joueur
         self.vie =stats["vie"]
         self.degats = stats["degats"]
@@ -832,48 +710,28 @@ class NouveauMobBase(EntiteAnimee):
         self.touche_joueur = 0
         self.timer_touche_joueur = 0.0
 
-        # chargement textures animation
-        self.textures_anim = [arcade.load_texture(path) for path in textures_paths]
+        # frames du registre (nom dans ressources.ANIMATIONS, ex "foret_sol")
+        self.textures_anim = ressources.animation(animation)
         self.texture = self.textures_anim[0]
+        self.sync_hit_box_to_texture() # un mob recycle peut changer d'animation
         self.anim_timer = 0.0
-        
-    def gerer_invulnerabilite_et_animation(self, delta_time):
-        # invulnerabilite (clignotement mob)
-        if self.invul_timer > 0:
-            self.invul_timer -= delta_time
-            self.alpha = 150 
-        else:
-            self.alpha = 255
-            
-        # timer pour retoucher joueur
-        if self.timer_touche_joueur > 0:
-            self.timer_touche_joueur -= delta_time
-            if self.timer_touche_joueur <= 0:
-                self.touche_joueur = 0 # mob peut reattaquer
-                
-        # animation en boucle
-        self.anim_timer += delta_time
-        if self.anim_timer > 0.2: 
-            self.anim_timer = 0.0
-            self.frame_actuelle = (self.frame_actuelle + 1) % len(self.textures_anim)
-            self.texture = self.textures_anim[self.frame_actuelle]
-
-        # orientation vers joueur (arcade 3 0 utilise tuples pour miroir)
-        if self.joueur.center_x > self.center_x:
-            self.scale = (-0.5, 0.5) # retournement horizontal en gardant taille
-        else:
-            self.scale = (0.5, 0.5) # regarde a gauche avec taille 0 5
+
+    def remove_from_sprite_lists(self):
+        # sortir des tableaux avant de retourner dans la reserve
+        if self.gestion is not None:
+            self.gestion.retirer(self)
+        super().remove_from_sprite_lists()
 
     def anti_stuck(self, murs):
         # tp a tuile libre la plus proche si coince
-        if arcade.check_for_collision_with_list(self, murs):
+        if murs.touche(self):
             origine_x, origine_y = self.center_x, self.center_y
             # recherche en spirale (rayon 1 a 3 tuiles)
             for rayon in range(1, 4):
                 for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (-1,-1), (1,-1), (-1,1)]:
                     self.center_x = origine_x + dx * TAILLE_TUILE * rayon
                     self.center_y = origine_y + dy * TAILLE_TUILE * rayon
-                    if not arcade.check_for_collision_with_list(self, murs):
+                    if not murs.touche(self):
                         return # emplacement libre trouve
             # si vraiment tout est bloque remettre a place
             self.center_x, self.center_y = origine_x, origine_y
@@ -881,84 +739,60 @@ class NouveauMobBase(EntiteAnimee):
 
 
 class MobSol(NouveauMobBase):
-    def __init__(self, x, y, joueur, stats, textures_paths):
-        super().__init__(x, y, joueur, stats, textures_paths)
+    def reinitialiser(self, x, y, joueur, stats, animation, gestion):
+        super().reinitialiser(x, y, joueur, stats, animation)
         # suppression scale (gere par base)
         self.vie =stats.get("vie", 2)
         self.degats = stats.get("degats", 1.0)
-
-    def update_mob(self, delta_time, murs):
-        self.gerer_invulnerabilite_et_animation(delta_time)
-        self.change_y -= GRAVITE
-        
-        # 3 ia (se diriger vers joueur)
-        if self.joueur.center_x < self.center_x:
-            self.change_x = -VITESSE_MOB
-        else:
-            self.change_x = VITESSE_MOB
-
-        self.center_x += self.change_x
-        if arcade.check_for_collision_with_list(self, murs):
-            self.center_x -= self.change_x
+        gestion.ajouter(self, air=False)
+
+    def deplacer_murs(self, vx, vy, murs):
+        """ deplacement d'un mob pres des murs (vitesses calculees par le gestionnaire)
+        renvoie la vitesse verticale apres les collisions """
+        self.center_x += vx
+        if murs.touche(self):
+            self.center_x -= vx
             
-        self.center_y += self.change_y
-        hit_list_y = arcade.check_for_collision_with_list(self, murs)
+        self.center_y += vy
+        hit_list_y = murs.collisions(self)
         if hit_list_y:
-            if self.change_y < 0: # tombe
+            if vy < 0: # tombe
                 self.bottom = hit_list_y[0].top
-            elif self.change_y > 0: # touche plafond
+            elif vy > 0: # touche plafond
                 self.top = hit_list_y[0].bottom
-            self.change_y = 0
+            vy = 0
 
         self.anti_stuck(murs)
+        return vy
 
 class MobAir(NouveauMobBase):
-    def __init__(self, x, y, joueur, stats, textures_paths, projectile_texture, liste_projectiles):
-        super().__init__(x, y, joueur, stats, textures_paths)
+    timer_tir = ChampMob()
+    timer_vie_air = ChampMob()
+
+    def reinitialiser(self, x, y, joueur, stats, animation, projectile_texture, projectiles, gestion):
+        super().reinitialiser(x, y, joueur, stats, animation)
         # suppression scale et vie parasites
         
-        self.chemin_boule = arcade.load_texture(os.path.join(DOSSIER_DATA, "mobs", "air", "boule.png"))
-        self.liste_projectiles = liste_projectiles
+        self.projectiles = projectiles
         
         self.vie =stats.get("vie", 2)
         self.degats = stats.get("degats", 0.5)
         self.timer_tir = 0
 
         self.timer_vie_air = 10.0
+        gestion.ajouter(self, air=True)
 
-    def update_mob(self, delta_time, murs):
-
-        self.timer_vie_air -= delta_time
-        if self.timer_vie_air <= 0:
-            self.remove_from_sprite_lists()
-            return
-
-        self.gerer_invulnerabilite_et_animation(delta_time)
-
-        self.gerer_invulnerabilite_et_animation(delta_time)
-        
-        # deplacement (reste a 2 tuiles du joueur)
-        distance = math.dist((self.center_x, self.center_y), (self.joueur.center_x, self.joueur.center_y))
-        
-        if distance > TAILLE_TUILE * 2:
-            angle_rad = math.atan2(self.joueur.center_y - self.center_y, self.joueur.center_x - self.center_x)
-            self.change_x = math.cos(angle_rad) * VITESSE_MOB
-            self.change_y = math.sin(angle_rad) * VITESSE_MOB
-        else:
-            self.change_x = 0
-            self.change_y = 0
-
-        self.center_x += self.change_x
-        self.center_y += self.change_y
+    def deplacer_murs(self, vx, vy, murs):
+        """ deplacement d'un mob pres des murs (vitesses calculees par le gestionnaire) """
+        self.center_x += vx
+        self.center_y += vy
         
         self.anti_stuck(murs)
+        return vy
 
-        # mecanique de tir (toutes les 3 secondes)
-        self.timer_tir += delta_time
-        if self.timer_tir >= 3.0:
-            self.timer_tir = 0.0
-            boule = BouleBleue(self.center_x, self.center_y, self.joueur.center_x, self.joueur.center_y, self.degats, self.chemin_boule)
-            self.liste_projectiles.append(boule)
+    def tirer(self, x, y):
+        # mecanique de tir (toutes les 3 secondes, timer dans le gestionnaire)
+        self.projectiles.tirer("boule", x, y, self.joueur.center_x, self.joueur.center_y, self.degats)
 
 class BossVerDeTerre(EntiteBossTron):
     def __init__(self, x, y, joueur):
@@ -978,25 +812,15 @@ class BossVerDeTerre(EntiteBossTron):
         self.timer_phase = 0.0
         self.phase_actuelle = 0
         self.animations = []
+        self.animations_miroir = []
         
-        # chargement textures (garde logique dossiers)
-        def charger_phase(dossier, prefix, delay, debut, fin, zfill_val):
-            frames = []
-            chemin_base = os.path.join(DOSSIER_DATA, "boss", "Ver de terre", dossier)
-            for i in range(debut, fin + 1):
-                num = str(i).zfill(zfill_val) 
-                nom_fichier = f"{prefix}{num}_delay-{delay}.png"
-                try:
-                    frames.append(arcade.load_texture(os.path.join(chemin_base, nom_fichier)))
-                except:
-                    pass
-            return frames if frames else [arcade.make_soft_square_texture(100, arcade.color.GREEN)]
-
-        self.animations.append(charger_phase("anime", "frame_", "0.13s", 0, 6, 1))
-        self.animations.append(charger_phase("plongeon", "frame_", "0.13s", 0, 13, 2))
-        self.animations.append(charger_phase("saut bougeant", "frame_", "0.1s", 0, 12, 2))
-        self.animations.append(charger_phase("saut court", "frame_", "0.1s", 0, 10, 2))
-        self.animations.append(charger_phase("Saut simple", "frame_", "0.1s", 0, 12, 2))
+        # une animation par phase dans les deux sens (registre, carre vert si images manquantes)
+        for nom in ["ver_anime", "ver_plongeon", "ver_saut_bougeant", "ver_saut_court", "ver_saut_simple"]:
+            frames, miroir = ressources.deux_sens(nom)
+            if not frames:
+                frames = miroir = (arcade.make_soft_square_texture(100, arcade.color.GREEN),)
+            self.animations.append(frames)
+            self.animations_miroir.append(miroir)
         
         self.texture = self.animations[0][0]
 
@@ -1004,7 +828,7 @@ class BossVerDeTerre(EntiteBossTron):
         # aucune gravite
         pass
 
-    def update_boss(self, delta_time, liste_projectiles, murs):
+    def update_boss(self, delta_time, projectiles, murs):
         # 1 invulnerabilite
         if self.invul_timer > 0:
             self.invul_timer -= delta_time
@@ -1028,75 +852,33 @@ class BossVerDeTerre(EntiteBossTron):
         # choix image correspondante
         index_image = min(int(progression * nb_frames), nb_frames - 1)
         self.texture = frames_actuelles[index_image]
-            
-        # 4 collision degats
-        if arcade.check_for_collision(self, self.joueur):
-            if self.joueur.invul_timer <= 0:
-                self.joueur.vie -= self.degats
-                self.joueur.invul_timer = 1.0
-                direction = 1 if self.joueur.center_x > self.center_x else -1
-                self.joueur.center_x += direction * 50
 
-    def update_animation(self, delta_time=1/60):
-        super().update_animation(delta_time)
-        if not self.textures_marche:
-            return
-            
-        if self.temps_ecoule > self.vitesse_animation:
-            self.temps_ecoule = 0
-            self.frame_actuelle = (self.frame_actuelle + 1) % len(self.textures_marche)
-            
-            base = self.textures_marche[self.frame_actuelle]
-            
-            # correction orientation
-            # si de base vers la gauche
-            if self.direction == -1:
-                # joueur a gauche (texture normale)
-                self.texture = base 
-            else:
-                # joueur a droite (inverse texture)
-                self.texture = base.flip_left_right()
-
-class ProjectileRobot(arcade.Sprite):
-    def __init__(self, x, y, joueur):
-        chemin = os.path.join(DOSSIER_DATA, "boss", "boss fin", "attaques", "Attaque 4", "projectile.png")
-        super().__init__(chemin, scale=0.3)
-        self.center_x = x
-        self.center_y = y
-        self.joueur = joueur
-        self.degats = 5  # un demi coeur
-        self.timer_vie = 0.0
-
-        # calcul angle vers joueur
-        diff_x = joueur.center_x - x
-        diff_y = joueur.center_y - y
-        angle_rad = math.atan2(diff_y, diff_x)
-        
-        # tourner sprite vers joueur
-        self.angle = math.degrees(angle_rad) + 90 
-        
-        vitesse = 6
-        self.change_x = math.cos(angle_rad) * vitesse
-        self.change_y = math.sin(angle_rad) * vitesse
+    def toucher_joueur(self):
+        """ 4 collision degats (teste dans degats.py) """
+        if self.joueur.invul_timer <= 0:
+            self.joueur.vie -= self.degats
+            self.joueur.invul_timer = 1.0
+            direction = 1 if self.joueur.center_x > self.center_x else -1
+            self.joueur.center_x += direction * 50
 
-    def update(self, delta_time=1/60):
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        self.timer_vie += delta_time
-        
-        # collision joueur
-        if arcade.check_for_collision(self, self.joueur):
-            if self.joueur.invul_timer <= 0:
-                self.joueur.vie -= self.degats
-                self.joueur.invul_timer = 1.0
-            self.remove_from_sprite_lists()
-
-        if self.timer_vie > 5.0:
-            self.remove_from_sprite_lists()
+    def update_animation(self, delta_time=1/60):
+        # correction orientation
+        # si de base vers la gauche : joueur a gauche texture normale
+        # joueur a droite texture inverse (miroir deja calcule)
+        if self.joueur.center_x < self.center_x:
+            frames_actuelles = self.animations[self.phase_actuelle]
+        else:
+            frames_actuelles = self.animations_miroir[self.phase_actuelle]
+        nb_frames = len(frames_actuelles)
+        index_image = min(int(self.timer_phase / 5.0 * nb_frames), nb_frames - 1)
+        self.texture = frames_actuelles[index_image]
 
-class ZoneRougeAvertissement(arcade.SpriteSolidColor):
+class ZoneRougeAvertissement(Recyclable, arcade.SpriteSolidColor):
     def __init__(self, x, y, type_attaque, joueur):
         super().__init__(32*5, 50, arcade.color.RED_DEVIL)
+        self.reinitialiser(x, y, type_attaque, joueur)
+
+    def reinitialiser(self, x, y, type_attaque, joueur):
         self.center_x = x
         self.center_y = y
         self.timer = 1.0
@@ -1106,9 +888,13 @@ class ZoneRougeAvertissement(arcade.SpriteSolidColor):
     def update(self, delta_time=1/60):
         self.timer -= delta_time
 
-class AttaqueDeZoneBoss(arcade.Sprite):
+class AttaqueDeZoneBoss(Recyclable, arcade.Sprite):
     def __init__(self, x, y, type_attaque, joueur):
         super().__init__(scale=0.7)
+        self.reinitialiser(x, y, type_attaque, joueur)
+
+    def reinitialiser(self, x, y, type_attaque, joueur):
+        self.angle = 0
         self.center_x = x
         self.center_y = y
         self.joueur = joueur
@@ -1120,36 +906,26 @@ class AttaqueDeZoneBoss(arcade.Sprite):
         self.frame_idx = 0
         self.anim_timer = 0.0
         
-        chemin_base = os.path.join(DOSSIER_DATA, "boss", "boss fin", "attaques")
-        
         if type_attaque == 1:
-            # attaque 1
-            chemins = [os.path.join(chemin_base, "attaque 1", f"attaque.{i}.png") for i in range(1, 6)]
-            chemins += chemins[-2::-1] # ajoute retour
-            for c in chemins: self.frames.append(arcade.load_texture(c))
+            # attaque 1 (aller retour)
+            self.frames = ressources.animation("zone_1")
             self.duree_max = 5.0
 
         elif type_attaque == 2:
             # attaque 2 (tourne vers bas)
-            chemins = [os.path.join(chemin_base, "attaque 2", f"{i}.png") for i in range(1, 7)]
-            chemins += chemins[-2::-1]
-            for c in chemins: self.frames.append(arcade.load_texture(c))
+            self.frames = ressources.animation("zone_2")
             self.duree_max = 5.0
             self.angle = 270 # pointe vers bas
             
         elif type_attaque == 3:
             # attaque 3 (sweep sol)
-            chemins = [os.path.join(chemin_base, "attaque 3", f"{i}.png") for i in range(9)]
-            for c in chemins:
-                tex = arcade.load_texture(c)
-                # si joueur a gauche retourner image
-                if joueur.center_x < x:
-                    tex = tex.flip_left_right()
-                self.frames.append(tex)
+            # si joueur a gauche image retournee (miroir deja calcule)
+            self.frames = ressources.animation("zone_3", miroir=joueur.center_x < x)
             self.duree_max = 1.0
 
         if self.frames:
             self.texture = self.frames[0]
+            self.sync_hit_box_to_texture()
             # vitesse pour que animation prenne toute duree
             self.vitesse_anim = self.duree_max / len(self.frames) 
 
@@ -1164,17 +940,19 @@ class AttaqueDeZoneBoss(arcade.Sprite):
             self.frame_idx += 1
             if self.frame_idx < len(self.frames):
                 self.texture = self.frames[self.frame_idx]
-                
-        # degats (1 par seconde)
-        if arcade.check_for_collision(self, self.joueur) and self.timer_degat <= 0:
-            if self.joueur.invul_timer <= 0:
-                self.joueur.vie -= 1
-                self.joueur.invul_timer = 0.2
-            self.timer_degat = 1.0 # attend 1 seconde
             
         if self.timer_duree >= self.duree_max:
             self.remove_from_sprite_lists()
 
+    def toucher_joueur(self):
+        """ degats (1 par seconde), contact teste dans degats.py """
+        if self.timer_degat > 0:
+            return
+        if self.joueur.invul_timer <= 0:
+            self.joueur.vie -= 1
+            self.joueur.invul_timer = 0.2
+        self.timer_degat = 1.0 # attend 1 seconde
+
 class BossRobot(EntiteBossTron):
     def __init__(self, x, y, joueur):
         super().__init__(scale=2.0)
@@ -1186,12 +964,11 @@ class BossRobot(EntiteBossTron):
         self.vie_max = 24
         self.degats = 10 # degats contact direct
         
-        # chargement textures
-        chemin = os.path.join(DOSSIER_DATA, "boss", "Boss robot")
+        # textures des 3 phases (registre)
         self.textures_phases = {
-            1: [arcade.load_texture(os.path.join(chemin, "bot1.1.png")), arcade.load_texture(os.path.join(chemin, "bot1.2.png"))],
-            2: [arcade.load_texture(os.path.join(chemin, "bot2.1.png")), arcade.load_texture(os.path.join(chemin, "bot2.2.png"))],
-            3: [arcade.load_texture(os.path.join(chemin, "bot3.1.png")), arcade.load_texture(os.path.join(chemin, "bot3.2.png"))]
+            1: ressources.animation("robot_1"),
+            2: ressources.animation("robot_2"),
+            3: ressources.animation("robot_3")
         }
         self.anim_timer = 0.0
         self.frame = 0
@@ -1209,7 +986,7 @@ class BossRobot(EntiteBossTron):
         # listes temporaires
         self.nouvelles_zones = []
 
-    def update_boss(self, delta_time, liste_projectiles, murs):
+    def update_boss(self, delta_time, projectiles, murs):
         if self.invul_timer > 0:
             self.invul_timer -= delta_time
 
@@ -1230,7 +1007,7 @@ class BossRobot(EntiteBossTron):
             self.change_y = 0
             # remonte doucement
             if self.center_y < 1600:
-                self.center_y += 3
+                self.center_y += 3 * PASSES_PAR_TICK
             if self.timer_vol_chute >= 10.0:
                 self.en_vol = False
                 self.timer_vol_chute = 0.0
@@ -1241,7 +1018,7 @@ class BossRobot(EntiteBossTron):
                 self.timer_vol_chute = 0.0
 
         # verifier si boss touche sol
-        collisions = arcade.check_for_collision_with_list(self, murs)
+        collisions = murs.collisions(self)
         touche_sol = False
         for mur in collisions:
             if self.bottom <= mur.top + 5: # marge tolerance
@@ -1251,7 +1028,7 @@ class BossRobot(EntiteBossTron):
         self.timer_proj_global += delta_time
         if self.timer_proj_global >= 5.0:
             self.timer_proj_global = 0.0
-            liste_projectiles.append(ProjectileRobot(self.center_x, self.center_y, self.joueur))
+            projectiles.tirer("robot", self.center_x, self.center_y, self.joueur.center_x, self.joueur.center_y)
 
         # 4 attaques en vol
         if self.en_vol and not touche_sol:
@@ -1263,10 +1040,10 @@ class BossRobot(EntiteBossTron):
                 if type_att == 1:
                     # sous joueur
                     hauteur_y = 1621
-                    zone = ZoneRougeAvertissement(self.joueur.center_x, hauteur_y, 1, self.joueur)
+                    zone = ZoneRougeAvertissement.prendre(self.joueur.center_x, hauteur_y, 1, self.joueur)
                 else:
                     # au dessus joueur
-                    zone = ZoneRougeAvertissement(self.joueur.center_x, self.joueur.top + 222, 2, self.joueur)
+                    zone = ZoneRougeAvertissement.prendre(self.joueur.center_x, self.joueur.top + 222, 2, self.joueur)
                     
                 self.nouvelles_zones.append(zone)
 
@@ -1276,7 +1053,7 @@ class BossRobot(EntiteBossTron):
             if self.timer_attaque_sol <= 0:
                 self.timer_attaque_sol = 5.0
                 # spawn attaque 3
-                att3 = AttaqueDeZoneBoss(self.center_x, self.center_y, 3, self.joueur)
+                att3 = AttaqueDeZoneBoss.prendre(self.center_x, self.center_y, 3, self.joueur)
                 self.nouvelles_zones.append(att3)
 
 class BossFin(BossRobot): # herite logique robot
@@ -1285,12 +1062,7 @@ class BossFin(BossRobot): # herite logique robot
         super().__init__(x, y, joueur)
         
         # textures boss fin
-        self.textures_marche = []
-        chemin_fin = os.path.join(DOSSIER_DATA, "boss", "boss fin")
-        for i in range(1, 4):
-            # charge marche
-            tex = arcade.load_texture(os.path.join(chemin_fin, f"marche.{i}.png"))
-            self.textures_marche.append(tex)
+        self.textures_marche = ressources.animation("boss_fin_marche")
         
         self.texture = self.textures_marche[0]
         self.frame_marche = 0
@@ -1304,9 +1076,9 @@ class BossFin(BossRobot): # herite logique robot
             self.frame_marche = (self.frame_marche + 1) % len(self.textures_marche)
             self.texture = self.textures_marche[self.frame_marche]
 
-    def update_boss(self, delta_time, projectiles_ennemis, murs):
+    def update_boss(self, delta_time, projectiles, murs):
         # attaque robot mais propre animation
-        super().update_boss(delta_time, projectiles_ennemis, murs)
+        super().update_boss(delta_time, projectiles, murs)
         self.update_animation(delta_time)
 
 class BossDVD(EntiteAnimee):
@@ -1318,11 +1090,11 @@ class BossDVD(EntiteAnimee):
 
         #Il accelere a mesure que sa vie baisse
         if self.vie >= 33:
-            self.vitesse = 6
+            self.vitesse = 6 * PASSES_PAR_TICK
         elif self.vie >= 17:
-            self.vitesse = 9
+            self.vitesse = 9 * PASSES_PAR_TICK
         else:
-            self.vitesse = 12
+            self.vitesse = 12 * PASSES_PAR_TICK
         # direction initiale (diagonale)
         self.change_x = self.vitesse
         self.change_y = self.vitesse
@@ -1330,11 +1102,8 @@ class BossDVD(EntiteAnimee):
         # timer pour blesser joueur (2 secondes)
         self.timer_degats_joueur = 0
 
-        # chargement textures
-        self.textures_animation = []
-        chemin_dvd = os.path.join(DOSSIER_DATA, "boss", "DVD")
-        for i in range(1, 6):
-            self.textures_animation.append(arcade.load_texture(os.path.join(chemin_dvd, f"DVD{i}.png")))
+        # textures du registre
+        self.textures_animation = ressources.animation("dvd")
         
         self.texture = self.textures_animation[0]
         self.frame_anim = 0
@@ -1342,7 +1111,7 @@ class BossDVD(EntiteAnimee):
 
         
 
-    def update_boss(self, delta_time, liste_projectiles, liste_murs):
+    def update_boss(self, delta_time, projectiles, liste_murs):
         # 1 animation
         self.update_animation(delta_time)
 
@@ -1352,18 +1121,19 @@ class BossDVD(EntiteAnimee):
 
         # 3 mouvement x et rebond murs
         self.center_x += self.change_x
-        if arcade.check_for_collision_with_list(self, liste_murs):
+        if liste_murs.touche(self):
             self.center_x -= self.change_x # annule mouvement
             self.change_x *= -1 # inverse direction
 
         # 4 mouvement y et rebond murs
         self.center_y += self.change_y
-        if arcade.check_for_collision_with_list(self, liste_murs):
+        if liste_murs.touche(self):
             self.center_y -= self.change_y # annule mouvement
             self.change_y *= -1 # inverse direction
 
-        # 5 collision avec joueur
-        if arcade.check_for_collision(self, self.joueur) and self.timer_degats_joueur <= 0:
+    def toucher_joueur(self):
+        """ 5 collision avec joueur (testee dans degats.py) """
+        if self.timer_degats_joueur <= 0:
             self.joueur.vie -= 2 
             self.timer_degats_joueur = 2.0 # 2 secondes attente
 
@@ -0,0 +1,88 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# images des cinematiques lues au fur et a mesure
+# un thread decode les images suivantes pendant que la scene actuelle joue ;
+# seules les images affichees et les quelques suivantes restent en memoire,
+# les autres sont oubliees (et leur place dans l'atlas reprise)
+# les images sont reduites a la taille de l'ecran au decodage (elles sont
+# dessinees en plein ecran) et envoyees dans un atlas a part de taille fixe :
+# l'atlas du jeu ne grossit pas avec les images de cinematique
+
+from concurrent.futures import ThreadPoolExecutor
+import arcade
+from PIL import Image
+from constantes import LARGEUR, HAUTEUR, AVANCE_CINEMATIQUE
+
+
+class FluxImages:
+    """ suite d'images de cinematique (chemins dans l'ordre)
+    afficher(debut, fin) dit quelles images sont a l'ecran, image(i) les donne
+    avance : nombre d'images decodees d'avance apres celles affichees """
+
+    def __init__(self, chemins, avance=AVANCE_CINEMATIQUE):
+        self.chemins = list(chemins)
+        self.avance = avance
+        self.taille_max = (LARGEUR, HAUTEUR)
+        # place pour (2 + avance) images plein ecran, rebati quand il est plein
+        lignes = (2 + avance + 1) // 2
+        self.atlas = arcade.DefaultTextureAtlas((2 * (LARGEUR + 4), lignes * (HAUTEUR + 4)))
+        self._thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cinematique")
+        self._futurs = {}  # index -> decodage en cours ou fini
+
+    def __len__(self):
+        return len(self.chemins)
+
+    def _decoder(self, index):
+        """ sur le thread : lecture, reduction a la taille de l'ecran, texture (pas d'opengl) """
+        chemin = self.chemins[index]
+        image = Image.open(chemin).convert("RGBA")
+        largeur = min(image.width, self.taille_max[0])
+        hauteur = min(image.height, self.taille_max[1])
+        if (largeur, hauteur) != image.size:
+            image = image.resize((largeur, hauteur), Image.LANCZOS)
+        # hit box en rectangle : l'image n'entre jamais en collision
+        return arcade.Texture(image, hit_box_algorithm=arcade.hitbox.algo_bounding_box, hash=f"{chemin}|{largeur}x{hauteur}")
+
+    def afficher(self, debut, fin):
+        """ les images debut a fin (exclue) sont a l'ecran : on decode celles qui
+        manquent et les suivantes, on oublie les autres """
+        garder = range(max(0, debut), min(fin + self.avance, len(self.chemins)))
+        for i in garder:
+            if i not in self._futurs:
+                self._futurs[i] = self._thread.submit(self._decoder, i)
+        for i in list(self._futurs):
+            if i not in garder:
+                self._futurs.pop(i).cancel()
+
+    def pret(self, index):
+        futur = self._futurs.get(index)
+        return futur is not None and futur.done()
+
+    def image(self, index):
+        """ texture de l'image (attend le thread si elle n'est pas encore decodee) """
+        futur = self._futurs.get(index)
+        if futur is None:
+            self.afficher(index, index + 1)
+            futur = self._futurs[index]
+        tex = futur.result()
+        self.atlas.add(tex)
+        return tex
+
+    def envoyer(self):
+        """ a appeler a chaque frame : envoie une image deja decodee a la carte graphique
+        (une seule par frame, pour qu'un changement de scene n'ait rien a envoyer) """
+        for index in sorted(self._futurs):
+            futur = self._futurs[index]
+            if futur.done():
+                tex = futur.result()
+                if not self.atlas.has_texture(tex):
+                    self.atlas.add(tex)
+                    return
+
+    def dessiner(self, tex, rect):
+        arcade.draw_texture_rect(tex, rect, atlas=self.atlas)
+
+    def fermer(self):
+        self._thread.shutdown(wait=False, cancel_futures=True)
+        self._futurs.clear()
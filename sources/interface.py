@@ -4,100 +4,205 @@
 import os
 import arcade
 import math
+import pyglet
+from arcade.shape_list import ShapeElementList, create_rectangle_outline
 from constantes import LARGEUR, HAUTEUR, DOSSIER_DATA
+import ressources
+
+# L'interface est gardée d'une frame à l'autre (sprites, textes, contours)
+# et n'est refaite que quand une valeur affichée change (vie, monnaie, eau,
+# inventaire, lignes du chat...). Sans changement, une frame ne fait que
+# quelques draw().
+# Les objets sont créés au premier affichage : HUD et shop sont construits
+# sur le thread de chargement, où il n'y a pas d'opengl.
+
+
+class Textes:
+    """ textes gardés : un arcade.Text par clé, tous dessinés en un seul appel
+    un texte n'est remis en page que si sa valeur change """
+
+    def __init__(self):
+        self.batch = pyglet.graphics.Batch()
+        self.textes = {}
+
+    def ecrire(self, cle, texte, x, y, couleur=arcade.color.WHITE, taille=12, **options):
+        t = self.textes.get(cle)
+        if t is None:
+            self.textes[cle] = arcade.Text(texte, x, y, couleur, taille, batch=self.batch, **options)
+            return
+        t.text = texte
+        if t.color != couleur:
+            t.color = couleur
+        t.visible = True
+
+    def cacher(self, cle):
+        t = self.textes.get(cle)
+        if t is not None:
+            t.visible = False
+
+    def draw(self):
+        self.batch.draw()
+
+
+def _poser(sprite, tex, largeur, hauteur=None):
+    """ texture et taille d'un sprite d'interface (comme draw_texture_rect) """
+    sprite.texture = tex
+    sprite.width = largeur
+    sprite.height = largeur if hauteur is None else hauteur
+    sprite.visible = True
+
 
 class HUD:
     def __init__(self):
         #CHARGEMENT DES TEXTURES
         chemin_vies = os.path.join(DOSSIER_DATA, "player", "vies")
-        self.tex_vie_1 = arcade.load_texture(os.path.join(chemin_vies, "vie1.png"))
-        self.tex_vie_05 = arcade.load_texture(os.path.join(chemin_vies, "vie0.5.png"))
-        self.tex_vie_0 = arcade.load_texture(os.path.join(chemin_vies, "vie0.png"))
+        self.tex_vie_1 = ressources.charger(os.path.join(chemin_vies, "vie1.png"))
+        self.tex_vie_05 = ressources.charger(os.path.join(chemin_vies, "vie0.5.png"))
+        self.tex_vie_0 = ressources.charger(os.path.join(chemin_vies, "vie0.png"))
         
         self.textures_eau = {}
         self.textures_nrj = {}
         for val in [0, 25, 50, 75, 100]:
             path_eau = os.path.join(DOSSIER_DATA, "player", "barres", "eau", f"{val}.png")
             path_nrj = os.path.join(DOSSIER_DATA, "player", "barres", "nrj", f"{val}.png")
-            self.textures_eau[val] = arcade.load_texture(path_eau)
-            self.textures_nrj[val] = arcade.load_texture(path_nrj)
-
-        self.tex_monnaie = arcade.load_texture(os.path.join(DOSSIER_DATA, "mobs", "PNJ", "monnaie.png"))
+            self.textures_eau[val] = ressources.charger(path_eau)
+            self.textures_nrj[val] = ressources.charger(path_nrj)
+
+        self.tex_monnaie = ressources.charger(os.path.join(DOSSIER_DATA, "mobs", "PNJ", "monnaie.png"))
+
+        # Interface gardée (créée au premier affichage)
+        self.coeurs = None
+        self.coeurs_affiches = None
+        self.inventaire_affiche = None
+        self.selection_affichee = None
+
+    def construire(self):
+        """ sprites, contours et textes du HUD, une seule fois """
+        # 15 coeurs : les 10 premiers sur la ligne du bas, les 5 autres au-dessus
+        self.coeurs = arcade.SpriteList()
+        for i in range(15):
+            coeur = arcade.Sprite(self.tex_vie_0, center_x=50 + (i % 10) * 35, center_y=130 + (i // 10) * 40)
+            _poser(coeur, self.tex_vie_0, 32)
+            self.coeurs.append(coeur)
+
+        self.icones = arcade.SpriteList()
+        monnaie = arcade.Sprite(self.tex_monnaie, center_x=LARGEUR - 150, center_y=50)
+        _poser(monnaie, self.tex_monnaie, 40)
+        self.icones.append(monnaie)
+        # Consommables (3 cases, horizontal, au milieu)
+        self.icones_items = [arcade.Sprite(center_x=LARGEUR // 2 - 100 + i * 80, center_y=50) for i in range(3)]
+        # Charmes (4 cases, vertical, à gauche)
+        self.icones_charmes = [arcade.Sprite(center_x=40, center_y=HAUTEUR // 2 + (i * 70) - 100) for i in range(4)]
+        self.icone_eau = arcade.Sprite(center_x=650, center_y=140)
+        self.icone_nrj = arcade.Sprite(center_x=740, center_y=140)
+        for icone in self.icones_items + self.icones_charmes + [self.icone_eau, self.icone_nrj]:
+            icone.visible = False
+            self.icones.append(icone)
+
+        self.contours = None
+        self.textes = Textes()
 
     def dessiner(self, joueur):
+        if self.coeurs is None:
+            self.construire()
+
         # On gère l'affichage jusqu'à 15 coeurs (si le charme coeurs+5.png est là)
         coeurs_a_dessiner = 15 if "coeurs+5.png" in joueur.inventaire_charmes else 10
-        
-        for i in range(coeurs_a_dessiner):
-            # Les 10 premiers cœurs sur la ligne du bas, les 5 autres au-dessus
-            ligne = i // 10
-            colonne = i % 10
-            x_coeur = 50 + colonne * 35 
-            y_coeur = 130 + ligne * 40 # +40 pixels plus haut pour la 2ème ligne
-            
-            seuil_plein = (i + 1) * 10
-            seuil_demi = seuil_plein - 5
-            
-            if joueur.vie >= seuil_plein: tex = self.tex_vie_1
-            elif joueur.vie > seuil_demi: tex = self.tex_vie_05
-            else: tex = self.tex_vie_0
-                
-            arcade.draw_texture_rect(tex, arcade.rect.XYWH(x_coeur, y_coeur, 32, 32))
+
+        if (joueur.vie, coeurs_a_dessiner) != self.coeurs_affiches:
+            self.coeurs_affiches = (joueur.vie, coeurs_a_dessiner)
+            for i, coeur in enumerate(self.coeurs):
+                seuil_plein = (i + 1) * 10
+                seuil_demi = seuil_plein - 5
+
+                if joueur.vie >= seuil_plein: tex = self.tex_vie_1
+                elif joueur.vie > seuil_demi: tex = self.tex_vie_05
+                else: tex = self.tex_vie_0
+
+                _poser(coeur, tex, 32)
+                coeur.visible = i < coeurs_a_dessiner
+
+        self.coeurs.draw()
 
     def dessiner_inventaire_et_monnaie(self, joueur):
+        if self.coeurs is None:
+            self.construire()
+
+        temps_restant = math.ceil(getattr(joueur, 'timer_dash', 0))
+        items = tuple(None if item is None else (item["tex"], item["qte"]) for item in joueur.inventaire_items)
+        etat = (joueur.monnaie, joueur.index_selection, items, tuple(joueur.inventaire_charmes), int(joueur.eau), temps_restant)
+
+        if etat != self.inventaire_affiche:
+            self.inventaire_affiche = etat
+            self.mettre_a_jour_inventaire(joueur, temps_restant)
+
+        self.contours.draw()
+        self.icones.draw()
+        self.textes.draw()
+
+    def mettre_a_jour_inventaire(self, joueur, temps_restant):
+        """ refait les sprites et textes de l'inventaire (seulement quand une valeur change) """
         #MONNAIE
-        arcade.draw_texture_rect(self.tex_monnaie, arcade.rect.XYWH(LARGEUR - 150, 50, 40, 40))
-        arcade.draw_text(f"{joueur.monnaie} $", LARGEUR - 100, 40, arcade.color.YELLOW, 18, bold=True)
-        
+        self.textes.ecrire("monnaie", f"{joueur.monnaie} $", LARGEUR - 100, 40, arcade.color.YELLOW, 18, bold=True)
+
         #INVENTAIRE CONSOMMABLES (3 cases, horizontal, au milieu)
+        if joueur.index_selection != self.selection_affichee:
+            self.selection_affichee = joueur.index_selection
+            self.construire_contours(joueur.index_selection)
+
         start_x = LARGEUR // 2 - 100
         for i in range(3):
             x_slot = start_x + i * 80
             y_slot = 50
             taille = 70 if i == joueur.index_selection else 60 # Grossit si sélectionné
-            rect = arcade.rect.XYWH(x_slot, y_slot, taille, taille)
-            
-            couleur_bord = arcade.color.YELLOW if i == joueur.index_selection else arcade.color.WHITE
-            arcade.draw_rect_outline(rect, couleur_bord, 3)
 
             item = joueur.inventaire_items[i]
             if item is not None:
-                arcade.draw_texture_rect(item["tex"], arcade.rect.XYWH(x_slot, y_slot, taille - 10, taille - 10))
-                # Dessiner le nombre de l'item (stack) en bas à droite de la case
-                arcade.draw_text(f"x{item['qte']}", x_slot + 10, y_slot - 25, arcade.color.WHITE, 12, bold=True)
-                
-        # INVENTAIRE CHARMES (4 cases, vertical, à gauche de l'écran par exemple)
-        for i in range(4):
-            x_slot = 40
-            y_slot = HAUTEUR // 2 + (i * 70) - 100
-            rect = arcade.rect.XYWH(x_slot, y_slot, 50, 50)
-            arcade.draw_rect_outline(rect, arcade.color.LIGHT_GRAY, 2)
-            
+                _poser(self.icones_items[i], item["tex"], taille - 10)
+                # Nombre de l'item (stack) en bas à droite de la case
+                self.textes.ecrire(f"qte{i}", f"x{item['qte']}", x_slot + 10, y_slot - 25, arcade.color.WHITE, 12, bold=True)
+            else:
+                self.icones_items[i].visible = False
+                self.textes.cacher(f"qte{i}")
+
+        # INVENTAIRE CHARMES (4 cases, vertical, à gauche de l'écran)
+        for i, icone in enumerate(self.icones_charmes):
+            icone.visible = False
             if i < len(joueur.inventaire_charmes):
                 nom_fichier = joueur.inventaire_charmes[i]
-                # Essai de chargement rapide de la texture du charme
                 try:
-                    tex_charme = arcade.load_texture(os.path.join(DOSSIER_DATA, "mobs", "PNJ", "items", nom_fichier))
-                    arcade.draw_texture_rect(tex_charme, arcade.rect.XYWH(x_slot, y_slot, 40, 40))
+                    _poser(icone, ressources.charger(os.path.join(DOSSIER_DATA, "mobs", "PNJ", "items", nom_fichier)), 40)
                 except: pass # Si image introuvable, on laisse vide
 
         # GOUTTE D'EAU ET FLEUR DASH
         val_eau = max(0, min(100, int(joueur.eau // 25) * 25))
-        arcade.draw_texture_rect(self.textures_eau[val_eau], arcade.rect.XYWH(650, 140, 64, 64))
-        arcade.draw_text(f"{int(joueur.eau)}", 670, 130, arcade.color.CYAN, 18, bold=True)
+        _poser(self.icone_eau, self.textures_eau[val_eau], 64)
+        self.textes.ecrire("eau", f"{int(joueur.eau)}", 670, 130, arcade.color.CYAN, 18, bold=True)
 
-        temps_restant = math.ceil(getattr(joueur, 'timer_dash', 0))
         if temps_restant >= 5: val_nrj = 0
         elif temps_restant == 4: val_nrj = 25
         elif temps_restant == 3: val_nrj = 50
         elif temps_restant == 2: val_nrj = 75
         else: val_nrj = 100
-        
-        arcade.draw_texture_rect(self.textures_nrj[val_nrj], arcade.rect.XYWH(740, 140, 64, 64))
+
+        _poser(self.icone_nrj, self.textures_nrj[val_nrj], 64)
         if temps_restant > 0:
-            arcade.draw_text(f"{temps_restant}s", 765, 130, arcade.color.ORANGE, 18, bold=True)
+            self.textes.cacher("pret")
+            self.textes.ecrire("dash", f"{temps_restant}s", 765, 130, arcade.color.ORANGE, 18, bold=True)
         else:
-            arcade.draw_text("Prêt", 765, 130, arcade.color.GREEN, 14, bold=True)
+            self.textes.cacher("dash")
+            self.textes.ecrire("pret", "Prêt", 765, 130, arcade.color.GREEN, 14, bold=True)
+
+    def construire_contours(self, selection):
+        """ contours des cases, refaits quand la case sélectionnée change """
+        self.contours = ShapeElementList()
+        start_x = LARGEUR // 2 - 100
+        for i in range(3):
+            taille = 70 if i == selection else 60
+            couleur_bord = arcade.color.YELLOW if i == selection else arcade.color.WHITE
+            self.contours.append(create_rectangle_outline(start_x + i * 80, 50, taille, taille, couleur_bord, 3))
+        for i in range(4):
+            self.contours.append(create_rectangle_outline(40, HAUTEUR // 2 + (i * 70) - 100, 50, 50, arcade.color.LIGHT_GRAY, 2))
 
 class InterfaceShop:
     def __init__(self):
@@ -111,8 +216,8 @@ class InterfaceShop:
 
         # Chargement du GUI
         try:
-            self.tex_gui = arcade.load_texture(os.path.join(self.chemin_pnj, "gui.png"))
-            self.tex_btn = arcade.load_texture(os.path.join(self.chemin_pnj, "boutton.png"))
+            self.tex_gui = ressources.charger(os.path.join(self.chemin_pnj, "gui.png"))
+            self.tex_btn = ressources.charger(os.path.join(self.chemin_pnj, "boutton.png"))
         except:
             self.tex_gui = None
             self.tex_btn = None
@@ -136,10 +241,14 @@ class InterfaceShop:
         self.espacement_x = 195
         self.espacement_y = 70
 
+        # Interface gardée (créée au premier affichage)
+        self.sprites = None
+        self.survol_affiche = None
+
     def charger_item(self, nom, prix, fichier, type_item):
         path = os.path.join(self.chemin_items, fichier)
         try:
-            tex = arcade.load_texture(path)
+            tex = ressources.charger(path)
         except:
             tex = arcade.make_soft_square_texture(40, arcade.color.BLUE)
         self.items.append({"nom": nom, "prix": prix, "fichier": fichier, "type": type_item, "icon": tex, "achete": False})
@@ -148,47 +257,73 @@ class InterfaceShop:
         self.souris_x = x
         self.souris_y = y
 
-    def dessiner(self):
-        if not self.ouvert:
-            return
+    def construire(self):
+        """ sprites et textes du shop, une seule fois (le contenu ne change pas) """
+        self.sprites = arcade.SpriteList()
+        self.textes = Textes()
 
         # 1. Fond
         if self.tex_gui:
-            arcade.draw_texture_rect(self.tex_gui, arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2, 650, 450))
+            fond = arcade.Sprite(self.tex_gui, center_x=LARGEUR//2, center_y=HAUTEUR//2)
+            _poser(fond, self.tex_gui, 650, 450)
         else:
-            arcade.draw_rect_filled(arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2, 650, 450), arcade.color.DARK_GRAY)
+            fond = arcade.SpriteSolidColor(650, 450, LARGEUR//2, HAUTEUR//2, arcade.color.DARK_GRAY)
+        self.sprites.append(fond)
 
         # Croix de fermeture (Position précise)
         croix_x = LARGEUR//2 + 285
         croix_y = HAUTEUR//2 + 195
-        survol_croix = abs(self.souris_x - croix_x) < 25 and abs(self.souris_y - croix_y) < 25
-        couleur = arcade.color.RED if survol_croix else arcade.color.DARK_RED
-        
-        arcade.draw_rect_filled(arcade.rect.XYWH(croix_x, croix_y, 40, 40), couleur)
-        arcade.draw_text("X", croix_x, croix_y, arcade.color.WHITE, 20, bold=True, anchor_x="center", anchor_y="center")
+        self.croix = arcade.SpriteSolidColor(40, 40, croix_x, croix_y, arcade.color.DARK_RED)
+        self.sprites.append(self.croix)
+        self.textes.ecrire("X", "X", croix_x, croix_y, arcade.color.WHITE, 20, bold=True, anchor_x="center", anchor_y="center")
 
         # Grille d'items
-        start_x = LARGEUR//2 - 195
-        start_y = HAUTEUR//2 + 80
-
+        self.boutons = []
         for i, item in enumerate(self.items):
-            col = i % 3
-            lig = i // 3
-            bx = start_x + (col * self.espacement_x)
-            by = start_y - (lig * self.espacement_y)
-
-            survol = abs(self.souris_x - bx) < self.btn_largeur//2 and abs(self.souris_y - by) < self.btn_hauteur//2
-            teinte = arcade.color.LIGHT_GRAY if survol else arcade.color.WHITE
+            bx, by = self.position_bouton(i)
 
             if self.tex_btn:
-                arcade.draw_texture_rect(self.tex_btn, arcade.rect.XYWH(bx, by, self.btn_largeur, self.btn_hauteur), color=teinte)
-            
+                bouton = arcade.Sprite(self.tex_btn, center_x=bx, center_y=by)
+                _poser(bouton, self.tex_btn, self.btn_largeur, self.btn_hauteur)
+                self.sprites.append(bouton)
+                self.boutons.append(bouton)
+
             # Icône de l'item
-            arcade.draw_texture_rect(item["icon"], arcade.rect.XYWH(bx - 60, by, 40, 40))
-            
+            icone = arcade.Sprite(item["icon"], center_x=bx - 60, center_y=by)
+            _poser(icone, item["icon"], 40)
+            self.sprites.append(icone)
+
             # Textes
-            arcade.draw_text(item['nom'], bx - 30, by + 5, arcade.color.WHITE, 10, anchor_x="left")
-            arcade.draw_text(f"{item['prix']} $", bx - 30, by - 12, arcade.color.YELLOW, 11, bold=True, anchor_x="left")
+            self.textes.ecrire(f"nom{i}", item['nom'], bx - 30, by + 5, arcade.color.WHITE, 10, anchor_x="left")
+            self.textes.ecrire(f"prix{i}", f"{item['prix']} $", bx - 30, by - 12, arcade.color.YELLOW, 11, bold=True, anchor_x="left")
+
+    def position_bouton(self, i):
+        start_x = LARGEUR//2 - 195
+        start_y = HAUTEUR//2 + 80
+        return start_x + (i % 3 * self.espacement_x), start_y - (i // 3 * self.espacement_y)
+
+    def dessiner(self):
+        if not self.ouvert:
+            return
+        if self.sprites is None:
+            self.construire()
+
+        # Survol : seules les couleurs changent, et seulement quand la souris change de case
+        survol_croix = abs(self.souris_x - self.croix.center_x) < 25 and abs(self.souris_y - self.croix.center_y) < 25
+        survol = None
+        for i, bouton in enumerate(self.boutons):
+            if abs(self.souris_x - bouton.center_x) < self.btn_largeur//2 and abs(self.souris_y - bouton.center_y) < self.btn_hauteur//2:
+                survol = i
+                break
+
+        if (survol_croix, survol) != self.survol_affiche:
+            self.survol_affiche = (survol_croix, survol)
+            self.croix.color = arcade.color.RED if survol_croix else arcade.color.DARK_RED
+            for i, bouton in enumerate(self.boutons):
+                bouton.color = arcade.color.LIGHT_GRAY if i == survol else arcade.color.WHITE
+
+        self.sprites.draw()
+        self.textes.draw()
 
     def on_mouse_press(self, x, y):
         # Vérification Croix
@@ -211,19 +346,37 @@ class Chat:
         self.messages = []
         self.actif = False
         self.texte_saisie = ""
+
+        # Lignes gardées, refaites quand un message arrive ou disparaît
+        self.version = 0
+        self.version_affichee = None
+        self.textes = None
         
     def ajouter_message(self, texte, couleur=arcade.color.WHITE):
         self.messages.append({"texte": texte, "couleur": couleur, "timer": 5.0})
+        self.version += 1
 
     def update(self, delta_time):
         for msg in self.messages:
             msg["timer"] -= delta_time
-        self.messages = [m for m in self.messages if m["timer"] > 0]
+        restants = [m for m in self.messages if m["timer"] > 0]
+        if len(restants) != len(self.messages):
+            self.version += 1
+        self.messages = restants
 
     def dessiner(self):
-        for i, msg in enumerate(reversed(self.messages)):
-            y = 150 + (i * 25)
-            arcade.draw_text(msg["texte"], 20, y, msg["couleur"], 14)
+        if self.textes is None:
+            self.textes = Textes()
+
+        if self.version != self.version_affichee:
+            self.version_affichee = self.version
+            for i, msg in enumerate(reversed(self.messages)):
+                y = 150 + (i * 25)
+                self.textes.ecrire(i, msg["texte"], 20, y, msg["couleur"], 14)
+            for i in range(len(self.messages), len(self.textes.textes)):
+                self.textes.cacher(i)
+
+        self.textes.draw()
 
 class InterfaceDev:
     def __init__(self):
@@ -242,43 +395,78 @@ class InterfaceDev:
             {"nom": "Monnaie", "attr": "monnaie", "step": 10},
         ]
 
+        # Interface gardée (créée au premier affichage)
+        self.sprites = None
+        self.valeurs_affichees = None
+        self.survol_affiche = None
+
     def update_souris(self, x, y):
         self.souris_x = x
         self.souris_y = y
 
-    def dessiner(self, joueur):
-        if not self.ouvert: return
-        
+    def construire(self):
+        """ fond, boutons et textes fixes du menu, une seule fois """
+        self.sprites = arcade.SpriteList()
+        self.textes = Textes()
+
         # Fond semi-transparent
-        arcade.draw_rect_filled(arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2, 400, 450), (0, 0, 0, 220))
-        arcade.draw_text("MENU DÉVELOPPEUR (F4)", LARGEUR//2, HAUTEUR//2 + 180, arcade.color.YELLOW, 18, bold=True, anchor_x="center")
-        
+        self.sprites.append(arcade.SpriteSolidColor(400, 450, LARGEUR//2, HAUTEUR//2, (0, 0, 0, 220)))
+        self.textes.ecrire("titre", "MENU DÉVELOPPEUR (F4)", LARGEUR//2, HAUTEUR//2 + 180, arcade.color.YELLOW, 18, bold=True, anchor_x="center")
+
         start_y = HAUTEUR//2 + 120
-        # Affichage des statistiques
+        self.boutons = []  # [-] et [+] de chaque ligne
         for i, ligne in enumerate(self.lignes):
             y = start_y - i * 40
-            valeur = getattr(joueur, ligne["attr"])
-            if isinstance(valeur, float): valeur = round(valeur, 2)
-            
-            # Nom de la stat
-            arcade.draw_text(f"{ligne['nom']} : {valeur}", LARGEUR//2 - 60, y, arcade.color.WHITE, 14, anchor_x="center", anchor_y="center")
-            
-            # Bouton [-]
-            couleur_m = arcade.color.RED if abs(self.souris_x - (LARGEUR//2 - 150)) < 15 and abs(self.souris_y - y) < 15 else arcade.color.DARK_RED
-            arcade.draw_rect_filled(arcade.rect.XYWH(LARGEUR//2 - 150, y, 30, 30), couleur_m)
-            arcade.draw_text("-", LARGEUR//2 - 150, y, arcade.color.WHITE, 16, bold=True, anchor_x="center", anchor_y="center")
-
-            # Bouton [+]
-            couleur_p = arcade.color.GREEN if abs(self.souris_x - (LARGEUR//2 + 150)) < 15 and abs(self.souris_y - y) < 15 else arcade.color.DARK_GREEN
-            arcade.draw_rect_filled(arcade.rect.XYWH(LARGEUR//2 + 150, y, 30, 30), couleur_p)
-            arcade.draw_text("+", LARGEUR//2 + 150, y, arcade.color.WHITE, 16, bold=True, anchor_x="center", anchor_y="center")
+            moins = arcade.SpriteSolidColor(30, 30, LARGEUR//2 - 150, y, arcade.color.DARK_RED)
+            plus = arcade.SpriteSolidColor(30, 30, LARGEUR//2 + 150, y, arcade.color.DARK_GREEN)
+            self.sprites.extend((moins, plus))
+            self.boutons.append((moins, plus))
+            self.textes.ecrire(f"moins{i}", "-", LARGEUR//2 - 150, y, arcade.color.WHITE, 16, bold=True, anchor_x="center", anchor_y="center")
+            self.textes.ecrire(f"plus{i}", "+", LARGEUR//2 + 150, y, arcade.color.WHITE, 16, bold=True, anchor_x="center", anchor_y="center")
 
         # Bouton Noclip (Vol)
-        y_noclip = start_y - len(self.lignes) * 40 - 20
-        couleur_noclip = arcade.color.GREEN if joueur.noclip else arcade.color.RED
-        arcade.draw_rect_filled(arcade.rect.XYWH(LARGEUR//2, y_noclip, 200, 40), couleur_noclip)
-        texte_noclip = "Noclip / Vol : ON" if joueur.noclip else "Noclip / Vol : OFF"
-        arcade.draw_text(texte_noclip, LARGEUR//2, y_noclip, arcade.color.WHITE, 14, bold=True, anchor_x="center", anchor_y="center")
+        self.y_noclip = start_y - len(self.lignes) * 40 - 20
+        self.bouton_noclip = arcade.SpriteSolidColor(200, 40, LARGEUR//2, self.y_noclip, arcade.color.RED)
+        self.sprites.append(self.bouton_noclip)
+
+    def dessiner(self, joueur):
+        if not self.ouvert: return
+        if self.sprites is None:
+            self.construire()
+
+        # Statistiques : textes refaits seulement quand une valeur change
+        valeurs = []
+        for ligne in self.lignes:
+            valeur = getattr(joueur, ligne["attr"])
+            if isinstance(valeur, float): valeur = round(valeur, 2)
+            valeurs.append(valeur)
+        valeurs.append(joueur.noclip)
+
+        if valeurs != self.valeurs_affichees:
+            self.valeurs_affichees = valeurs
+            start_y = HAUTEUR//2 + 120
+            for i, ligne in enumerate(self.lignes):
+                self.textes.ecrire(f"stat{i}", f"{ligne['nom']} : {valeurs[i]}", LARGEUR//2 - 60, start_y - i * 40, arcade.color.WHITE, 14, anchor_x="center", anchor_y="center")
+
+            self.bouton_noclip.color = arcade.color.GREEN if joueur.noclip else arcade.color.RED
+            texte_noclip = "Noclip / Vol : ON" if joueur.noclip else "Noclip / Vol : OFF"
+            self.textes.ecrire("noclip", texte_noclip, LARGEUR//2, self.y_noclip, arcade.color.WHITE, 14, bold=True, anchor_x="center", anchor_y="center")
+
+        # Survol des boutons [-] [+]
+        survol = None
+        for i, (moins, plus) in enumerate(self.boutons):
+            if abs(self.souris_y - moins.center_y) < 15:
+                if abs(self.souris_x - moins.center_x) < 15: survol = (i, 0)
+                elif abs(self.souris_x - plus.center_x) < 15: survol = (i, 1)
+
+        if survol != self.survol_affiche:
+            self.survol_affiche = survol
+            for i, (moins, plus) in enumerate(self.boutons):
+                moins.color = arcade.color.RED if survol == (i, 0) else arcade.color.DARK_RED
+                plus.color = arcade.color.GREEN if survol == (i, 1) else arcade.color.DARK_GREEN
+
+        self.sprites.draw()
+        self.textes.draw()
 
     def on_mouse_press(self, x, y, joueur):
         start_y = HAUTEUR//2 + 120
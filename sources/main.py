@@ -1,87 +1,94 @@
 #Projet : FLOIOIDE
 #Auteurs : Laure, Thomas, Corentin, Victor
 
-import arcade
+import demarrage
 import random
 import os
-from constantes import *
-from inputs import InputHandler
-from logic import gerer_collisions, separer_mobs
-from entities import Joueur, MobAir, PNJ, EffetAttaque, BossArbreP1, MobSol, BossArbreP2, BossArbreP3, BossVerDeTerre, BossRobot, AttaqueDeZoneBoss, ZoneRougeAvertissement, BossFin, BossDVD
-from interface import HUD, Chat, InterfaceShop, InterfaceDev
 import math
-from arcade.hitbox import HitBox
 import time
-
-class ProjectileJoueur(arcade.Sprite):
-    def __init__(self, x, y, dest_x, dest_y):
-        chemin = os.path.join(DOSSIER_DATA, "mobs", "PNJ", "items", "balle.png")
-        try: 
-            tex = arcade.load_texture(chemin)
-        except: 
-            tex = arcade.Texture.create_filled("balle_secours", (10, 10), arcade.color.YELLOW)
-        
-        super().__init__(tex, scale=0.8)
-        self.center_x, self.center_y = x, y
-        self.degats = 2
-        self.timer_vie = 0  # chronometre de vie
-        
-        # calcul de l angle vers le curseur
-        angle_rad = math.atan2(dest_y - y, dest_x - x)
-        
-        # vitesse basee sur la constante
-        self.change_x = math.cos(angle_rad) * VITESSE_TIR
-        self.change_y = math.sin(angle_rad) * VITESSE_TIR
-        
-        # orientation de la texture
-        self.angle = math.degrees(angle_rad)
-
-    def update_proj(self, delta_time):
-        # deplacement simple
-        self.center_x += self.change_x * delta_time
-        self.center_y += self.change_y * delta_time
-        
-        # gestion de la duree de vie
-        self.timer_vie += delta_time
-        if self.timer_vie >= 7.0:
-            self.remove_from_sprite_lists()
+# temps des imports (FLOIOIDE_TRACE=1, voir demarrage.py)
+with demarrage.mesurer("import arcade"):
+    import arcade
+with demarrage.mesurer("import du jeu"):
+    from constantes import *
+    from inputs import InputHandler
+    from entities import Joueur, MobAir, PNJ, EffetAttaque, BossArbreP1, MobSol, BossArbreP2, BossArbreP3, BossVerDeTerre, BossRobot, AttaqueDeZoneBoss, ZoneRougeAvertissement, BossFin, BossDVD
+    from interface import HUD, Chat, InterfaceShop, InterfaceDev
+    from carte import charger_carte, remplir_scene, TexturesTuiles
+    from chunks import GestionnaireChunks
+    from rendu_gpu import RenduTuilesGPU
+    from parallax import FondParallax
+    from zones import IndexZones
+    from collisions import GrilleCollision, MoteurPlateforme
+    from chargement import Chargement, Etape
+    from flux_images import FluxImages
+    from pas_fixe import PasFixe, Interpolation
+    from planificateur import Planificateur
+    from mobs import GestionnaireMobs
+    from projectiles import Projectiles
+    from degats import Collisions, GroupeSprites
+    from proximite import Proximite
+    import reserves
+    import enregistrement
+    from enregistrement import entree
+    import ressources
+    import audio
 
 class EcranChargementView(arcade.View):
+    """ ecran affiche pendant le vrai chargement de la vue suivante
+    si la vue a une methode chargement() elle est avancee a chaque frame
+    (decodage sur un thread, envois a la carte graphique etales) sinon setup() """
     def __init__(self, vue_suivante_class):
         super().__init__()
         self.vue_suivante_class = vue_suivante_class
         self.timer = 0
         self.indice_chargement = 1
-        self.temp_anim = 0
+        self.vue = None
+        self.chargement = None
+        self.progression = 0.0
+        self.deja_dessine = False
 
         self.frames_chargement = [] 
         
-        self.logo = arcade.load_texture(os.path.join(DOSSIER_DATA, "Logo_.png"))
+        self.logo = ressources.image_ecran(os.path.join(DOSSIER_DATA, "Logo_.png"))
 
         # chargement des 6 images de chargement dans la variable
         for i in range(1, 7):
             chemin = os.path.join(DOSSIER_DATA, "chargement", f"{i}.png")
-            if os.path.exists(chemin):
-                self.frames_chargement.append(arcade.load_texture(chemin))
+            if ressources.existe(chemin):
+                self.frames_chargement.append(ressources.charger(chemin))
             else:
                 # texture de secours si fichier manquant
                 self.frames_chargement.append(arcade.make_soft_square_texture(50, arcade.color.WHITE))
 
+        # envoyer les images a la carte graphique avant le chargement (pas pendant)
+        for tex in [self.logo] + self.frames_chargement:
+            self.window.ctx.default_atlas.add(tex)
+
     def on_update(self, delta_time):
         self.timer += delta_time
-        self.temp_anim += delta_time
-        if self.temp_anim > 0.1:
-            self.indice_chargement += 1
-            if self.indice_chargement > 6: self.indice_chargement = 1
-            self.temp_anim = 0
+        # attendre que l'ecran soit affiche une fois avant de commencer
+        if not self.deja_dessine:
+            return
 
-        if self.timer > 2.5: # temps de chargement
-            vue = self.vue_suivante_class()
-            if hasattr(vue, "setup"): vue.setup()
-            self.window.show_view(vue)
+        if self.vue is None:
+            self.vue = self.vue_suivante_class()
+            if hasattr(self.vue, "chargement"):
+                self.chargement = self.vue.chargement()
+            elif hasattr(self.vue, "setup"):
+                self.vue.setup()
+
+        if self.chargement is not None:
+            fini = self.chargement.avancer()
+            self.progression = self.chargement.progression
+            if not fini:
+                return
+        demarrage.rapport(f"chargement de {type(self.vue).__name__}")
+        self.window.show_view(self.vue)
 
     def on_draw(self):
         self.clear()
+        self.deja_dessine = True
         arcade.draw_rect_filled(arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2, LARGEUR, HAUTEUR), arcade.color.BLACK)
         
         # logo echelle 0 5 plus petit avec pulsation
@@ -89,10 +96,17 @@ class EcranChargementView(arcade.View):
         arcade.draw_texture_rect(self.logo, arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2 + 80, 
                                  self.logo.width * echelle, self.logo.height * echelle))
         
-        # animation du petit chargement
+        # la fleur tourne avec la progression (4 tours sur tout le chargement)
+        self.indice_chargement = int(self.progression * 24) % 6 + 1
         tex = self.frames_chargement[self.indice_chargement - 1]
         arcade.draw_texture_rect(tex, arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2 - 120, 120, 120))
 
+        # barre de progression
+        if self.chargement is not None:
+            arcade.draw_rect_outline(arcade.rect.XYWH(LARGEUR//2, HAUTEUR//2 - 200, 304, 14), arcade.color.WHITE, 2)
+            arcade.draw_rect_filled(arcade.LBWH(LARGEUR//2 - 150, HAUTEUR//2 - 205, 300 * self.progression, 10), arcade.color.YELLOW)
+
+@demarrage.mesure
 class MenuAideView(arcade.View):
     def __init__(self):
         super().__init__()
@@ -119,6 +133,7 @@ class MenuAideView(arcade.View):
     def on_mouse_press(self, x, y, button, modifiers):
         self.window.show_view(MenuPrincipalView())
 
+@demarrage.mesure
 class MenuPrincipalView(arcade.View):
     def __init__(self):
         super().__init__()
@@ -135,10 +150,11 @@ class MenuPrincipalView(arcade.View):
 
         # chemins des images
         try:
-            self.fond = arcade.load_texture(os.path.join(DOSSIER_DATA, "intro", "image 1.1.png"))
-            self.logo = arcade.load_texture(os.path.join(DOSSIER_DATA, "Logo_.png"))
-            self.btn_jouer = arcade.load_texture(os.path.join(DOSSIER_DATA, "jouer.png"))
-            self.btn_aide = arcade.load_texture(os.path.join(DOSSIER_DATA, "aide.png"))
+            # images sans hit box, gardees si on revient au menu
+            self.fond = ressources.image_ecran(os.path.join(DOSSIER_DATA, "intro", "image 1.1.png"))
+            self.logo = ressources.image_ecran(os.path.join(DOSSIER_DATA, "Logo_.png"))
+            self.btn_jouer = ressources.image_ecran(os.path.join(DOSSIER_DATA, "jouer.png"))
+            self.btn_aide = ressources.image_ecran(os.path.join(DOSSIER_DATA, "aide.png"))
         except:
             # securite si les images ne sont pas encore creees
             self.fond = arcade.make_soft_square_texture(LARGEUR, arcade.color.BLACK)
@@ -191,6 +207,7 @@ class MenuPrincipalView(arcade.View):
         h_aide = self.h_btn_base * scale_aide
         arcade.draw_texture_rect(self.btn_aide, arcade.rect.XYWH(self.x_btn, self.y_aide, w_aide, h_aide))
         arcade.draw_text("", self.x_btn, self.y_aide, arcade.color.WHITE, int(20 * scale_aide), bold=True, anchor_x="center", anchor_y="center")
+        demarrage.premiere_image()
 
     def on_mouse_press(self, x, y, button, modifiers):
         if button == arcade.MOUSE_BUTTON_LEFT:
@@ -213,14 +230,13 @@ class MenuPrincipalView(arcade.View):
             vue_jeu.setup()
             self.window.show_view(vue_jeu)
 
+@demarrage.mesure
 class CinematiqueView(arcade.View):
     def __init__(self):
         super().__init__()
         self.scene_actuelle = 1
         self.timer_animation = 0
-        chemin_musique = os.path.join(DOSSIER_DATA, "sounds", "FLOIOIDE_bossfight_1.mp3")
-        self.musique_fond = arcade.load_sound(chemin_musique)
-        self.lecteur_musique = arcade.play_sound(self.musique_fond, volume=0.5, loop=True)
+        audio.musique("combat", volume=0.5)
 
         
 
@@ -243,22 +259,36 @@ class CinematiqueView(arcade.View):
         self.texte_affiche = ""
         self.index_lettre = 0
         self.timer_texte = 0
+
+        # 2 images par scene (anime), decodees sur un thread pendant la scene d'avant
+        chemin = os.path.join(DOSSIER_DATA, "intro")
+        self.flux = FluxImages([os.path.join(chemin, f"image {scene}.{i}.png") for scene in range(1, 13) for i in (1, 2)])
+        self.flux.afficher(0, 2)
+
+    def chargement(self):
+        """ l'ecran de chargement attend que la premiere scene soit decodee """
+        return Chargement([Etape("images", self.attendre_scene)])
+
+    def attendre_scene(self):
+        while not (self.flux.pret(0) and self.flux.pret(1)):
+            yield
         self.charger_scene()
 
     def charger_scene(self):
-        # construction des chemins des images en alternance (anime)
-        chemin = os.path.join(DOSSIER_DATA, "intro")
-        nom1 = f"image {self.scene_actuelle}.1.png"
-        nom2 = f"image {self.scene_actuelle}.2.png"
-        
-        self.img1 = arcade.load_texture(os.path.join(chemin, nom1))
-        self.img2 = arcade.load_texture(os.path.join(chemin, nom2))
+        # images en alternance de la scene (deja decodees par le flux)
+        debut = (self.scene_actuelle - 1) * 2
+        self.flux.afficher(debut, debut + 2)
+        self.img1 = self.flux.image(debut)
+        self.img2 = self.flux.image(debut + 1)
         self.texture_active = self.img1
         
         self.texte_affiche = ""
         self.index_lettre = 0
 
     def on_update(self, delta_time):
+        # envoyer a la carte graphique une image de la scene suivante
+        self.flux.envoyer()
+
         # animation de l alternance entre les images 1 et 2
         self.timer_animation += delta_time
         if self.timer_animation > 0.5:
@@ -281,7 +311,7 @@ class CinematiqueView(arcade.View):
         # sinon dessiner la texture avec les coordonnees simples
         
         # dessiner une texture sur tout ecran
-        arcade.draw_texture_rect(
+        self.flux.dessiner(
             self.texture_active, 
             arcade.LBWH(0, 0, LARGEUR, HAUTEUR) # lbwh left bottom width height
         )
@@ -310,16 +340,20 @@ class CinematiqueView(arcade.View):
                 self.charger_scene()
             else:
                 # 1 arreter la musique de intro
-                arcade.stop_sound(self.lecteur_musique)
+                audio.arreter_musique()
+                self.flux.fermer()
                 
                 # 2 lancer ecran de chargement
                 # ne pas faire game view setup ici
                 chargement = EcranChargementView(MonJeu) 
                 self.window.show_view(chargement)
 
+@demarrage.mesure
 class MonJeu(arcade.View):
-    def __init__(self, mode_dev=False):
-        super().__init__()
+    def __init__(self, mode_dev=False, fenetre=None, entrees=None):
+        super().__init__(fenetre)
+        # sans fenetre (voir simulation.py) : rien n'est envoye a la carte graphique
+        self.rendu = getattr(self.window, "rendu", True)
         
 
         self.timer_general = 0.0
@@ -332,25 +366,20 @@ class MonJeu(arcade.View):
 
         self.etat = "MENU"
 
-        # boutons pause et mort
-        self.btn_pause_jeu = arcade.Sprite(os.path.join(CHEMIN_BASE, "data", "pause.png"), scale=0.5)
-        self.btn_pause_jeu.center_x = LARGEUR - 40
-        self.btn_pause_jeu.center_y = HAUTEUR - 40
-        
-        self.btn_reprendre = arcade.Sprite(os.path.join(CHEMIN_BASE, "data", "reprendre.png"), center_x=LARGEUR//2, center_y=HAUTEUR//2 + 50, scale=0.5)
-        self.btn_menu = arcade.Sprite(os.path.join(CHEMIN_BASE, "data", "menue.png"), center_x=LARGEUR//2, center_y=HAUTEUR//2 - 50, scale=0.5)
-        self.btn_aide = arcade.Sprite(os.path.join(CHEMIN_BASE, "data", "aide.png"), center_x=LARGEUR//2, center_y=HAUTEUR//2 - 150, scale=0.5)
-        self.btn_rejouer = arcade.Sprite(os.path.join(CHEMIN_BASE, "data", "rejouer.png"), center_x=LARGEUR//2, center_y=HAUTEUR//2 + 50, scale=0.5)
+        # boutons pause et mort : crees par charger_images
+        self.btn_pause_jeu = None
+        self.btn_reprendre = None
+        self.btn_menu = None
+        self.btn_aide = None
+        self.btn_rejouer = None
 
         self.mode_dev = mode_dev
 
         self.interface_dev = InterfaceDev()
 
-        self.camera_sprites = arcade.camera.Camera2D()
-        self.camera_gui = arcade.camera.Camera2D()
-        self.camera_bg = arcade.camera.Camera2D()
-
-        self.lecteur_musique = None
+        self.camera_sprites = self.nouvelle_camera()
+        self.camera_gui = self.nouvelle_camera()
+        self.camera_bg = self.nouvelle_camera()
 
         self.mouse_world_x = 0
         self.mouse_world_y = 0
@@ -373,11 +402,18 @@ class MonJeu(arcade.View):
             "attaques": arcade.SpriteList()
         }
         
-        self.tiroirs["projectiles_joueur"] = arcade.SpriteList()
+        # tous les projectiles en tableaux, un pool par type (voir projectiles.py)
+        self.projectiles = Projectiles()
+        self.tiroirs["projectiles_joueur"] = self.projectiles.liste("balle")
 
         self.ennemis = arcade.SpriteList()
-        self.projectiles_ennemis = arcade.SpriteList()
         self.tiroirs["ennemis"] = self.ennemis
+        # etat des mobs des zones en tableaux, les sprites de self.ennemis servent au dessin (voir mobs.py)
+        self.mobs = GestionnaireMobs()
+        # coups du tick : trouves en phase collisions, appliques en phase degats (voir degats.py)
+        self.collisions = Collisions()
+        # entites mises a jour moins souvent loin de la camera (voir proximite.py)
+        self.proximite = Proximite()
 
         # variables pour gerer le systeme de boss
         self.boss_actif = False
@@ -389,9 +425,9 @@ class MonJeu(arcade.View):
         self.fleur = None
         self.physique = None
         self.inputs = InputHandler()
-        self.hud = HUD()
-        self.camera_jeu = arcade.camera.Camera2D()
-        self.camera_gui = arcade.camera.Camera2D()
+        self.hud = None   # charge par etapes_chargement
+        self.camera_jeu = self.nouvelle_camera()
+        self.camera_gui = self.nouvelle_camera()
         
         self.temps_depuis_dernier_mob = 0
 
@@ -400,15 +436,6 @@ class MonJeu(arcade.View):
         # si timer general utiliser
         self.timer_spawn = 0.0
         
-        chemin_musique = os.path.join(DOSSIER_DATA, "sounds", "FLOIOIDE_bossfight_1.mp3")
-        self.musique_fond = arcade.load_sound(chemin_musique)
-
-        self.lecteur_musique = None
-
-        self.son_saut = arcade.load_sound(os.path.join(DOSSIER_DATA, "sounds", "saut.wav"))
-        self.son_pas = arcade.load_sound(os.path.join(DOSSIER_DATA, "sounds", "deplacement.ogg"))
-        self.lecteur_pas = None 
-
         self.cooldown_shop = 0.0
 
         self.show_debug = False
@@ -419,145 +446,274 @@ class MonJeu(arcade.View):
 
         self.timer_soin_fontaine = 0
 
-        self.shop = InterfaceShop()
+        self.shop = None   # charge par etapes_chargement
         self.chat = Chat()
 
         self.timer_spawn = 0
 
-        self.camera_jeu = arcade.camera.Camera2D() # pour le monde
-        self.camera_gui = arcade.camera.Camera2D() # pour interface
+        self.camera_jeu = self.nouvelle_camera() # pour le monde
+        self.camera_gui = self.nouvelle_camera() # pour interface
 
-        self.window.ctx.default_filter = (arcade.gl.NEAREST, arcade.gl.NEAREST)
+        if self.rendu:
+            self.window.ctx.default_filter = (arcade.gl.NEAREST, arcade.gl.NEAREST)
 
         self.timer_vie_air = 10.0
 
-        self.boss_fin_spawned = False
-        self.boss_dvd_spawned = False
         self.etat_precedent = "JEU"
         self.fleur_dernier_coup_timer = 0.0
 
-    def setup(self):    
-
-        self.camera_sprites = arcade.camera.Camera2D()
-        self.camera_gui = arcade.camera.Camera2D()
-
-        # dezoom 0 5 pour voir plus large
-        self.camera_jeu.zoom = 0.7
+        # monde simule par ticks fixes, dessine entre deux ticks (voir pas_fixe.py)
+        self.pas_fixe = PasFixe(PAS_SIMULATION, MAX_PAS_PAR_FRAME)
+        self.interpolation = Interpolation(SAUT_INTERPOLATION)
+        # systemes du tick ranges par phase (voir planificateur.py)
+        self.planificateur = Planificateur()
+        self.ranger_systemes()
+        # partie enregistree ou rejouee (voir enregistrement.py)
+        self.entrees = entrees if entrees is not None else enregistrement.depuis_environnement(mode_dev)
+
+    def nouvelle_camera(self):
+        """ camera d'arcade, ou simple position et zoom sans carte graphique """
+        if self.rendu:
+            return arcade.camera.Camera2D()
+        return self.window.nouvelle_camera()
+
+    def setup(self):
+        """ configuration initiale du niveau et du spawn (tout d'un coup, mode dev) """
+        self.charger_niveau()
+        self.reinitialiser()
+
+    def charger_niveau(self):
+        """ parties fixes du niveau chargees une seule fois : carte, decor, zones, murs, pnj """
+        Chargement(self.etapes_chargement()).executer()
+
+    def chargement(self):
+        """ niveau puis depart de la partie, avance frame par frame par EcranChargementView """
+        return Chargement(self.etapes_chargement() + [Etape("depart", self.reinitialiser)])
+
+    def etapes_chargement(self):
+        """ decodage sur le thread de chargement, envois a la carte graphique sur le thread principal
+        poids : duree relative de chaque etape pour la barre de progression
+        sans rendu : seulement ce dont le monde a besoin (carte, hit box, murs, zones) """
+        if not self.rendu:
+            return [
+                Etape("carte", self.charger_carte),
+                Etape("images", self.charger_images),
+                Etape("murs", self.charger_murs),
+                Etape("scene", self.creer_scene_simulee),
+            ]
+        return [
+            Etape("carte", self.charger_carte, sur_thread=True, poids=1),
+            Etape("images", self.charger_images, sur_thread=True, poids=12),
+            Etape("sons", self.charger_sons, sur_thread=True, poids=1),
+            Etape("murs", self.charger_murs, sur_thread=True, poids=1),
+            Etape("scene", self.creer_scene, poids=1),
+            Etape("decor", self.creer_decor, poids=2),
+            Etape("atlas", lambda: ressources.envoyer(self.window.ctx.default_atlas), poids=1),
+        ]
 
-        """ configuration initiale du niveau et du spawn """
+    def charger_carte(self):
         # 1 chargement map tiled
+        # lue depuis le cache binaire (recompile si map.tmj a change)
         map_path = os.path.join(DOSSIER_MAPS, "map.tmj")
-        nom_murs = "hit-box" 
-        
-        layer_options = {nom_murs: {"use_spatial_hash": True}}
-        self.tile_map = arcade.load_tilemap(map_path, scaling=2.0, layer_options=layer_options)
-        
-        # creer scene unique
-        self.scene = arcade.Scene.from_tilemap(self.tile_map)
-        
+        self.carte = charger_carte(map_path)
+        self.textures_tuiles = TexturesTuiles(self.carte)
 
-        # 2 creation joueur avant le reste
-        self.fleur = Joueur(2026, 1800)
-        self.fleur.scale = 0.5  # changer scale fleur
-        self.fleur.hit_box = HitBox(self.fleur.texture.hit_box_points) # assurer collision
+        # la scene etait dessinee deux fois par frame donc les calques
+        # transparents ressortaient plus opaques : on garde ce rendu en une passe
+        self.opacites = {nom: 1 - (1 - o) ** 2 for nom, o in self.carte.opacites.items() if nom not in VITESSES_PARALLAX}
 
-        # recuperation securisee des calques
-        def charger_calque(nom_tiled, nom_tiroir):
-            if nom_tiled in self.scene:
-                self.tiroirs[nom_tiroir] = self.scene[nom_tiled]
-            else:
-                self.tiroirs[nom_tiroir] = arcade.SpriteList()
+        # scene unique sans les calques de decor
+        self.noms_scene = [nom for nom in self.carte.ordre if nom not in CALQUES_STREAMES + CALQUES_GPU]
 
-        
-        # remplir tiroirs et murs pour physique
-        charger_calque("hit-box", "murs")
-        charger_calque("fontaine", "fontaines")
-        charger_calque("tron", "tron")
-        charger_calque("ver de terre", "trigger_ver")
-        self.boss_ver_spawne = False # empecher double spawn
-        charger_calque("bot", "trigger_robot")
-        self.boss_robot_spawne = False # faire spawn une seule fois
-        # nouvelle liste pour zones attaques robot
-        self.tiroirs["attaques_boss"] = arcade.SpriteList()
-        charger_calque("boss-test", "declencheurs")
-        charger_calque("front", "front")
-        charger_calque("back-ground", "background")
+    def charger_images(self):
+        # tuiles de la scene, des murs et des zones (le calcul des hit box est le plus long)
+        self.textures_tuiles.precharger(self.carte, self.noms_scene + ["hit-box"] + CALQUES_ZONES)
 
-        # initialisation listes entites
-        self.tiroirs["joueur"] = arcade.SpriteList()
-        self.tiroirs["joueur"].append(self.fleur)
-        
-        self.tiroirs["pnj"] = arcade.SpriteList()
+        # images des entites, attaques et boss (plus de lecture de fichier en jeu)
+        ressources.precharger()
+
+        self.hud = HUD()
+        self.shop = InterfaceShop()
+
+        # boutons pause et mort
+        def bouton(nom, x, y):
+            return arcade.Sprite(ressources.charger(os.path.join(DOSSIER_DATA, nom)), center_x=x, center_y=y, scale=0.5)
+        self.btn_pause_jeu = bouton("pause.png", LARGEUR - 40, HAUTEUR - 40)
+        self.btn_reprendre = bouton("reprendre.png", LARGEUR//2, HAUTEUR//2 + 50)
+        self.btn_menu = bouton("menue.png", LARGEUR//2, HAUTEUR//2 - 50)
+        self.btn_aide = bouton("aide.png", LARGEUR//2, HAUTEUR//2 - 150)
+        self.btn_rejouer = bouton("rejouer.png", LARGEUR//2, HAUTEUR//2 + 50)
+
+        # joueur cree une seule fois, reinitialiser remet ensuite ses stats a zero
+        self.fleur = Joueur(2026, 1800)
+        self.fleur.scale = 0.5  # changer scale fleur
 
+        # pnj fixes (marchands)
         coords_pnj = [
             (2765, 2797), (5893, 877), (12373, 2989), 
             (15154, 3949), (18868, 2989), (29084, 2733)
         ]
+        self.pnjs = [PNJ(x, y) for x, y in coords_pnj]
+
+    def charger_sons(self):
+        # bruitages decodes une fois (la musique est lue en flux, voir audio.py)
+        audio.precharger()
+
+    def charger_murs(self):
+        # zones de declenchement fusionnees en rectangles (fontaines, boss, mobs, fin)
+        # chaque boss ne se declenche qu'une fois : son calque est desactive apres le spawn
+        self.zones = IndexZones(self.carte, CALQUES_ZONES, scaling=2.0, textures=self.textures_tuiles)
+
+        # murs : grille de cases solides du calque hit-box (plus de sprites, dessin par shader ou chunks)
+        self.grille_murs = GrilleCollision(self.carte, "hit-box", scaling=2.0, textures=self.textures_tuiles)
+
+        # remplir tiroirs et murs pour physique
+        self.tiroirs["murs"] = self.grille_murs
+
+    def creer_scene(self):
+        """ generateur : un calque de la scene par frame (listes de sprites = opengl) """
+        self.camera_sprites = self.nouvelle_camera()
+        self.camera_gui = self.nouvelle_camera()
+
+        # dezoom 0 5 pour voir plus large
+        self.camera_jeu.zoom = 0.7
+
+        self.scene = arcade.Scene()
+        etapes = remplir_scene(self.scene, self.carte, scaling=2.0, textures=self.textures_tuiles,
+                               noms=self.noms_scene, opacites=self.opacites)
+        for i, _ in enumerate(etapes):
+            yield (i + 1) / len(self.noms_scene)
+
+        # gestion declencheur boss
+        if "test" in self.scene:
+            self.tiroirs["declencheurs"] = self.scene["test"]
+        else:
+            self.tiroirs["declencheurs"] = arcade.SpriteList()
+
+        self.tiroirs["pnj"] = arcade.SpriteList()
+        for pnj in self.pnjs:
+            self.tiroirs["pnj"].append(pnj)
 
         # creer calque murs vide pour eviter crash
         if "murs" not in self.scene:
             self.scene.add_sprite_list("murs")
 
-        # configuration cameras parallax
-        self.camera_bg0 = arcade.camera.Camera2D()
-        self.camera_bg1 = arcade.camera.Camera2D()
-        
-        # recuperer calques et retirer de scene principale pour gerer propre camera
-        try:
-            self.bg_parallax_0 = self.scene.get_sprite_list("font-bouge_0")
-            self.scene.remove_sprite_list_by_name("font-bouge_0")
-        except:
-            self.bg_parallax_0 = arcade.SpriteList()
+        # couche du joueur (remplie a chaque reinitialisation)
+        self.scene.add_sprite_list("Couche_Joueur")
 
-        try:
-            self.bg_parallax_1 = self.scene.get_sprite_list("font-bouge_1")
-            self.scene.remove_sprite_list_by_name("font-bouge_1")
-        except:
-            self.bg_parallax_1 = arcade.SpriteList()
+    def creer_scene_simulee(self):
+        """ scene sans calques de decor ni fonds (rien a dessiner en simulation) """
+        self.camera_jeu.zoom = 0.7 # meme vue qu'en jeu (mises a jour selon la distance)
+        self.scene = arcade.Scene()
+        self.tiroirs["declencheurs"] = arcade.SpriteList()
+        self.tiroirs["pnj"] = arcade.SpriteList()
+        for pnj in self.pnjs:
+            self.tiroirs["pnj"].append(pnj)
+        self.scene.add_sprite_list("Couche_Joueur")
 
-        for x, y in coords_pnj:
-            # passer x y et joueur a pnj pour orientation
-            un_pnj = PNJ(x, y, self.fleur) 
-            self.tiroirs["pnj"].append(un_pnj)
-        
+    def creer_decor(self):
+        """ generateur : tile.png puis un calque du decor par frame envoyes a la carte graphique """
+        # decor statique et fonds parallax dessines par shader (un quad par calque)
+        # sinon (tile.png trop grand pour la carte graphique) il passe par les chunks
+        calques_gpu = CALQUES_GPU if RenduTuilesGPU.disponible(self.window.ctx, self.carte) else []
+        self.rendu_gpu = RenduTuilesGPU(self.window.ctx, self.carte, calques_gpu, scaling=2.0,
+                                        image_tileset=self.textures_tuiles.feuille.image, opacites=self.opacites,
+                                        differe=True)
+
+        # reste du decor charge par chunks autour de la camera
+        calques_chunks = [nom for nom in CALQUES_STREAMES if nom not in self.rendu_gpu]
+        self.chunks = GestionnaireChunks(self.carte, calques_chunks, scaling=2.0,
+                                         textures=self.textures_tuiles, opacites=self.opacites)
+
+        # fonds parallax avec leurs cameras (vitesses dans constantes)
+        rendu_fonds = self.rendu_gpu if all(nom in self.rendu_gpu for nom in VITESSES_PARALLAX) else self.chunks
+        self.parallax = FondParallax(rendu_fonds)
+        yield 0.0
+
+        nb = len(self.rendu_gpu.en_attente)
+        for i, _ in enumerate(self.rendu_gpu.envoyer()):
+            yield (i + 1) / nb
+
+    def reinitialiser(self):
+        """ remet le niveau au depart sans recharger la carte (debut de partie et mort)
+        seuls le joueur, les ennemis, les boss, les projectiles et les timers repartent de zero """
+
+        # 1 joueur (cree au chargement, on remet ses stats a zero)
+        self.fleur.reinitialiser(2026, 1800)
+        # garder la hit box fixe de Joueur : celle de la texture (252 px) deborde
+        # dans les murs du puits de depart et la grille de collision l'en sortirait
+
+        self.tiroirs["joueur"] = arcade.SpriteList()
+        self.tiroirs["joueur"].append(self.fleur)
+
+        self.scene["Couche_Joueur"].clear()
+        self.scene.add_sprite("Couche_Joueur", self.fleur)
+
+        # 2 entites et projectiles (mobs, coups et zones retournent dans leur reserve)
+        for nom in ("attaques", "attaques_boss"):
+            for sprite in list(self.tiroirs.get(nom, [])):
+                sprite.remove_from_sprite_lists()
+        for mob in list(self.ennemis):
+            mob.remove_from_sprite_lists()
+        self.mobs.vider()
+        self.projectiles.vider()
         self.tiroirs["ennemis"] = arcade.SpriteList()
         self.tiroirs["attaques"] = arcade.SpriteList()
         self.tiroirs["projectiles_ennemis"] = arcade.SpriteList()   
         self.tiroirs["tirs_ennemis"] = arcade.SpriteList()
+        self.tiroirs["projectiles_joueur"] = self.projectiles.liste("balle")
+        self.tiroirs["boss"] = arcade.SpriteList()
+        # nouvelle liste pour zones attaques robot
+        self.tiroirs["attaques_boss"] = arcade.SpriteList()
 
-        # ajout a la scene pour dessin
-        self.scene.add_sprite_list("Couche_Joueur")
-        self.scene.add_sprite("Couche_Joueur", self.fleur)
+        # 3 boss et timers
+        self.zones.reinitialiser() # les declencheurs de boss remarchent
+        self.etat_boss_tron = 0
+        self.boss_actif = False
+        self.timer_spawn_mobs = 0.0
+        self.timer_spawn = 0
+        self.timer_spawn_sol = 0.0
+        self.timer_spawn_air = 0.0
+        self.temps_depuis_dernier_mob = 0
+        self.timer_general = 0.0
+        self.invul_timer = 0.0
+        self.fleur_dernier_coup_timer = 0.0
+        self.pas_fixe.vider()
+        self.interpolation.vider()
 
-        # 3 moteur physique en dernier
+        # 4 moteur physique
         # joueur et murs sont prets
-        self.physique = arcade.PhysicsEnginePlatformer(
+        self.physique = MoteurPlateforme(
             self.fleur, 
-            gravity_constant=0.5, 
-            walls=self.tiroirs["murs"]
+            self.tiroirs["murs"],
+            gravity_constant=0.5
         )
 
-        # musique et boss
-        if not self.lecteur_musique:
-            self.lecteur_musique = arcade.play_sound(self.musique_fond, volume=0.5, loop=True)
-        
-        self.boss_actif = False
-        
-        # gestion declencheur boss
-        if "test" in self.scene:
-            self.tiroirs["declencheurs"] = self.scene["test"]
-        else:
-            if "declencheurs" not in self.tiroirs:
-                self.tiroirs["declencheurs"] = arcade.SpriteList()
+        # placer les cameras sur le joueur et charger le decor autour
+        self.camera_jeu.position = self.fleur.position
+        if self.rendu:
+            self.parallax.suivre(self.camera_jeu)
+            self.mettre_a_jour_chunks()
+
+        # musique (continue si deja lancee)
+        audio.musique("combat", volume=0.5)
         
         self.etat = "JEU"
 
+    def mettre_a_jour_chunks(self):
+        """ charge les chunks de decor proches des cameras et libere les autres """
+        cameras = {nom: self.camera_jeu for nom in CALQUES_STREAMES}
+        cameras.update(self.parallax.cameras)
+        self.chunks.mettre_a_jour(cameras)
+
+    @entree
     def on_text(self, text):
         """ fonction appelee par arcade pour clavier """
         # verifier chat actif sans entree ou t au hasard
         if self.chat.actif and text != '\r' and text.isprintable():
             self.chat.texte_saisie += text
 
+    @entree
     def on_key_press(self, key, modifiers):
 
         if key == arcade.key.ESCAPE:
@@ -596,9 +752,10 @@ class MonJeu(arcade.View):
         if key == arcade.key.SPACE and self.physique.can_jump():
             self.fleur.change_y = self.fleur.puissance_saut
 
-        if key == arcade.key.SPACE or key == arcade.key.Z:
+        # le son du saut (espace) est joue avec le double saut plus bas
+        if key == arcade.key.Z:
             if self.physique.can_jump():
-                arcade.play_sound(self.son_saut, volume=0.3)
+                audio.jouer("saut", volume=0.3)
 
         if key == arcade.key.F3:
             self.show_debug = not self.show_debug
@@ -626,12 +783,12 @@ class MonJeu(arcade.View):
             if self.physique.can_jump():
                 self.fleur.change_y = self.fleur.puissance_saut
                 self.fleur.double_saut_dispo = True
-                arcade.play_sound(self.son_saut, volume=0.3)
+                audio.jouer("saut", volume=0.3)
             elif "2_saut.png" in self.fleur.inventaire_charmes and self.fleur.double_saut_dispo:
                 # verifier charme et double saut dispo
                 self.fleur.change_y = self.fleur.puissance_saut
                 self.fleur.double_saut_dispo = False
-                arcade.play_sound(self.son_saut, volume=0.3)
+                audio.jouer("saut", volume=0.3)
 
         # lacher objet
         if key == arcade.key.A and not self.fleur.etat_suppression:
@@ -675,9 +832,11 @@ class MonJeu(arcade.View):
                     if item["qte"] <= 0:
                         self.fleur.inventaire_items[self.fleur.index_selection] = None
 
+    @entree
     def on_key_release(self, key, modifiers):   
         self.inputs.on_key_release(key)
     
+    @entree
     def on_mouse_scroll(self, x: int, y: int, scroll_x: int, scroll_y: int):
         # changer slot avec molette
         if scroll_y > 0:
@@ -685,6 +844,7 @@ class MonJeu(arcade.View):
         elif scroll_y < 0:
             self.fleur.index_selection = (self.fleur.index_selection + 1) % 3
 
+    @entree
     def on_mouse_motion(self, x, y, dx, dy):
         if self.mode_dev:
             self.interface_dev.update_souris(x, y)
@@ -736,6 +896,7 @@ class MonJeu(arcade.View):
             else:
                 pnj.mouse_over = False
 
+    @entree
     def on_mouse_press(self, x, y, button, modifiers):
 
         # clic dans aide ramene ecran precedent
@@ -745,7 +906,7 @@ class MonJeu(arcade.View):
             
         if self.etat == "MORT":
             if self.btn_rejouer.collides_with_point((x, y)):
-                self.setup() # relancer partie de zero
+                self.reinitialiser() # relancer partie sans recharger la carte
             elif self.btn_menu.collides_with_point((x, y)):
                 # creer nouvelle instance menu pour tout reinitialiser
                 menu_view = MenuPrincipalView()
@@ -788,11 +949,7 @@ class MonJeu(arcade.View):
                 vy = y + self.camera_jeu.position.y
                 
                 # creation de la balle
-                balle = ProjectileJoueur(self.fleur.center_x, self.fleur.center_y, vx, vy)
-                
-                # ajouter au tiroir pour afficher
-                if "projectiles_joueur" in self.tiroirs:
-                    self.tiroirs["projectiles_joueur"].append(balle)
+                self.projectiles.tirer("balle", self.fleur.center_x, self.fleur.center_y, vx, vy)
                         
 
         # a si shop deja ouvert
@@ -868,85 +1025,75 @@ class MonJeu(arcade.View):
                 self.tiroirs["attaques"] = arcade.SpriteList()
             
             # verifier import dossier attaques
-            nouvelle_attaque = EffetAttaque(self.fleur, DOSSIER_ATTAQUES)
+            nouvelle_attaque = EffetAttaque.prendre(self.fleur)
             self.tiroirs["attaques"].append(nouvelle_attaque)
 
+    def listes_interpolees(self):
+        """ sprites qui bougent, dessines entre deux ticks """
+        noms = ["joueur", "pnj", "ennemis", "boss", "projectiles_ennemis", "attaques", "attaques_boss"]
+        return [self.tiroirs[nom] for nom in noms if nom in self.tiroirs] + [self.ennemis] + self.projectiles.listes()
+
     def on_update(self, delta_time):
+        """ avance le monde d'autant de ticks fixes que le temps ecoule en contient """
+        # 1 calcul fps pour menu f3 (vraies frames, pas les ticks)
+        if delta_time > 0:
+            self.fps = 1 / delta_time
+
+        # rejeu : evenements en attente, meme en pause (voir enregistrement.py)
+        if self.entrees is not None:
+            self.entrees.frame(self, delta_time)
 
         if self.etat != "JEU":
+            self.pas_fixe.vider()
             return
+
+        for _ in range(self.pas_fixe.ticks(delta_time)):
+            self.interpolation.memoriser(self.listes_interpolees())
+            self.simuler(PAS_SIMULATION)
+            # mort, pause ou fin du jeu pendant le tick
+            if self.etat != "JEU" or self.window.current_view is not self:
+                break
+
+    def simuler(self, delta_time):
+        """ un tick du monde (delta_time vaut toujours PAS_SIMULATION)
+        chaque systeme tourne une fois, phase par phase (voir planificateur.py) """
+        if self.entrees is not None:
+            self.entrees.avant_tick(self)
+        if self.etat != "JEU":
+            return
+        if self.entrees is not None:
+            self.entrees.debut_tick(self)
             
         # detection mort joueur
         if self.fleur.vie <= 0:
             self.etat = "MORT"
             return
 
-        # faire defiler frames de attaque
-        if "attaques" in self.tiroirs:
-            self.tiroirs["attaques"].update() # appeler update de effet attaque
-            self.tiroirs["attaques"].update_animation(delta_time)
-
-        self.chat.update(delta_time)
-
-        # 1 calcul fps pour menu f3
-        if delta_time > 0:
-            self.fps = 1 / delta_time
-
-        # 2 centrage camera
-        # calculer position camera pour centrer joueur
-        target_x = self.fleur.center_x - LARGEUR / 2
-        target_y = self.fleur.center_y - HAUTEUR / 2
-        
-        # recuperer taille map pour cacher le vide
-        map_width = self.tile_map.width * self.tile_map.tile_width
-        map_height = self.tile_map.height * self.tile_map.tile_height
-        
-        # bloquer camera aux bords de la map
-        target_x = max(0, min(target_x, map_width - LARGEUR))
-        target_y = max(0, min(target_y, map_height - HAUTEUR))
-        
-        # appliquer position a camera jeu
-        self.camera_sprites.position = (target_x, target_y)
-        
-        # mise a jour cameras parallax axe x uniquement
-        # fond bouge vite si chiffre proche de 1 0
-        # fond lent si chiffre proche de 0
-        # mise a jour cameras parallax
-        vitesse_fond_proche = 0.85  # fond qui bouge 0
-        vitesse_fond_loin = 0.60    # fond qui bouge 1
-
-        # changer x pour vitesse et forcer y a suivre camera jeu
-        self.camera_bg0.position = (self.camera_jeu.position.x * vitesse_fond_proche, self.camera_jeu.position.y)
-        self.camera_bg1.position = (self.camera_jeu.position.x * vitesse_fond_loin, self.camera_jeu.position.y)
-
-        # utiliser calque murs pour eviter blocage
-        murs = self.scene.get_sprite_list("murs")
-        do_separation = False  # changer nom pour eviter conflit
-        if "murs" in self.scene:
-            murs = self.scene["murs"]
-            do_separation = True
-
-        
-
-        # regeneration fontaine
-        # logique des fontaines
-        # verifier collision a chaque frame
-        fontaines_touchees = arcade.check_for_collision_with_list(self.fleur, self.tiroirs["fontaines"])
-
-        if fontaines_touchees:
-            # regeneration eau
-            if self.fleur.eau < self.fleur.eau_max:
-                self.fleur.eau += 20 * delta_time  # ajuster vitesse 20 par seconde
-                if self.fleur.eau > self.fleur.eau_max:
-                    self.fleur.eau = self.fleur.eau_max
-
-            # regeneration vie
-            if self.fleur.vie < self.fleur.vie_max:
-                self.fleur.vie += 5 * delta_time   # ajuster vitesse 5 par seconde
-                if self.fleur.vie > self.fleur.vie_max:
-                    self.fleur.vie = self.fleur.vie_max
-
-
+        # arreter le tick si la fin du jeu a ete lancee
+        self.planificateur.tick(delta_time, arret=lambda: self.window.current_view is not self)
+
+    def ranger_systemes(self):
+        """ systemes du tick dans l'ordre des phases """
+        p = self.planificateur
+        p.ajouter("entrees", self.systeme_declencheurs, self.systeme_controles)
+        p.ajouter("ia", self.systeme_proximite, self.systeme_ennemis_anciens, self.systeme_zones_boss, self.systeme_boss)
+        p.ajouter("physique", self.systeme_physique_joueur, self.systeme_mobs, self.systeme_projectiles, self.systeme_camera)
+        p.ajouter("collisions", self.systeme_collisions, self.systeme_rebonds, self.systeme_pnj)
+        p.ajouter("degats", self.systeme_degats, self.systeme_fontaines)
+        p.ajouter("apparitions", self.systeme_boss_zones, self.systeme_apparition_mobs)
+        p.ajouter("animation", self.systeme_animations)
+        p.ajouter("nettoyage", self.systeme_timers, self.systeme_nettoyage)
+
+    # separateur
+    # entrees
+    # separateur
+
+    def systeme_declencheurs(self, delta_time):
+        # zones sous le joueur en debut de tick, une seule fois (entrees et sorties)
+        self.zones.mettre_a_jour(self.fleur)
+
+    def systeme_controles(self, delta_time):
+        # dash en cours (vaut pour tout le tick)
         est_en_train_de_dasher = self.fleur.timer_dash > 6.8 
         self.fleur.en_dash = est_en_train_de_dasher
 
@@ -959,362 +1106,346 @@ class MonJeu(arcade.View):
             # mode vol noclip
             self.fleur.change_x = direction_horizontale * vitesse * 2 # plus rapide en vol
             self.fleur.change_y = direction_verticale * vitesse * 2
-            self.fleur.center_x += self.fleur.change_x
-            self.fleur.center_y += self.fleur.change_y
-            # ignorer update physique et escalade normale
-        else:
-
-            # declenchement dash
-            if self.inputs.shift and self.fleur.timer_dash <= 0 and self.fleur.eau >= 10:
-                self.fleur.eau -= 10
-                self.fleur.timer_dash = 7.0
-                self.fleur.change_y = 0 
-
-            if est_en_train_de_dasher:
-                vitesse = VITESSE_DASH
-                self.fleur.change_y = 0 
-                if direction_horizontale == 0:
-                    direction_horizontale = -1 if self.fleur.flipped_horizontally else 1
-            
-            self.fleur.change_x = direction_horizontale * vitesse
-
-            # 4 gestion sens du sprite flip
-            if self.fleur.change_x < 0:
-                self.fleur.flipped_horizontally = True
-            elif self.fleur.change_x > 0:
-                self.fleur.flipped_horizontally = False
-
-            # 5 physique et escalade
-            if est_en_train_de_dasher:
-                # mode dash mouvement simple a travers murs
-                self.fleur.center_x += self.fleur.change_x
-                if arcade.check_for_collision_with_list(self.fleur, self.tiroirs["murs"]):
-                    self.fleur.center_x -= self.fleur.change_x
-            else:
-                # systeme escalade simplifie
-                self.fleur.en_escalade = False 
-                if direction_horizontale != 0:
-                    # tester presence mur a 2 pixels
-                    self.fleur.center_x += (direction_horizontale * 2)
-                    contact_mur = arcade.check_for_collision_with_list(self.fleur, self.tiroirs["murs"])
-                    self.fleur.center_x -= (direction_horizontale * 2) # remettre joueur en place
-                    
-                    if contact_mur:
-                        self.fleur.en_escalade = True
-
-                # application de la physique
-                if self.fleur.en_escalade:
-                    self.fleur.change_x = 0
-                    self.fleur.change_y = VITESSE_MARCHE
-                    self.fleur.center_y += self.fleur.change_y
-                    if arcade.check_for_collision_with_list(self.fleur, self.tiroirs["murs"]):
-                        self.fleur.center_y -= self.fleur.change_y # annuler le mouvement
-                        self.fleur.en_escalade = False
-                else:
-                    # gravite et sauts normaux si pas escalade
-                    self.physique.update()
-
-        # 6 animations et camera
-        self.fleur.update_animation(delta_time)
-        self.camera_jeu.position = (self.fleur.center_x, self.fleur.center_y)
-        self.camera_jeu.position = self.fleur.position
-
-        # 7 logique de jeu collisions pluie ennemis
-        gerer_collisions(self.tiroirs) 
-
-        # 8 sons de pas
-        if abs(self.fleur.change_x) > 0.1 and self.physique.can_jump() and not est_en_train_de_dasher:
-            if not self.lecteur_pas:
-                self.lecteur_pas = arcade.play_sound(self.son_pas, volume=0.1, loop=True)
-        else:
-            if self.lecteur_pas:
-                arcade.stop_sound(self.lecteur_pas)
-                self.lecteur_pas = None
-
-        self.tiroirs["ennemis"].update_animation(delta_time)
-
-        # gestion des degats
-        self.timer_degats += delta_time
-        
-        # recuperer liste ennemis touchant fleur
-        ennemis_proches = arcade.check_for_collision_with_list(self.fleur, self.tiroirs["ennemis"])
-
-        # mise a jour ennemis et logiques
-        # creer liste projectiles si inexistante
-        if "projectiles_ennemis" not in self.tiroirs:
-            self.tiroirs["projectiles_ennemis"] = arcade.SpriteList()
+            return
 
+        # declenchement dash
+        if self.inputs.shift and self.fleur.timer_dash <= 0 and self.fleur.eau >= 10:
+            self.fleur.eau -= 10
+            self.fleur.timer_dash = 7.0
+            self.fleur.change_y = 0 
+
+        if est_en_train_de_dasher:
+            vitesse = VITESSE_DASH
+            self.fleur.change_y = 0 
+            if direction_horizontale == 0:
+                direction_horizontale = -1 if self.fleur.flipped_horizontally else 1
+        
+        self.fleur.change_x = direction_horizontale * vitesse
+
+        # 4 gestion sens du sprite flip
+        if self.fleur.change_x < 0:
+            self.fleur.flipped_horizontally = True
+        elif self.fleur.change_x > 0:
+            self.fleur.flipped_horizontally = False
+
+    # separateur
+    # ia
+    # separateur
+
+    def systeme_proximite(self, delta_time):
+        # niveaux de detail du tick, d'apres la camera (mobs des zones comptes dans systeme_mobs)
+        sprites = [*self.tiroirs["ennemis"], *self.tiroirs["boss"], *self.tiroirs.get("pnj", [])]
+        self.proximite.preparer(self.camera_jeu, self.window.width, self.window.height, sprites)
+
+    def systeme_ennemis_anciens(self, delta_time):
+        """ ennemis de tiroirs["ennemis"] (patrouille, tir) : les mobs des zones sont dans self.ennemis """
         for ennemi in self.tiroirs["ennemis"]:
+            if not self.proximite.actif(ennemi):
+                continue
             # mobs terrestres
             if hasattr(ennemi, "logique_sol"):
                 ennemi.logique_sol(self.tiroirs["murs"])
             # mobs volants
             elif hasattr(ennemi, "logique_air"):
                 ennemi.logique_air(self.fleur, self.tiroirs["projectiles_ennemis"])
-            
+            if hasattr(ennemi, "logique_ia"):
+                ennemi.logique_ia(self.fleur, self.tiroirs["tirs_ennemis"])
             ennemi.orienter_vers_joueur(self.fleur)
-            ennemi.update_animation(delta_time)
+            # collision corps a corps : voir degats.py
 
-        # mise a jour listes secondaires
-        if "projectiles_ennemis" in self.tiroirs:
-            self.tiroirs["projectiles_ennemis"].update()
+            # appliquer le mouvement
+            if not getattr(ennemi, "volant", False):
+                ennemi.change_y -= GRAVITE # mobs sol subissent gravite
+            ennemi.center_x += ennemi.change_x
+            ennemi.center_y += ennemi.change_y
 
-        if "attaques" in self.tiroirs:
-            self.tiroirs["attaques"].update()
-            for attaque in self.tiroirs["attaques"]:
-                if hasattr(attaque, "update_animation"):
-                    attaque.update_animation(delta_time)
+    def systeme_zones_boss(self, delta_time):
+        # mise a jour attaques de zones
+        self.tiroirs["attaques_boss"].update(delta_time)
+        
+        # gestion carres rouges devenant attaques
+        for effet in self.tiroirs["attaques_boss"]:
+            if isinstance(effet, ZoneRougeAvertissement):
+                if effet.timer <= 0:
+                    # remplacer par vraie attaque a la fin du timer
+                    vraie_attaque = AttaqueDeZoneBoss.prendre(effet.center_x, effet.center_y, effet.type_attaque, self.fleur)
+                    self.tiroirs["attaques_boss"].append(vraie_attaque)
+                    effet.remove_from_sprite_lists()
+
+    def systeme_boss(self, delta_time):
+        for boss in self.tiroirs["boss"]:
+            if not self.proximite.actif(boss):
+                continue
+            # gravite tir saut (temps des boss : voir constantes.py)
+            boss.update_boss(delta_time * PASSES_PAR_TICK, self.projectiles, self.tiroirs["murs"])
+            
+            # recuperer attaques de zones bossrobot
+            if hasattr(boss, "nouvelles_zones") and boss.nouvelles_zones:
+                for zone in boss.nouvelles_zones:
+                    self.tiroirs["attaques_boss"].append(zone)
+                boss.nouvelles_zones.clear() # vider liste attente
 
-        if self.fleur.vie <= 0:
-            print("Game Over")
-            self.setup() # recommencer le niveau
-        
-        if "pnj" in self.tiroirs:
-            # animations
-            # appeler update animation sur chaque pnj
-            self.tiroirs["pnj"].update_animation(delta_time)
+    # separateur
+    # physique
+    # separateur
 
-            # ouverture du shop
-            # verifier si joueur touche pnj
-            pnj_touches = arcade.check_for_collision_with_list(self.fleur, self.tiroirs["pnj"])
-            
-            if pnj_touches:
-                # ouvrir shop si pnj touche
-                self.shop.ouvert = True
-                # figer joueur pour eviter fuite
-                # bloquer deplacement joueur
+    def systeme_physique_joueur(self, delta_time):
+        if self.fleur.noclip:
+            # ignorer update physique et escalade normale
+            self.fleur.center_x += self.fleur.change_x
+            self.fleur.center_y += self.fleur.change_y
+            return
 
-        # logique des mobs
-        mobs_sol = sum(1 for e in self.tiroirs["ennemis"] if hasattr(e, "volant") and not e.volant)
-        mobs_air = sum(1 for e in self.tiroirs["ennemis"] if hasattr(e, "volant") and e.volant)
+        # 5 physique et escalade
+        direction_horizontale = self.inputs.droite - self.inputs.gauche
+        if self.fleur.en_dash:
+            # mode dash mouvement simple a travers murs
+            self.fleur.center_x += self.fleur.change_x
+            if self.tiroirs["murs"].touche(self.fleur):
+                self.fleur.center_x -= self.fleur.change_x
+        else:
+            # systeme escalade simplifie
+            self.fleur.en_escalade = False 
+            if direction_horizontale != 0:
+                # tester presence mur a 2 pixels
+                self.fleur.center_x += (direction_horizontale * 2)
+                contact_mur = self.tiroirs["murs"].touche(self.fleur)
+                self.fleur.center_x -= (direction_horizontale * 2) # remettre joueur en place
+                
+                if contact_mur:
+                    self.fleur.en_escalade = True
+
+            # application de la physique
+            if self.fleur.en_escalade:
+                self.fleur.change_x = 0
+                self.fleur.change_y = VITESSE_MARCHE
+                self.fleur.center_y += self.fleur.change_y
+                if self.tiroirs["murs"].touche(self.fleur):
+                    self.fleur.center_y -= self.fleur.change_y # annuler le mouvement
+                    self.fleur.en_escalade = False
+            else:
+                # gravite et sauts normaux si pas escalade
+                self.physique.update()
 
-        self.timer_spawn_air += delta_time
-        self.timer_spawn_sol += delta_time
+    def systeme_mobs(self, delta_time):
+        # deplacement, tir et animation des mobs des zones
+        murs = self.tiroirs["murs"]
+        # les mobs empiles sont ecartes dans la meme passe (voir mobs.py)
+        self.mobs.update(delta_time, self.fleur, murs, self.vue_monde(), self.proximite.rectangle())
+        # en dehors du rectangle les mobs sont geles, dedans ils sont mis a jour a chaque tick
+        self.proximite.compter(plein=self.mobs.reveilles, gele=self.mobs.geles)
+
+    def vue_monde(self):
+        """ rectangle du monde (gauche, bas, droite, haut) ou les sprites des mobs
+        et des projectiles sont tenus a jour """
+        cx, cy = self.camera_jeu.position
+        demi_l = self.window.width / 2 / self.camera_jeu.zoom + MARGE_VUE
+        demi_h = self.window.height / 2 / self.camera_jeu.zoom + MARGE_VUE
+        return cx - demi_l, cy - demi_h, cx + demi_l, cy + demi_h
+
+    def limites_monde(self):
+        """ rectangle de la carte : un projectile qui en sort disparait """
+        murs = self.tiroirs["murs"]
+        return 0, 0, murs.largeur * murs.taille_x, murs.hauteur * murs.taille_y
 
-        px = self.fleur.center_x
-        py = self.fleur.center_y
+    def systeme_projectiles(self, delta_time):
+        self.tiroirs["projectiles_ennemis"].update(delta_time)
+        self.tiroirs["tirs_ennemis"].update(delta_time)
+        # balles du joueur, boules des mobs volants, batons et projectiles des boss
+        self.projectiles.update(delta_time, self.vue_monde(), self.limites_monde())
+        self.tiroirs["attaques"].update(delta_time)
 
-        
-        # dessiner barres de vie au dessus chaque mob
-        for ennemi in self.tiroirs["ennemis"]:
-            # 1 appliquer gravite et patrouille
-            ennemi.logique_sol(self.tiroirs["murs"])
-    
-            # 2 tourner mob vers plante
-            ennemi.orienter_vers_joueur(self.fleur)
-    
-            # 3 mettre a jour animation marche
-            ennemi.update_animation(delta_time)
-        
-            if hasattr(ennemi, "logique_ia"):
-                ennemi.logique_ia(self.fleur, self.tiroirs["tirs_ennemis"])
-        
-            # collision corps a corps degats joueur
-            if hasattr(ennemi, "degats_contact") and ennemi.degats_contact > 0:
-                if arcade.check_for_collision(self.fleur, ennemi):
-                    if self.fleur.invul_timer <= 0: # utiliser invulnerabilite si presente
-                        self.fleur.vie -= ennemi.degats_contact
-                        self.fleur.invul_timer = 1.0
-                
-            # appliquer le mouvement
-            if not getattr(ennemi, "volant", False):
-                ennemi.change_y -= GRAVITE # mobs sol subissent gravite
-            ennemi.center_x += ennemi.change_x
-            ennemi.center_y += ennemi.change_y
-            ennemi.update_animation(delta_time)
+    def systeme_camera(self, delta_time):
+        # 2 centrage camera
+        # calculer position camera pour centrer joueur
+        self.camera_sprites.position = (self.fleur.center_x, self.fleur.center_y)
+        self.camera_jeu.position = self.fleur.position
+        # mise a jour cameras parallax axe x uniquement
+        if self.rendu:
+            self.parallax.suivre(self.camera_jeu)
+            self.mettre_a_jour_chunks()
+
+    # separateur
+    # collisions
+    # separateur
+
+    def systeme_collisions(self, delta_time):
+        # tous les contacts qui font des degats, trouves en une passe (voir degats.py)
+        t = self.tiroirs
+        self.collisions.detecter({
+            "joueur": GroupeSprites([self.fleur]),
+            "attaques": GroupeSprites(t["attaques"]),
+            "balles": self.projectiles.pools["balle"],
+            "ennemis": GroupeSprites(t["ennemis"]),
+            "mobs": self.mobs,
+            "boss": GroupeSprites(t["boss"]),
+            "zones_boss": GroupeSprites([z for z in t["attaques_boss"] if isinstance(z, AttaqueDeZoneBoss)]),
+            "projectiles": self.projectiles.ennemis(),
+            "tirs_ennemis": GroupeSprites(t["tirs_ennemis"]),
+        })
+
+    def systeme_rebonds(self, delta_time):
+        # rebond boss dvd sur hit box
+        for boss in self.tiroirs["boss"]:
+            if isinstance(boss, BossDVD):
+                if self.tiroirs["murs"].touche(boss):
+                    # inversion direction pour rebond
+                    boss.recul_x = -boss.change_x * 15 
+                    boss.recul_y = -boss.change_y * 15
+                    boss.recul_timer = 30 
+
+    def systeme_pnj(self, delta_time):
+        # ouverture du shop si le joueur touche un pnj
+        if "pnj" in self.tiroirs:
+            if arcade.check_for_collision_with_list(self.fleur, self.tiroirs["pnj"]):
+                self.shop.ouvert = True
 
-        # mise a jour projectiles ennemis
-        self.tiroirs["tirs_ennemis"].update()
-        for tir in self.tiroirs["tirs_ennemis"]:
-            if arcade.check_for_collision(tir, self.fleur):
-                if getattr(self.fleur, "invulnerable_timer", 0) <= 0:
-                    self.fleur.vie -= tir.degats
-                    self.fleur.invul_timer = 1.0 # 1 seconde de pause avant prochain coup
-                tir.remove_from_sprite_lists()
+    # separateur
+    # degats
+    # separateur
 
-                self.fleur_dernier_coup_timer += delta_time
+    def systeme_degats(self, delta_time):
+        # coups trouves par systeme_collisions : attaques, contacts, projectiles
+        self.collisions.resoudre(self.fleur, self.tiroirs)
 
-        
-        # separateur
-        # logique boss ver de terre
-        # separateur
+    def systeme_fontaines(self, delta_time):
+        if self.zones.dans("fontaine"):
+            # regeneration eau
+            if self.fleur.eau < self.fleur.eau_max:
+                self.fleur.eau += 20 * delta_time  # ajuster vitesse 20 par seconde
+                if self.fleur.eau > self.fleur.eau_max:
+                    self.fleur.eau = self.fleur.eau_max
 
-        if "trigger_ver" in self.tiroirs and not self.boss_ver_spawne:
-            if arcade.check_for_collision_with_list(self.fleur, self.tiroirs["trigger_ver"]):
-                self.boss_ver_spawne = True
-                # spawn a 24492 en x et 1850 en y plus haut
-                boss_ver = BossVerDeTerre(24492, 1970, self.fleur) 
-                
-                if "boss" not in self.tiroirs:
-                    self.tiroirs["boss"] = arcade.SpriteList()
-                self.tiroirs["boss"].append(boss_ver)
-                self.chat.ajouter_message("UN VER GÉANT SORT DE TERRE !", arcade.color.GOLD)
+            # regeneration vie
+            if self.fleur.vie < self.fleur.vie_max:
+                self.fleur.vie += 5 * delta_time   # ajuster vitesse 5 par seconde
+                if self.fleur.vie > self.fleur.vie_max:
+                    self.fleur.vie = self.fleur.vie_max
+
+    # separateur
+    # apparitions
+    # separateur
 
-            if "boss" in self.tiroirs:
-                for boss in self.tiroirs["boss"]:
-                    if hasattr(boss, "vie") and boss.vie <= 0:
-                        boss.remove_from_sprite_lists()
+    def systeme_boss_zones(self, delta_time):
+        """ boss et fin du jeu declenches par les zones de la carte (une fois chacun) """
+        # logique boss ver de terre
+        if self.zones.entre("ver de terre"):
+            self.zones.desactiver("ver de terre") # empecher double spawn
+            # spawn a 24492 en x et 1850 en y plus haut
+            self.tiroirs["boss"].append(BossVerDeTerre(24492, 1970, self.fleur))
+            self.chat.ajouter_message("UN VER GÉANT SORT DE TERRE !", arcade.color.GOLD)
 
-        # separateur
         # logique boss robot
-        # separateur
-        if "trigger_robot" in self.tiroirs and not self.boss_robot_spawne:
-            if arcade.check_for_collision_with_list(self.fleur, self.tiroirs["trigger_robot"]):
-                self.boss_robot_spawne = True
-                boss_robot = BossRobot(9000, 1800, self.fleur) 
-                
-                if "boss" not in self.tiroirs:
-                    self.tiroirs["boss"] = arcade.SpriteList()
-                self.tiroirs["boss"].append(boss_robot)
-                self.chat.ajouter_message("LE BOSS ROBOT DESCEND DU CIEL !", arcade.color.RED)
+        if self.zones.entre("bot"):
+            self.zones.desactiver("bot") # faire spawn une seule fois
+            self.tiroirs["boss"].append(BossRobot(9000, 1800, self.fleur))
+            self.chat.ajouter_message("LE BOSS ROBOT DESCEND DU CIEL !", arcade.color.RED)
 
-        # mise a jour attaques de zones
-        if "attaques_boss" in self.tiroirs:
-            self.tiroirs["attaques_boss"].update()
-            
-            # gestion carres rouges devenant attaques
-            for effet in self.tiroirs["attaques_boss"]:
-                if isinstance(effet, ZoneRougeAvertissement):
-                    if effet.timer <= 0:
-                        # remplacer par vraie attaque a la fin du timer
-                        vraie_attaque = AttaqueDeZoneBoss(effet.center_x, effet.center_y, effet.type_attaque, self.fleur)
-                        self.tiroirs["attaques_boss"].append(vraie_attaque)
-                        effet.remove_from_sprite_lists()
-
-        # separateur
         # logique boss tron
-        # separateur
-        
-        # 1 declenchement boss
-        if "tron" in self.tiroirs and self.etat_boss_tron == 0:
-            if arcade.check_for_collision_with_list(self.fleur, self.tiroirs["tron"]):
-                self.etat_boss_tron = 1
-                # spawn aux coordonnees demandees
-                boss_p1 = BossArbreP1(4000, 2800, self.fleur) 
-                if "boss" not in self.tiroirs: self.tiroirs["boss"] = arcade.SpriteList()
-                self.tiroirs["boss"].append(boss_p1)
-                
-
-        if "boss" in self.tiroirs:
-            for boss in self.tiroirs["boss"]:
-                # envoyer temps au boss
-                boss.update_boss(delta_time, self.tiroirs["projectiles_ennemis"], self.tiroirs["murs"])
+        if self.etat_boss_tron == 0 and self.zones.entre("tron"):
+            self.etat_boss_tron = 1
+            self.zones.desactiver("tron")
+            # spawn aux coordonnees demandees
+            self.tiroirs["boss"].append(BossArbreP1(4000, 2800, self.fleur))
+
+        # spawn boss fin
+        if self.zones.entre("boss fin"):
+            self.tiroirs["boss"].append(BossFin(36391, 2957, self.fleur))
+            self.zones.desactiver("boss fin")
+
+        # spawn boss dvd
+        if self.zones.entre("dvd"):
+            self.tiroirs["boss"].append(BossDVD(33652, 2983, self.fleur))
+            self.zones.desactiver("dvd")
+
+        # fin du jeu (en simulation : le monde s'arrete)
+        if self.zones.entre("ending"):
+            if self.rendu:
+                self.window.show_view(OutroView())
+            else:
+                self.etat = "FIN"
 
-        # 2 gestion pendant le combat
-        elif self.etat_boss_tron == 1:
-            
-            # mise a jour entites boss
-            for boss in self.tiroirs["boss"]:
-                # mettre a jour logique boss gravite tir saut
-                boss.update_boss(delta_time, self.tiroirs["projectiles_ennemis"], self.tiroirs["murs"])
-                
-                # degats de contact pour p2 et p3
-                if hasattr(boss, "degats") and arcade.check_for_collision(self.fleur, boss):
-                    self.fleur.vie -= boss.degats
-                    # recul du joueur
-                    self.fleur.center_x += 40 if self.fleur.center_x > boss.center_x else -40
-
-            # utiliser sprite fleur plutot que spritelist
-            projectiles_touches = arcade.check_for_collision_with_list(self.fleur, self.tiroirs["projectiles_ennemis"])
-        
-            for p in projectiles_touches:
-                self.fleur.vie -= 1  # faire perdre vie au joueur
-                p.remove_from_sprite_lists() # faire disparaitre le baton
-
-            # attaque du joueur sur le boss
-            if "attaques" in self.tiroirs:
-                for attaque in self.tiroirs["attaques"]:
-                    boss_touches = arcade.check_for_collision_with_list(attaque, self.tiroirs["boss"])
-                    for boss in boss_touches:
-                        # gerer degats attaque joueur
-                        boss.vie -= 1 
-                        
-                        # action si le boss meurt
-                        if boss.vie <= 0:
-                            # charger phase suivante si existante
-                            if hasattr(boss, "au_deces"):
-                                nouveaux_mobs = boss.au_deces()
-                                for mob in nouveaux_mobs:
-                                    self.tiroirs["boss"].append(mob)
-                            boss.remove_from_sprite_lists()
-
-            # fin du combat
-            if len(self.tiroirs["boss"]) == 0:
-                print("Le Boss Tron est totalement détruit !")
-                self.etat_boss_tron = 2
-                self.tiroirs["projectiles_ennemis"].clear()
-
-        if "projectiles_ennemis" in self.tiroirs:
-            self.tiroirs["projectiles_ennemis"].update()
+    def systeme_apparition_mobs(self, delta_time):
+        # systeme de spawn par zone
+        if self.timer_spawn_mobs > 0 or not self.zones.dans("mobs"):
+            return
+        px = self.fleur.center_x
+        py = self.fleur.center_y
         
-        # gestion du shop cooldown et collision
-        if self.cooldown_shop > 0:
-            self.cooldown_shop -= delta_time
-
-        # verifier shop ferme et hors cooldown
-        if not self.shop.ouvert and self.cooldown_shop <= 0:
-            # verifier collision joueur pnj
-            pnjs_touches = arcade.check_for_collision_with_list(self.fleur, self.tiroirs.get("pnj", arcade.SpriteList()))
-            for pnj in pnjs_touches:
-                if getattr(pnj, "est_marchand", False):
-                    self.shop.ouvert = True
-                    break # arreter boucle apres ouverture shop
-
-        self.camera_sprites.position = (self.fleur.center_x, self.fleur.center_y)
+        # choix donnees selon axe x
+        if 0 <= px <= 16960: # zone foret
+            s_sol = {"vie": 2, "degats": 10, "drop_hit": 1, "drop_death": 2}
+            t_sol = "foret_sol" # animations dans ressources
+            s_air = {"vie": 2, "degats": 10, "drop_hit": 1, "drop_death": 2}
+            t_air = "foret_air"
+            c_boule = os.path.join(DOSSIER_DATA, "mobs", "foret", "air", "boule_bleue.png")
+        
+        elif 16961 <= px <= 27136: # zone desert
+            s_sol = {"vie": 2, "degats": 10, "drop_hit": 2, "drop_death": 4}
+            t_sol = "desert_sol"
+            s_air = {"vie": 2, "degats": 10, "drop_hit": 2, "drop_death": 3}
+            t_air = "desert_air"
+            c_boule = os.path.join(DOSSIER_DATA, "mobs", "desert", "air", "boule_bleue.png")
+            
+        elif 27137 <= px <= 38320: # zone ville
+            s_sol = {"vie": 2, "degats": 10, "drop_hit": 4, "drop_death": 6}
+            t_sol = "ville_sol"
+            s_air = {"vie": 2, "degats": 10, "drop_hit": 4, "drop_death": 3}
+            t_air = "ville_air"
+            c_boule = os.path.join(DOSSIER_DATA, "mobs", "ville", "air", "boule_bleue.png")
+        else:
+            return
 
-        self.timer_general += delta_time
+        self.timer_spawn_mobs = 30.0 # bloquer spawn pendant 30s
         
-        # mettre a jour balles
-        if "projectiles_joueur" in self.tiroirs:
+        # apparaitre exactement 2 mobs air et 2 sol
+        for _ in range(2):
+            # apparaitre mobs a 300px minimum
+            cote = random.choice([-1, 1])
+            dist_x = random.randint(300, 600)
             
-            for proj in self.tiroirs["projectiles_joueur"]:
-                proj.update_proj(delta_time)
-                # degats aux ennemis et boss
-                listes_cibles = [self.tiroirs.get("ennemis", []), self.tiroirs.get("boss", [])]
-                pour_supprimer = False
-                for liste in listes_cibles:
-                    touches = arcade.check_for_collision_with_list(proj, liste)
-                    for cible in touches:
-                        if hasattr(cible, "vie"): cible.vie -= proj.degats
-                        elif hasattr(cible, "points_de_vie"): cible.points_de_vie -= proj.degats
-                        pour_supprimer = True
-                if pour_supprimer:
-                    proj.remove_from_sprite_lists()
-
-        # 1 orientation ennemis vers joueur
-        for ennemi in self.tiroirs["ennemis"]:
-            if hasattr(ennemi, "orienter_vers_joueur"):
-                ennemi.orienter_vers_joueur(self.fleur)
+            # apparition mob sol
+            m_sol = MobSol.prendre(px + (cote * dist_x), py + 100, self.fleur, s_sol, t_sol, self.mobs)
+            self.ennemis.append(m_sol)
             
-            # appeler logique deplacement pour mobsol
-            if hasattr(ennemi, "logique_sol"):
-                ennemi.logique_sol(self.tiroirs["murs"])
-        
-        # 2 gestion separation ennemis
-        from logic import gerer_separation_mobs
-        gerer_separation_mobs(self.tiroirs["ennemis"], self.tiroirs["murs"])
-
-        # 1 mise a jour projectiles ennemis
-        for proj in self.projectiles_ennemis:
-            proj.update_proj(delta_time)
-            # gerer collision avec joueur
-            if arcade.check_for_collision(proj, self.fleur):
-                self.fleur.vie -= proj.degats
-                proj.remove_from_sprite_lists()
-
-        # 2 mise a jour nouveaux mobs
-        murs = self.tiroirs["murs"]
-        for mob in self.ennemis:
-            if hasattr(mob, "update_mob"):
-                mob.update_mob(delta_time, murs)
-                # gerer collision physique avec joueur
-                if isinstance(mob, MobSol) and arcade.check_for_collision(mob, self.fleur):
-                    # utiliser invul timer pour eviter one shot
-                    self.fleur.vie -= mob.degats
+            # apparition mob air
+            m_air = MobAir.prendre(px + (cote * dist_x), py + 300, self.fleur, s_air, t_air, c_boule, self.projectiles, self.mobs)
+            self.ennemis.append(m_air)
 
-        
-        
-        # a gestion des timers
+    # separateur
+    # animation
+    # separateur
+
+    def systeme_animations(self, delta_time):
+        self.fleur.update_animation(delta_time)
+        for attaque in self.tiroirs["attaques"]:
+            attaque.update_animation(delta_time * PASSES_PAR_TICK)
+        # loin de la camera : animations ralenties ou gelees (voir proximite.py)
+        for ennemi in self.tiroirs["ennemis"]:
+            dt = self.proximite.pas(ennemi, delta_time)
+            if dt is not None:
+                ennemi.update_animation(dt)
+        for pnj in self.tiroirs.get("pnj", []):
+            dt = self.proximite.pas(pnj, delta_time)
+            if dt is not None:
+                pnj.update_animation(dt)
+        self.chat.update(delta_time)
+
+        # sons de pas (coupes seulement apres un court arret, voir audio.py)
+        marche = abs(self.fleur.change_x) > 0.1 and self.physique.can_jump() and not self.fleur.en_dash
+        audio.boucle("pas", marche, delta_time, volume=0.1)
+
+    # separateur
+    # nettoyage
+    # separateur
+
+    def systeme_timers(self, delta_time):
+        self.timer_degats += delta_time
+        self.timer_spawn_air += delta_time
+        self.timer_spawn_sol += delta_time
+        self.timer_general += delta_time
+        if self.cooldown_shop > 0:
+            self.cooldown_shop -= delta_time
         if self.timer_spawn_mobs > 0:
             self.timer_spawn_mobs -= delta_time
             
@@ -1324,174 +1455,48 @@ class MonJeu(arcade.View):
         else:
             self.fleur.alpha = 255
 
-        # b mise a jour mobs et collisions
-        murs = self.scene.get_sprite_list("hit-box") if "hit-box" in self.scene else None
-        
-        for mob in self.ennemis:
-            if hasattr(mob, "update_mob"):
-                mob.update_mob(delta_time, murs)
-            
-            # gestion des degats sur joueur
-            if arcade.check_for_collision(mob, self.fleur):
-                # verifier attribut mob
-                if getattr(mob, "touche_joueur", 0) == 0:
-                    self.fleur.vie -= 10  # perdre 10 pv
-                    mob.touche_joueur = 1 # marquer mob comme ayant touche
-                    mob.timer_touche_joueur = 1.0 # delai de 1s avant prochaine attaque mob
-
-                    # appliquer recul au joueur
-                    direction = 1 if self.fleur.center_x > mob.center_x else -1
-                    self.fleur.center_x += direction * 50
-                    
-                    # destruction si mobsol
-                    if isinstance(mob, MobSol):
-                        mob.remove_from_sprite_lists()
-
-        # c mise a jour projectiles
-        for proj in self.projectiles_ennemis:
-            proj.update_proj(delta_time)
-            # verifier collision boule joueur
-            if arcade.check_for_collision(proj, self.fleur):
-                if self.fleur.invul_timer <= 0:
-                    self.fleur.vie -= 10 # perdre 10 pv
-                    self.fleur.invul_timer = 1.0 # 1 seconde de securite
-                proj.remove_from_sprite_lists()
-
-        # d systeme de spawn par zone
-        if "mobs" in self.scene and self.timer_spawn_mobs <= 0:
-            touches_spawn = arcade.check_for_collision_with_list(self.fleur, self.scene["mobs"])
-            
-            if touches_spawn:
-                px = self.fleur.center_x
-                py = self.fleur.center_y
-                spawn_possible = True
-                
-                # choix donnees selon axe x
-                if 0 <= px <= 16960: # zone foret
-                    s_sol = {"vie": 2, "degats": 10, "drop_hit": 1, "drop_death": 2}
-                    t_sol = [os.path.join(DOSSIER_DATA, "mobs", "foret", "sol", f"spi{i}.png") for i in range(2)]
-                    s_air = {"vie": 2, "degats": 10, "drop_hit": 1, "drop_death": 2}
-                    t_air = [os.path.join(DOSSIER_DATA, "mobs", "foret", "air", f"libu{i}.png") for i in range(4)]
-                    c_boule = os.path.join(DOSSIER_DATA, "mobs", "foret", "air", "boule_bleue.png")
-                
-                elif 16961 <= px <= 27136: # zone desert
-                    s_sol = {"vie": 2, "degats": 10, "drop_hit": 2, "drop_death": 4}
-                    t_sol = [os.path.join(DOSSIER_DATA, "mobs", "desert", "sol", f"sable{i}.png") for i in range(2)]
-                    s_air = {"vie": 2, "degats": 10, "drop_hit": 2, "drop_death": 3}
-                    t_air = [os.path.join(DOSSIER_DATA, "mobs", "desert", "air", f"puce{i}.png") for i in range(2)]
-                    c_boule = os.path.join(DOSSIER_DATA, "mobs", "desert", "air", "boule_bleue.png")
-                    
-                elif 27137 <= px <= 38320: # zone ville
-                    s_sol = {"vie": 2, "degats": 10, "drop_hit": 4, "drop_death": 6}
-                    t_sol = [os.path.join(DOSSIER_DATA, "mobs", "ville", "sol", f"mob_sol.{i}.png") for i in range(1, 6)]
-                    s_air = {"vie": 2, "degats": 10, "drop_hit": 4, "drop_death": 3}
-                    t_air = [os.path.join(DOSSIER_DATA, "mobs", "ville", "air", f"drone{i}.png") for i in range(2)]
-                    c_boule = os.path.join(DOSSIER_DATA, "mobs", "ville", "air", "boule_bleue.png")
-                else:
-                    spawn_possible = False
-
-                if spawn_possible:
-                    self.timer_spawn_mobs = 30.0 # bloquer spawn pendant 30s
-                    
-                    # apparaitre exactement 2 mobs air et 2 sol
-                    for _ in range(2):
-                        # apparaitre mobs a 300px minimum
-                        cote = random.choice([-1, 1])
-                        dist_x = random.randint(300, 600)
-                        
-                        # apparition mob sol
-                        m_sol = MobSol(px + (cote * dist_x), py + 100, self.fleur, s_sol, t_sol)
-                        self.ennemis.append(m_sol)
-                        
-                        # apparition mob air
-                        m_air = MobAir(px + (cote * dist_x), py + 300, self.fleur, s_air, t_air, c_boule, self.projectiles_ennemis)
-                        self.ennemis.append(m_air)
-
-        # e logique combat et collisions
-        gerer_collisions(self.tiroirs)
-        # mise a jour des ennemis
-        murs = self.tiroirs["murs"]
-        for ennemi in self.tiroirs["ennemis"]:
-            ennemi.update_mob(delta_time, murs)
-
-        # reperes divers
-        if do_separation:
-            separer_mobs(self.tiroirs["ennemis"], murs) # appel fonction importee
-
-        # 2 gestion du dash
+        # gestion du dash
         if self.fleur.timer_dash > 0:
             self.fleur.timer_dash -= delta_time
 
-        # empecher superposition des mobs
-        separer_mobs(self.tiroirs["ennemis"], murs)
-    
-        if "boss" in self.tiroirs:
+    def systeme_nettoyage(self, delta_time):
+        # boss morts (retires avant l'arrivee du ver de terre)
+        if "ver de terre" not in self.zones.desactives:
             for boss in self.tiroirs["boss"]:
-                # mise a jour standard
-                boss.update_boss(delta_time, self.tiroirs["projectiles_ennemis"], self.tiroirs["murs"])
-                
-                # recuperer attaques de zones bossrobot
-                if hasattr(boss, "nouvelles_zones") and boss.nouvelles_zones:
-                    for zone in boss.nouvelles_zones:
-                        self.tiroirs["attaques_boss"].append(zone)
-                    boss.nouvelles_zones.clear() # vider liste attente
-
-        # 1 spawn boss fin
-        if not self.boss_fin_spawned:
-            try:
-                if arcade.check_for_collision_with_list(self.fleur, self.scene.get_sprite_list("boss fin")):
-                    if "boss" not in self.tiroirs: self.tiroirs["boss"] = arcade.SpriteList()
-                    self.tiroirs["boss"].append(BossFin(36391, 2957, self.fleur))
-                    self.boss_fin_spawned = True
-            except (KeyError, AttributeError): pass
-
-        # 2 spawn boss dvd
-        if not self.boss_dvd_spawned:
-            try:
-                if arcade.check_for_collision_with_list(self.fleur, self.scene.get_sprite_list("dvd")):
-                    if "boss" not in self.tiroirs: self.tiroirs["boss"] = arcade.SpriteList()
-                    self.tiroirs["boss"].append(BossDVD(33652, 2983, self.fleur))
-                    self.boss_dvd_spawned = True
-            except (KeyError, AttributeError): pass
-
-        # 3 fin du jeu
-        try:
-            if arcade.check_for_collision_with_list(self.fleur, self.scene.get_sprite_list("ending")):
-                self.window.show_view(OutroView())
-        except (KeyError, AttributeError): pass
+                if hasattr(boss, "vie") and boss.vie <= 0:
+                    boss.remove_from_sprite_lists()
 
-        # 4 rebond boss dvd sur hit box
-        try:
-            calque_hitbox = self.scene.get_sprite_list("hit-box")
-            if "boss" in self.tiroirs:
-                for boss in self.tiroirs["boss"]:
-                    if isinstance(boss, BossDVD):
-                        if arcade.check_for_collision_with_list(boss, calque_hitbox):
-                            # inversion direction pour rebond
-                            boss.recul_x = -boss.change_x * 15 
-                            boss.recul_y = -boss.change_y * 15
-                            boss.recul_timer = 30 
-        except (KeyError, AttributeError): pass
+        # mort du joueur : ecran de mort au prochain tick
+        if self.fleur.vie <= 0:
+            print("Game Over")
 
     def on_draw(self):
         # 1 nettoyer ecran
         self.clear()
         
+        # positions entre les deux derniers ticks, remises a la fin du dessin
+        self.interpolation.appliquer(self.listes_interpolees(), self.pas_fixe.alpha)
+        self.camera_jeu.position = self.fleur.position
+        self.parallax.suivre(self.camera_jeu)
+
         # 1 dessin parallax arriere plan
         # dessiner le plus loin en premier
-        self.camera_bg1.use()
-        self.bg_parallax_1.draw()
-        
-        self.camera_bg0.use()
-        self.bg_parallax_0.draw()
+        self.parallax.dessiner()
 
         # 2 couche monde du jeu
         self.camera_jeu.use()
-        self.scene.draw()
-        
-        # dessiner la map
-        if self.scene:
-            self.scene.draw()
+
+        # dessiner la map dans l'ordre des calques tiled
+        for nom in self.carte.ordre:
+            if nom in VITESSES_PARALLAX:
+                continue
+            if nom in self.rendu_gpu:
+                self.rendu_gpu.dessiner(nom)
+            elif nom in self.chunks:
+                self.chunks.dessiner(nom)
+            elif nom in self.scene:
+                self.scene[nom].draw()
+        self.scene["Couche_Joueur"].draw()
 
         # dessiner entites
         # dessin des pnj
@@ -1505,7 +1510,6 @@ class MonJeu(arcade.View):
             self.tiroirs["boss"].draw()
 
         self.ennemis.draw() 
-        self.projectiles_ennemis.draw()
 
         if "boss" in self.tiroirs:
             self.tiroirs["boss"].draw()
@@ -1516,8 +1520,7 @@ class MonJeu(arcade.View):
         if "attaques" in self.tiroirs: self.tiroirs["attaques"].draw()
         if "attaques_boss" in self.tiroirs: self.tiroirs["attaques_boss"].draw()
 
-        if "projectiles_joueur" in self.tiroirs:
-            self.tiroirs["projectiles_joueur"].draw()
+        self.projectiles.draw()
 
         # important joueur a dessiner ici
         # permettre deplacement sur carte
@@ -1541,6 +1544,12 @@ class MonJeu(arcade.View):
         # c debug dans gui
         if self.show_debug:
             debug_txt = f"X: {int(self.fleur.center_x)} Y: {int(self.fleur.center_y)}\nFPS: {int(arcade.get_fps())}"
+            # temps de chaque phase du tick
+            debug_txt += "\n" + "\n".join(self.planificateur.rapport())
+            # objets recycles (voir reserves.py)
+            debug_txt += "\n" + "\n".join(reserves.rapport())
+            debug_txt += "\n" + self.collisions.rapport()
+            debug_txt += "\n" + self.proximite.rapport()
             arcade.draw_text(debug_txt, 20, HAUTEUR - 60, arcade.color.GREEN, 12, multiline=True, width=400)
 
         if self.mode_dev and self.interface_dev.ouvert:
@@ -1633,6 +1642,11 @@ class MonJeu(arcade.View):
                 arcade.draw_text("AIDE", LARGEUR//2, HAUTEUR - 100, arcade.color.WHITE, 40, bold=True, anchor_x="center")
                 arcade.draw_text(texte_aide, LARGEUR//2, HAUTEUR//2, arcade.color.WHITE, 16, anchor_x="center", anchor_y="center", align="center", multiline=True, width=600)
 
+        self.interpolation.retablir()
+        # camera du tick pour les clics et le tick suivant (pas celle du dessin)
+        self.camera_jeu.position = self.fleur.position
+
+@demarrage.mesure
 class OutroView(arcade.View):
     def __init__(self):
         super().__init__()
@@ -1641,25 +1655,39 @@ class OutroView(arcade.View):
         self.timer = 0
         self.quitter_timer = 0
         self.credit_y = 0
-        self.textures = {}
         
         chemin_outro = os.path.join(CHEMIN_BASE, "data", "outro")
-        # charger toutes phases de 1 a 6
+        # images des phases de 1 a 6 a la suite, decodees sur un thread au fur et a mesure
         limites = {1: 1, 2: 1, 3: 1, 4: 3, 5: 1, 6: 19}
+        chemins = []
+        self.phases = {}  # phase -> (premiere image dans le flux, nombre d'images)
         for p, max_f in limites.items():
-            self.textures[p] = []
-            for f in range(max_f + 1):
-                try:
-                    self.textures[p].append(arcade.load_texture(os.path.join(chemin_outro, f"{p}.{f}.png")))
-                except: pass
+            noms = [os.path.join(chemin_outro, f"{p}.{f}.png") for f in range(max_f + 1)]
+            noms = [n for n in noms if os.path.exists(n)]
+            self.phases[p] = (len(chemins), len(noms))
+            chemins += noms
+        self.flux = FluxImages(chemins)
+        self.suivre_images()
+
+    def suivre_images(self):
+        """ dire au flux quelles images sont a l'ecran
+        (toute la phase si elle boucle, l'image actuelle pour la phase 6 jouee une fois) """
+        debut, nombre = self.phases.get(self.phase, (0, 0))
+        if self.phase == 6:
+            self.flux.afficher(debut + self.frame, debut + self.frame + 1)
+        else:
+            self.flux.afficher(debut, debut + nombre)
 
     def on_update(self, delta_time):
         self.timer += delta_time
+        self.suivre_images()
+        self.flux.envoyer()
+        nombre = self.phases.get(self.phase, (0, 1))[1]
         
         # phases 1 2 3 5 en boucle
         if self.phase in [0, 1, 2, 3]:
             if self.timer > 0.5:
-                self.frame = (self.frame + 1) % len(self.textures.get(self.phase, [None]))
+                self.frame = (self.frame + 1) % nombre
                 self.timer = 0
                 
         elif self.phase == 4:
@@ -1672,7 +1700,7 @@ class OutroView(arcade.View):
             # defilement credits de haut en bas
             self.credit_y -= 50 * delta_time 
             if self.timer > 0.5:
-                self.frame = (self.frame + 1) % len(self.textures.get(self.phase, [None]))
+                self.frame = (self.frame + 1) % nombre
                 self.timer = 0
                 
         elif self.phase == 6:
@@ -1687,11 +1715,12 @@ class OutroView(arcade.View):
 
     def on_draw(self):
         self.clear()
-        if self.phase in self.textures and len(self.textures[self.phase]) > self.frame:
-            tex = self.textures[self.phase][self.frame]
+        debut, nombre = self.phases.get(self.phase, (0, 0))
+        if nombre > self.frame:
+            tex = self.flux.image(debut + self.frame)
             # appliquer decalage y pour credits
             y_pos = HAUTEUR // 2 + self.credit_y if self.phase == 5 else HAUTEUR // 2
-            arcade.draw_texture_rect(tex, arcade.rect.XYWH(LARGEUR//2, y_pos, LARGEUR, HAUTEUR))
+            self.flux.dessiner(tex, arcade.rect.XYWH(LARGEUR//2, y_pos, LARGEUR, HAUTEUR))
 
     def on_key_press(self, key, modifiers):
         # appui entree pour phase suivante
@@ -1701,12 +1730,19 @@ class OutroView(arcade.View):
                 self.frame = 0
                 self.timer = 0
                 self.credit_y = 0
+                self.suivre_images()
                 
-def main():
-    window = arcade.Window(LARGEUR, HAUTEUR, TITRE)
+def demarrer():
+    """ fenetre et premier ecran (les autres vues sont creees a la demande) """
+    with demarrage.mesurer("fenetre"):
+        window = arcade.Window(LARGEUR, HAUTEUR, TITRE)
     # lancement menu principal au lieu cinematique
     menu_principal = MenuPrincipalView()
     window.show_view(menu_principal)
+    return window
+
+def main():
+    demarrer()
     arcade.run()
 
 if __name__ == "__main__":
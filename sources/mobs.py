@@ -0,0 +1,388 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# mobs des zones (MobSol, MobAir) ranges en tableaux numpy
+# position, vitesse, vie, timers et type de chaque mob sont une case de tableau :
+# la poursuite du joueur, la gravite, les timers et l'animation de tous les mobs
+# sont calcules d'un coup, sans boucle python par mob
+# les sprites restent pour le dessin et les collisions avec le joueur :
+# - texture, transparence et sens ne sont changes que pour les mobs qui changent
+# - la position n'est recopiee que pour les mobs visibles (la vue de la camera)
+# - les murs sont testes pour tous les mobs d'un coup sur la grille de collision,
+#   avec la hit box du sprite : se poser, se cogner au plafond ou buter
+#   contre un mur pleins donne le meme resultat que les tests sprite par sprite
+# - seuls les mobs pres d'une pente ou coinces (anti_stuck) sont deplaces comme
+#   avant par leur sprite
+# - les mobs qui se chevauchent sont ecartes apres leur mouvement : paires
+#   trouvees par la grille de voisinage (logic.py), poussees additionnees sur
+#   les tableaux, murs testes comme pour le mouvement (sprite pres d'une pente)
+# - les mobs loin de la camera sont geles (voir proximite.py)
+
+import random
+import numpy as np
+from constantes import GRAVITE_ENNEMIS, PASSES_PAR_TICK, VITESSE_MOB, TAILLE_TUILE, FORCE_SEPARATION
+from logic import paires_proches
+
+
+class ChampMob:
+    """ attribut d'un mob range dans un tableau de son gestionnaire
+    (attribut normal tant que le mob n'est pas dans un gestionnaire) """
+
+    def __set_name__(self, owner, nom):
+        self.nom = nom
+
+    def __get__(self, mob, owner=None):
+        if mob is None:
+            return self
+        gestion = mob.__dict__.get("gestion")
+        if gestion is None:
+            return mob.__dict__[self.nom]
+        return gestion.champs[self.nom][mob.indice].item()
+
+    def __set__(self, mob, valeur):
+        gestion = mob.__dict__.get("gestion")
+        if gestion is None:
+            mob.__dict__[self.nom] = valeur
+        else:
+            gestion.champs[self.nom][mob.indice] = valeur
+
+
+# champs visibles par le reste du jeu (ChampMob) et leur type
+CHAMPS = {
+    "vie": np.float64,
+    "invul_timer": np.float64,
+    "touche_joueur": np.int8,
+    "timer_touche_joueur": np.float64,
+    "anim_timer": np.float64,
+    "frame_actuelle": np.int32,
+    "timer_tir": np.float64,
+    "timer_vie_air": np.float64,
+}
+
+# champs internes
+_INTERNES = {
+    "x": np.float64, "y": np.float64,
+    "vx": np.float64, "vy": np.float64,
+    "air": np.bool_,
+    "nb_frames": np.int32,
+    "boites": np.int32,                           # ligne de sa hit box dans la table
+    "sx": np.float64, "sy": np.float64,           # derniere position recopiee dans le sprite
+    "frame_aff": np.int32, "alpha_aff": np.int16, "gauche_aff": np.int8,
+}
+
+
+def _boites(texture, echelle):
+    """ hit box (gauche, bas, droite, haut) autour du centre, vers la droite puis retournee
+    (arcade garde la hit box de la premiere texture, les frames suivantes ne la changent pas) """
+    lignes = []
+    for sx in (echelle, -echelle):
+        xs = [px * sx for px, py in texture.hit_box_points]
+        ys = [py * echelle for px, py in texture.hit_box_points]
+        lignes.append((min(xs), min(ys), max(xs), max(ys)))
+    return lignes
+
+
+class GestionnaireMobs:
+    """ etat de tous les mobs des zones, mis a jour en une fois a chaque tick """
+
+    def __init__(self, capacite=64):
+        self.mobs = []   # sprites, dans l'ordre des tableaux
+        self.champs = {nom: np.zeros(capacite, dtype=t) for nom, t in {**CHAMPS, **_INTERNES}.items()}
+        self._debut_boites = {}   # id de la premiere texture -> premiere ligne dans la table
+        self._lignes_boites = []
+        self.table_boites = np.zeros((0, 4))
+        self._en_cours = False
+        self._a_retirer = []
+        self.reveilles = self.geles = 0   # mobs mis a jour / geles au dernier update, pour le menu F3
+
+    def __len__(self):
+        return len(self.mobs)
+
+    def _agrandir(self):
+        for nom, tab in self.champs.items():
+            self.champs[nom] = np.concatenate([tab, np.zeros_like(tab)])
+
+    def ajouter(self, mob, air):
+        """ range le mob (deja construit) dans les tableaux """
+        i = len(self.mobs)
+        if i == len(self.champs["x"]):
+            self._agrandir()
+        c = self.champs
+        for nom in CHAMPS:
+            c[nom][i] = mob.__dict__.pop(nom, 0)
+        debut = self._debut_boites.get(id(mob.texture))
+        if debut is None:
+            debut = self._debut_boites[id(mob.texture)] = len(self._lignes_boites)
+            self._lignes_boites += _boites(mob.texture, abs(mob.scale_x))
+            self.table_boites = np.array(self._lignes_boites)
+        c["x"][i], c["y"][i] = mob.center_x, mob.center_y
+        c["sx"][i], c["sy"][i] = mob.center_x, mob.center_y
+        c["vx"][i] = c["vy"][i] = 0.0
+        c["air"][i] = air
+        c["nb_frames"][i] = len(mob.textures_anim)
+        c["boites"][i] = debut
+        c["frame_aff"][i] = c["frame_actuelle"][i]
+        c["alpha_aff"][i] = mob.alpha
+        c["gauche_aff"][i] = -1   # sens pas encore choisi
+        mob.gestion = self
+        mob.indice = i
+        self.mobs.append(mob)
+
+    def retirer(self, mob):
+        """ sort le mob des tableaux (ses champs redeviennent des attributs) """
+        if mob.__dict__.get("gestion") is not self:
+            return
+        if self._en_cours:
+            # pendant update : les indices doivent rester valides jusqu'a la fin
+            if mob not in self._a_retirer:
+                self._a_retirer.append(mob)
+            return
+        i = mob.indice
+        valeurs = {nom: self.champs[nom][i].item() for nom in CHAMPS}
+        mob.gestion = None
+        mob.__dict__.update(valeurs)
+        n = len(self.mobs)
+        for tab in self.champs.values():
+            tab[i:n - 1] = tab[i + 1:n]
+        del self.mobs[i]
+        for j in range(i, n - 1):
+            self.mobs[j].indice = j
+
+    def vider(self):
+        for mob in list(self.mobs):
+            self.retirer(mob)
+
+    def update(self, delta_time, joueur, murs, vue, zone=None):
+        """ un tick pour tous les mobs
+        vue : (gauche, bas, droite, haut) du monde visible, seuls ces sprites sont replaces
+        zone : (gauche, bas, droite, haut), les mobs en dehors sont geles (voir proximite.py) """
+        n = len(self.mobs)
+        self.reveilles = self.geles = 0
+        if n == 0:
+            return
+        pas = delta_time * PASSES_PAR_TICK   # temps des mobs pendant ce tick (voir constantes.py)
+        vitesse = VITESSE_MOB * PASSES_PAR_TICK
+        c = {nom: tab[:n] for nom, tab in self.champs.items()}
+        jx, jy = joueur.center_x, joueur.center_y
+        air = c["air"]
+        sol = ~air
+
+        x, y, vx, vy = c["x"], c["y"], c["vx"], c["vy"]
+
+        # mobs loin de la camera : geles, rien ne change pour eux
+        if zone is None:
+            reveilles = np.ones(n, dtype=bool)
+        else:
+            g, b, d, h = zone
+            reveilles = (x >= g) & (x <= d) & (y >= b) & (y <= h)
+        self.reveilles = int(np.count_nonzero(reveilles))
+        self.geles = n - self.reveilles
+
+        # mobs volants en fin de vie : retires sans rien faire d'autre
+        c["timer_vie_air"][air & reveilles] -= pas
+        fini = air & reveilles & (c["timer_vie_air"] <= 0)
+        actifs = reveilles & ~fini
+
+        # invulnerabilite, timer de contact et animation (deux fois pour les volants, comme avant)
+        alpha_bas = self._timers(c, pas, actifs)
+        alpha_bas2 = self._timers(c, pas, actifs & air)
+        alpha_bas = np.where(air, alpha_bas2, alpha_bas)
+
+        # sens, texture et transparence des sprites qui changent
+        gauche = (jx > x).astype(np.int8)
+        alpha = np.where(alpha_bas, 150, 255).astype(np.int16)
+        change = actifs & ((gauche != c["gauche_aff"]) | (c["frame_actuelle"] != c["frame_aff"]) | (alpha != c["alpha_aff"]))
+        for i in np.flatnonzero(change):
+            mob = self.mobs[i]
+            mob.texture = mob.textures_anim[c["frame_actuelle"][i]]
+            mob.alpha = int(alpha[i])
+            # retournement horizontal en gardant la taille
+            mob.scale = (-0.5, 0.5) if gauche[i] else (0.5, 0.5)
+        c["gauche_aff"][change] = gauche[change]
+        c["frame_aff"][change] = c["frame_actuelle"][change]
+        c["alpha_aff"][change] = alpha[change]
+
+        # vitesses : les mobs sol tombent et vont vers le joueur en x
+        m = actifs & sol
+        vy[m] -= GRAVITE_ENNEMIS
+        vx[m] = np.where(jx < x[m], -vitesse, vitesse)
+        # les volants foncent sur le joueur jusqu'a 2 tuiles
+        m = actifs & air
+        dx, dy = jx - x[m], jy - y[m]
+        loin = np.hypot(dx, dy) > TAILLE_TUILE * 2
+        angle = np.arctan2(dy, dx)
+        vx[m] = np.where(loin, np.cos(angle) * vitesse, 0.0)
+        vy[m] = np.where(loin, np.sin(angle) * vitesse, 0.0)
+
+        # mouvement, hit box du sprite autour du centre
+        boite = self.table_boites[c["boites"] + (c["gauche_aff"] == 1)]
+        bg, bb, bd, bh = boite[:, 0], boite[:, 1], boite[:, 2], boite[:, 3]
+        lents = np.zeros(n, dtype=bool)   # pres d'une pente ou coinces : sprite par sprite
+
+        # mobs sol : en x (annule contre un mur), puis en y (pose ou cogne au plafond)
+        nx = x + vx
+        pleines, partielles = murs.compter(nx + bg, y + bb, nx + bd, y + bh)
+        lents |= sol & (partielles > 0)
+        nx = np.where(air | (pleines == 0), nx, nx - vx)
+        ny = y + vy
+        pleines, partielles = murs.compter(nx + bg, ny + bb, nx + bd, ny + bh)
+        lents |= sol & (partielles > 0)
+        ligne = murs.ligne_basse(nx + bg, ny + bb, nx + bd, ny + bh)
+        cogne = sol & (ligne >= 0)
+        ty = murs.taille_y
+        # comme sprite.bottom = mur.top et sprite.top = mur.bottom
+        pose = cogne & (vy < 0)
+        ny[pose] -= (ny[pose] + bb[pose]) - (ligne[pose] * ty + ty)
+        plafond = cogne & (vy > 0)
+        ny[plafond] -= (ny[plafond] + bh[plafond]) - ligne[plafond] * ty
+        # anti_stuck : encore dans un mur a l'arrivee
+        pleines, partielles = murs.compter(nx + bg, ny + bb, nx + bd, ny + bh)
+        lents |= (pleines > 0) | (partielles > 0)
+
+        rapides = actifs & ~lents
+        x[rapides] = nx[rapides]
+        y[rapides] = ny[rapides]
+        vy[rapides & cogne] = 0.0
+
+        self._en_cours = True
+        try:
+            # les autres comme avant, sprite par sprite
+            for i in np.flatnonzero(actifs & lents):
+                mob = self.mobs[i]
+                mob.position = (x.item(i), y.item(i))
+                vy[i] = mob.deplacer_murs(vx.item(i), vy.item(i), murs)
+                x[i], y[i] = mob.center_x, mob.center_y
+                c["sx"][i], c["sy"][i] = x[i], y[i]
+
+            # tir des volants (toutes les 3 secondes)
+            c["timer_tir"][actifs & air] += pas
+            tir = actifs & air & (c["timer_tir"] >= 3.0)
+            c["timer_tir"][tir] = 0.0
+            for i in np.flatnonzero(tir):
+                self.mobs[i].tirer(x.item(i), y.item(i))
+
+            # mobs empiles ecartes l'un de l'autre
+            self._separer(actifs, murs)
+
+            # positions recopiees dans les sprites visibles (ou qui l'etaient)
+            gv, bv, dv, hv = vue
+            dedans = (x >= gv) & (x <= dv) & (y >= bv) & (y <= hv)
+            avant = (c["sx"] >= gv) & (c["sx"] <= dv) & (c["sy"] >= bv) & (c["sy"] <= hv)
+            a_placer = (dedans | avant) & ((x != c["sx"]) | (y != c["sy"]))
+            for i in np.flatnonzero(a_placer):
+                self.mobs[i].position = (x.item(i), y.item(i))
+            c["sx"][a_placer] = x[a_placer]
+            c["sy"][a_placer] = y[a_placer]
+
+            for i in np.flatnonzero(fini):
+                self.mobs[i].remove_from_sprite_lists()
+        finally:
+            self._en_cours = False
+            a_retirer, self._a_retirer = self._a_retirer, []
+            for mob in a_retirer:
+                self.retirer(mob)
+
+    def _separer(self, actifs, murs, force=FORCE_SEPARATION):
+        """ chaque paire de mobs actifs dont les hit box se chevauchent est ecartee de
+        force pixels (poussees additionnees par mob), sans entrer dans un mur """
+        indices = np.flatnonzero(actifs)
+        if len(indices) < 2:
+            return
+        c = self.champs
+        x, y = c["x"][indices], c["y"][indices]
+        boite = self.table_boites[c["boites"][indices] + (c["gauche_aff"][indices] == 1)]
+        pa, pb = paires_proches(x + boite[:, 0], y + boite[:, 1], x + boite[:, 2], y + boite[:, 3])
+        if len(pa) == 0:
+            return
+
+        dx, dy = x[pa] - x[pb], y[pa] - y[pb]
+        # superposes exactement : sens au hasard
+        for k in np.flatnonzero((dx == 0) & (dy == 0)):
+            dx[k], dy[k] = random.choice([-1, 1]), random.choice([-1, 1])
+        dist = np.hypot(dx, dy)
+        px, py = dx / dist * force, dy / dist * force
+        poussee_x = np.zeros(len(indices))
+        poussee_y = np.zeros(len(indices))
+        np.add.at(poussee_x, pa, px)
+        np.add.at(poussee_x, pb, -px)
+        np.add.at(poussee_y, pa, py)
+        np.add.at(poussee_y, pb, -py)
+
+        # axe par axe : annule contre un mur plein, test exact du sprite pres d'une pente
+        m = np.flatnonzero((poussee_x != 0) | (poussee_y != 0))
+        indices, x, y, boite = indices[m], x[m], y[m], boite[m]
+        nx = x + poussee_x[m]
+        nx = np.where(self._libre(indices, nx, y, boite, murs), nx, x)
+        ny = y + poussee_y[m]
+        ny = np.where(self._libre(indices, nx, ny, boite, murs), ny, y)
+        c["x"][indices] = nx
+        c["y"][indices] = ny
+
+    def _libre(self, indices, x, y, boite, murs):
+        pleines, partielles = murs.compter(x + boite[:, 0], y + boite[:, 1], x + boite[:, 2], y + boite[:, 3])
+        libre = (pleines == 0)
+        c = self.champs
+        for k in np.flatnonzero(libre & (partielles > 0)):
+            i = indices[k]
+            mob = self.mobs[i]
+            mob.position = (x.item(k), y.item(k))
+            c["sx"][i], c["sy"][i] = x[k], y[k]
+            libre[k] = not murs.touche(mob)
+        return libre
+
+    def _rects(self):
+        n = len(self.mobs)
+        c = self.champs
+        boite = self.table_boites[c["boites"][:n] + (c["gauche_aff"][:n] == 1)]
+        x, y = c["x"][:n], c["y"][:n]
+        return x + boite[:, 0], y + boite[:, 1], x + boite[:, 2], y + boite[:, 3]
+
+    def _placer(self, indices):
+        # sprites remis a leur position avant un test exact (hors de la vue ils attendent)
+        c = self.champs
+        x, y, sx, sy = c["x"], c["y"], c["sx"], c["sy"]
+        for i in indices:
+            if x[i] != sx[i] or y[i] != sy[i]:
+                self.mobs[i].position = (x.item(i), y.item(i))
+                sx[i], sy[i] = x[i], y[i]
+        return [self.mobs[i] for i in indices]
+
+    def boites(self):
+        """ (mob, gauche, bas, droite, haut) de chaque mob, pour degats.py
+        (boites des tableaux : le sprite n'est replace que par placer, avant un test exact) """
+        g, b, d, h = self._rects()
+        return list(zip(self.mobs, g.tolist(), b.tolist(), d.tolist(), h.tolist()))
+
+    def placer(self, mob):
+        self._placer([mob.indice])
+
+    def proches(self, gauche, bas, droite, haut):
+        """ mobs dont la hit box chevauche le rectangle, pour degats.py """
+        if not self.mobs:
+            return []
+        g, b, d, h = self._rects()
+        dedans = (g <= droite) & (d >= gauche) & (b <= haut) & (h >= bas)
+        return self._placer(np.flatnonzero(dedans))
+
+    @staticmethod
+    def _timers(c, delta_time, m):
+        """ invulnerabilite (clignotement), delai avant de retoucher le joueur, animation
+        renvoie les mobs a dessiner transparents """
+        invul = c["invul_timer"]
+        alpha_bas = m & (invul > 0)
+        invul[alpha_bas] -= delta_time
+
+        touche = c["timer_touche_joueur"]
+        t = m & (touche > 0)
+        touche[t] -= delta_time
+        # mob peut reattaquer
+        c["touche_joueur"][t & (touche <= 0)] = 0
+
+        # animation en boucle
+        anim = c["anim_timer"]
+        anim[m] += delta_time
+        suivante = m & (anim > 0.2)
+        anim[suivante] = 0.0
+        frame = c["frame_actuelle"]
+        frame[suivante] = (frame[suivante] + 1) % c["nb_frames"][suivante]
+        return alpha_bas
@@ -0,0 +1,228 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# atlas d'images construits d'avance
+# les png des sprites (joueur, mobs, boss, ecran de chargement) sont ranges dans
+# quelques grandes pages, une ou plusieurs par groupe (GROUPES_ATLAS), avec un
+# manifeste json : rectangle de chaque image dans sa page, hash et hit box deja
+# calcules, ordre et delai des frames de chaque dossier
+# au lancement le registre (ressources.py) lit le manifeste et quelques pages
+# au lieu de centaines de fichiers ; une image modifiee depuis la construction
+# (taille ou date differente) est relue depuis son fichier
+#
+# construction (a refaire quand les images changent) :
+#   python sources/paquets.py
+
+import os
+import re
+import sys
+import json
+from pathlib import Path
+
+import arcade
+from PIL import Image
+from arcade.texture import ImageData
+from constantes import DOSSIER_DATA, DOSSIER_ATLAS, GROUPES_ATLAS, TAILLE_PAGE_ATLAS
+
+VERSION_MANIFESTE = 1
+NOM_MANIFESTE = "manifeste.json"
+_DELAI = re.compile(r"delay-([0-9.]+)s")
+
+
+def ordre_naturel(nom):
+    """ cle de tri : frame_2 avant frame_10 """
+    return [int(morceau) if morceau.isdigit() else morceau.lower() for morceau in re.split(r"(\d+)", nom)]
+
+
+def delai(nom):
+    """ delai de la frame lu dans le nom du fichier (frame_07_delay-0.1s.png), sinon None """
+    m = _DELAI.search(nom)
+    return float(m.group(1)) if m else None
+
+
+def lister_frames(dossier):
+    """ [(chemin, delai)] des png du dossier dans l'ordre des frames (lecture du disque) """
+    if not os.path.isdir(dossier):
+        return []
+    noms = sorted((n for n in os.listdir(dossier) if n.lower().endswith(".png")), key=ordre_naturel)
+    return [(os.path.join(dossier, n), delai(n)) for n in noms]
+
+
+def _cle(chemin, dossier_data=DOSSIER_DATA):
+    """ chemin depuis data avec des / (meme cle sous windows et linux) """
+    return os.path.relpath(chemin, dossier_data).replace(os.sep, "/")
+
+
+def _signature(chemin):
+    st = os.stat(chemin)
+    return [st.st_size, st.st_mtime_ns]
+
+
+# construction
+
+
+def ranger(tailles, taille_page=TAILLE_PAGE_ATLAS):
+    """ rangement en etageres : les images les plus hautes d'abord, de gauche a droite
+    renvoie (page, x, y) pour chaque taille et la taille utilisee de chaque page """
+    places = [None] * len(tailles)
+    pages = []  # [largeur utilisee, hauteur utilisee]
+    x = y = hauteur_etagere = 0
+    for i in sorted(range(len(tailles)), key=lambda i: (-tailles[i][1], -tailles[i][0])):
+        l, h = tailles[i]
+        if l > taille_page or h > taille_page:
+            raise ValueError(f"image plus grande qu'une page : {l}x{h}")
+        if not pages:
+            pages.append([0, 0])
+        if x + l > taille_page:
+            # etagere suivante
+            x, y, hauteur_etagere = 0, y + hauteur_etagere, 0
+        if y + h > taille_page:
+            # page suivante
+            pages.append([0, 0])
+            x = y = hauteur_etagere = 0
+        places[i] = (len(pages) - 1, x, y)
+        x += l
+        hauteur_etagere = max(hauteur_etagere, h)
+        page = pages[-1]
+        page[0] = max(page[0], x)
+        page[1] = max(page[1], y + h)
+    return places, pages
+
+
+def construire(groupes=GROUPES_ATLAS, dossier_data=DOSSIER_DATA, dossier_atlas=DOSSIER_ATLAS, taille_page=TAILLE_PAGE_ATLAS):
+    """ range les images des groupes en pages png et ecrit le manifeste, renvoie son chemin """
+    os.makedirs(dossier_atlas, exist_ok=True)
+    manifeste = {"version": VERSION_MANIFESTE, "pages": [], "images": {}, "dossiers": {}}
+
+    for groupe in groupes:
+        racine = os.path.join(dossier_data, groupe)
+        chemins = []
+        for dossier, sous_dossiers, _ in os.walk(racine):
+            sous_dossiers.sort()
+            frames = lister_frames(dossier)
+            if frames:
+                manifeste["dossiers"][_cle(dossier, dossier_data)] = [[os.path.basename(c), d] for c, d in frames]
+                chemins += [c for c, _ in frames]
+
+        # une seule place par image identique (meme hash)
+        uniques = {}
+        infos = []
+        for chemin in chemins:
+            image = Image.open(chemin)
+            if image.mode != "RGBA":
+                image = image.convert("RGBA")
+            donnees = ImageData(image)
+            if donnees.hash not in uniques:
+                uniques[donnees.hash] = image
+            infos.append((chemin, donnees.hash, image))
+
+        hashes = list(uniques)
+        places, tailles_pages = ranger([uniques[h].size for h in hashes], taille_page)
+
+        premiere = len(manifeste["pages"])
+        pages = [Image.new("RGBA", tuple(t), (0, 0, 0, 0)) for t in tailles_pages]
+        rects = {}
+        for h, (page, x, y) in zip(hashes, places):
+            pages[page].paste(uniques[h], (x, y))
+            rects[h] = [premiere + page, x, y]
+        nom_groupe = groupe.replace("/", "-").replace(" ", "_").lower()
+        for i, page in enumerate(pages):
+            nom = f"{nom_groupe}-{i}.png"
+            page.save(os.path.join(dossier_atlas, nom), compress_level=1)
+            manifeste["pages"].append(nom)
+
+        for chemin, h, image in infos:
+            page, x, y = rects[h]
+            points = arcade.hitbox.algo_default.calculate(image)
+            manifeste["images"][_cle(chemin, dossier_data)] = {
+                "page": page,
+                "rect": [x, y, image.width, image.height],
+                "hash": h,
+                "hit_box": [list(p) for p in points],
+                "fichier": _signature(chemin),
+            }
+
+    chemin = os.path.join(dossier_atlas, NOM_MANIFESTE)
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        json.dump(manifeste, f)
+    os.replace(temporaire, chemin)
+
+    # supprimer les pages d'une ancienne construction
+    for nom in os.listdir(dossier_atlas):
+        if nom.endswith(".png") and nom not in manifeste["pages"]:
+            os.remove(os.path.join(dossier_atlas, nom))
+    return chemin
+
+
+# lecture
+
+
+class Manifeste:
+    """ manifeste lu au lancement : donne les textures d'une page d'un coup """
+
+    def __init__(self, donnees, dossier_atlas=DOSSIER_ATLAS, dossier_data=DOSSIER_DATA):
+        self.pages = donnees["pages"]
+        self.images = donnees["images"]
+        self.dossiers = donnees["dossiers"]
+        self.dossier_atlas = dossier_atlas
+        self.dossier_data = dossier_data
+
+    def entree(self, chemin):
+        """ place de l'image dans les pages, None si elle n'y est pas ou a change depuis """
+        entree = self.images.get(_cle(chemin, self.dossier_data))
+        if entree is None:
+            return None
+        try:
+            if _signature(chemin) != entree["fichier"]:
+                return None
+        except OSError:
+            return None
+        return entree
+
+    def textures_page(self, page, deja=()):
+        """ {chemin: texture} des images a jour de la page (sans relire leurs fichiers)
+        deja : chemins a ne pas refaire """
+        image_page = None
+        textures = {}
+        for cle, entree in self.images.items():
+            if entree["page"] != page:
+                continue
+            chemin = os.path.join(self.dossier_data, *cle.split("/"))
+            if chemin in deja or self.entree(chemin) is None:
+                continue
+            if image_page is None:
+                image_page = Image.open(os.path.join(self.dossier_atlas, self.pages[page]))
+                image_page.load()
+            x, y, l, h = entree["rect"]
+            # meme hash et meme hit box que arcade.load_texture sur le fichier
+            tex = arcade.Texture(ImageData(image_page.crop((x, y, x + l, y + h)), hash=entree["hash"]),
+                                 hit_box_points=[tuple(p) for p in entree["hit_box"]])
+            tex.file_path = Path(chemin)
+            textures[chemin] = tex
+        return textures
+
+    def frames(self, dossier):
+        """ [(chemin, delai)] du dossier dans l'ordre, None si le dossier n'est pas empaquete """
+        frames = self.dossiers.get(_cle(dossier, self.dossier_data))
+        if frames is None:
+            return None
+        return [(os.path.join(dossier, nom), d) for nom, d in frames]
+
+
+def lire_manifeste(dossier_atlas=DOSSIER_ATLAS, dossier_data=DOSSIER_DATA):
+    """ manifeste des pages, None s'il n'a pas ete construit (les images sont lues une par une) """
+    chemin = os.path.join(dossier_atlas, NOM_MANIFESTE)
+    try:
+        with open(chemin, "r", encoding="utf-8") as f:
+            donnees = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if donnees.get("version") != VERSION_MANIFESTE:
+        return None
+    return Manifeste(donnees, dossier_atlas, dossier_data)
+
+
+if __name__ == "__main__":
+    groupes = sys.argv[1:] or GROUPES_ATLAS
+    print("atlas construit :", construire(groupes))
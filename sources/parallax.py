@@ -0,0 +1,31 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# fonds parallax (calques font-bouge_0 et font-bouge_1)
+# chaque fond a sa camera qui suit la camera du jeu plus lentement en x
+# le dessin passe par le rendu shader : un quad par fond au lieu de 22000 sprites
+
+import arcade
+from constantes import VITESSES_PARALLAX
+
+
+class FondParallax:
+    """ cameras et dessin des fonds qui bougent moins vite que le monde """
+
+    def __init__(self, rendu, vitesses=VITESSES_PARALLAX):
+        # rendu : RenduTuilesGPU ou GestionnaireChunks (il faut dessiner(nom))
+        self.rendu = rendu
+        self.vitesses = dict(vitesses)
+        self.cameras = {nom: arcade.camera.Camera2D() for nom in self.vitesses}
+
+    def suivre(self, camera_jeu):
+        """ decalage en x selon la vitesse du fond, y suit la camera du jeu """
+        x, y = camera_jeu.position
+        for nom, vitesse in self.vitesses.items():
+            self.cameras[nom].position = (x * vitesse, y)
+
+    def dessiner(self):
+        # le plus lent (le plus loin) en premier
+        for nom in sorted(self.vitesses, key=self.vitesses.get):
+            self.cameras[nom].use()
+            self.rendu.dessiner(nom)
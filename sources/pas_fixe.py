@@ -0,0 +1,73 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# simulation a pas fixe
+# le monde avance par ticks de PAS_SIMULATION quel que soit le nombre d'images
+# par seconde : les mobs, projectiles, boss, la physique et le dash qui bougent
+# d'une quantite fixe par tick vont a la meme vitesse a 30, 60 ou 144 Hz
+# le temps de chaque frame s'accumule et on simule autant de ticks entiers qu'il
+# en contient ; le reste sert a dessiner les sprites entre leur position du tick
+# precedent et celle du tick en cours (sinon ca saccade au dessus de 60 Hz)
+
+
+class PasFixe:
+    """ accumulateur de temps : combien de ticks simuler a chaque frame """
+
+    def __init__(self, pas, max_par_frame):
+        self.pas = pas
+        self.max_par_frame = max_par_frame
+        self.reste = 0.0
+
+    def ticks(self, delta_time):
+        """ nombre de ticks a simuler pour cette frame """
+        self.reste += delta_time
+        n = int(self.reste // self.pas)
+        if n > self.max_par_frame:
+            # trop de retard (frame tres longue) : on abandonne le surplus
+            n = self.max_par_frame
+            self.reste = self.pas * n
+        self.reste -= self.pas * n
+        return n
+
+    @property
+    def alpha(self):
+        """ avancee entre le dernier tick et le suivant (0 a 1) """
+        return min(1.0, self.reste / self.pas)
+
+    def vider(self):
+        self.reste = 0.0
+
+
+class Interpolation:
+    """ positions des sprites au tick precedent pour les dessiner entre deux ticks """
+
+    def __init__(self, saut_max):
+        self.saut_max = saut_max
+        self.avant = {}    # sprite -> position au tick precedent
+        self.vraies = {}   # sprite -> position du tick, pendant le dessin
+
+    def memoriser(self, listes):
+        """ avant chaque tick """
+        self.avant = {s: s.position for liste in listes for s in liste}
+
+    def appliquer(self, listes, alpha):
+        """ avant le dessin : place les sprites entre les deux ticks """
+        for liste in listes:
+            for s in liste:
+                p = self.avant.get(s)
+                if p is None or s in self.vraies:
+                    continue
+                x, y = s.position
+                if (x, y) == p or abs(x - p[0]) > self.saut_max or abs(y - p[1]) > self.saut_max:
+                    continue
+                self.vraies[s] = (x, y)
+                s.position = (p[0] + (x - p[0]) * alpha, p[1] + (y - p[1]) * alpha)
+
+    def retablir(self):
+        """ apres le dessin : remet les positions du tick (la simulation reprend de la) """
+        for s, p in self.vraies.items():
+            s.position = p
+        self.vraies.clear()
+
+    def vider(self):
+        self.avant = {}
@@ -0,0 +1,37 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# ordre des systemes du jeu pendant un tick
+# chaque systeme (fonction qui recoit delta_time) est range dans une phase et
+# tourne une seule fois par tick ; les phases passent toujours dans l'ordre de
+# PHASES, et le temps de chaque phase est mesure (moyenne glissante, menu F3)
+
+import time
+
+PHASES = ["entrees", "ia", "physique", "collisions", "degats", "apparitions", "animation", "nettoyage"]
+
+
+class Planificateur:
+    """ systemes ranges par phase, lances une fois par tick """
+
+    def __init__(self, phases=PHASES):
+        self.systemes = {phase: [] for phase in phases}
+        self.durees = {phase: 0.0 for phase in phases}   # secondes, moyenne glissante
+
+    def ajouter(self, phase, *systemes):
+        self.systemes[phase].extend(systemes)
+
+    def tick(self, delta_time, arret=None):
+        """ lance toutes les phases dans l'ordre
+        arret : fonction testee apres chaque phase, le tick s'arrete si elle est vraie """
+        for phase, systemes in self.systemes.items():
+            debut = time.perf_counter()
+            for systeme in systemes:
+                systeme(delta_time)
+            self.durees[phase] = self.durees[phase] * 0.9 + (time.perf_counter() - debut) * 0.1
+            if arret is not None and arret():
+                return
+
+    def rapport(self):
+        """ lignes 'phase : x.xx ms' pour l'affichage de debug """
+        return [f"{phase} : {duree * 1000:.2f} ms" for phase, duree in self.durees.items()]
@@ -0,0 +1,258 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# tous les projectiles (balles du joueur, boules des mobs volants, batons du boss
+# arbre, projectiles du robot) ranges en tableaux numpy, un pool par type
+# - chaque pool a une taille fixe : plein, le plus vieux projectile est reutilise
+# - deplacement, duree de vie et sortie du monde sont calcules pour tous d'un coup
+# - les sprites sont crees une fois puis reutilises ; seuls ceux pres de la vue
+#   sont replaces (sauf les balles du joueur, qui visent les ennemis partout)
+# - les projectiles proches d'un rectangle sont trouves en une fois par pool
+#   (degats.py), le test exact d'arcade ne sert que pour ceux deja tout pres
+
+import math
+import numpy as np
+import arcade
+from constantes import VITESSE_TIR, PASSES_PAR_TICK
+import ressources
+
+# vitesse en pixels par seconde, duree en secondes (None = jusqu'a la sortie du monde)
+# angle : None = sprite jamais tourne, sinon degres ajoutes a la direction du tir
+# invul : None = degats a chaque contact, sinon le joueur devient invulnerable (secondes)
+TYPES = {
+    "balle": {"texture": "balle", "echelle": 0.8, "vitesse": VITESSE_TIR, "degats": 2,
+              "duree": 7.0, "angle": 0, "ami": True, "max": 64},
+    "boule": {"texture": "boule", "echelle": 1.0, "vitesse": 300, "degats": 1,
+              "duree": 5.0, "angle": None, "invul": None, "max": 512},
+    "baton": {"animation": "baton", "images_par_seconde": 6, "echelle": 1.2, "vitesse": 7 * 60,
+              "degats": 4, "duree": 4.0, "angle": 0, "invul": 1.0, "max": 2048},
+    "robot": {"texture": "projectile_robot", "echelle": 0.3, "vitesse": 6 * 60, "degats": 5,
+              "duree": 5.0, "angle": 90, "invul": 1.0, "max": 2048},
+}
+
+
+class SpriteProjectile(arcade.Sprite):
+    """ sprite d'une case d'un pool (degats lus dans le pool) """
+
+    def __init__(self, pool, indice, texture, echelle):
+        super().__init__(texture, scale=echelle)
+        self.pool = pool
+        self.indice = indice
+
+    @property
+    def degats(self):
+        return self.pool.degats[self.indice].item()
+
+    def remove_from_sprite_lists(self):
+        # touche dans degats.py : la case redevient libre
+        self.pool.liberer(self.indice)
+
+
+def _textures(type_proj, nom):
+    """ frames du projectile, rond jaune si les images manquent """
+    try:
+        if "animation" in type_proj:
+            textures = ressources.animation(type_proj["animation"])
+        else:
+            textures = [ressources.texture(type_proj["texture"])]
+    except FileNotFoundError:
+        textures = None
+    return textures or [arcade.make_circle_texture(10, arcade.color.YELLOW, name=nom + "_secours")]
+
+
+class PoolProjectiles:
+    """ projectiles d'un type : tableaux de taille fixe + sprites reutilises """
+
+    def __init__(self, nom):
+        self.nom = nom
+        self.type = TYPES[nom]
+        n = self.type["max"]
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.age = np.zeros(n)
+        self.degats = np.zeros(n)
+        self.actif = np.zeros(n, dtype=bool)
+        self.sx = np.zeros(n)   # derniere position recopiee dans le sprite
+        self.sy = np.zeros(n)
+        self.frame_aff = np.zeros(n, dtype=np.int32)
+        self.sprites = [None] * n
+        self.libres = list(range(n - 1, -1, -1))
+        self.liste = arcade.SpriteList()   # sprites actifs, pour le dessin
+        self.textures = None   # chargees au premier tir
+        self.rayon = None
+
+    def __len__(self):
+        return len(self.liste)
+
+    def tirer(self, x, y, cible_x, cible_y, degats=None):
+        """ nouveau projectile de (x, y) vers la cible """
+        if self.textures is None:
+            self.textures = _textures(self.type, self.nom)
+        if self.libres:
+            i = self.libres.pop()
+        else:
+            # pool plein : le plus vieux laisse sa place
+            i = int(np.argmax(np.where(self.actif, self.age, -1.0)))
+            arcade.Sprite.remove_from_sprite_lists(self.sprites[i])
+        angle = math.atan2(cible_y - y, cible_x - x)
+        vitesse = self.type["vitesse"]
+        self.x[i], self.y[i] = x, y
+        self.sx[i], self.sy[i] = x, y
+        self.vx[i] = math.cos(angle) * vitesse
+        self.vy[i] = math.sin(angle) * vitesse
+        self.age[i] = 0.0
+        self.degats[i] = self.type["degats"] if degats is None else degats
+        self.actif[i] = True
+
+        sprite = self.sprites[i]
+        if sprite is None:
+            sprite = self.sprites[i] = SpriteProjectile(self, i, self.textures[0], self.type["echelle"])
+        else:
+            sprite.texture = self.textures[0]
+        self.frame_aff[i] = 0
+        sprite.position = (x, y)
+        if self.type["angle"] is not None:
+            sprite.angle = math.degrees(angle) + self.type["angle"]
+        self.liste.append(sprite)
+
+    def liberer(self, i):
+        if not self.actif[i]:
+            return
+        self.actif[i] = False
+        arcade.Sprite.remove_from_sprite_lists(self.sprites[i])
+        self.libres.append(i)
+
+    def vider(self):
+        for i in np.flatnonzero(self.actif):
+            self.liberer(i)
+
+    def update(self, delta_time, vue, limites):
+        """ deplace tous les projectiles, retire les trop vieux et ceux sortis du monde
+        vue, limites : (gauche, bas, droite, haut) """
+        m = self.actif
+        if not m.any():
+            return
+        if not self.type.get("ami"):
+            delta_time *= PASSES_PAR_TICK # projectiles ennemis (voir constantes.py)
+        x, y = self.x, self.y
+        x[m] += self.vx[m] * delta_time
+        y[m] += self.vy[m] * delta_time
+        self.age[m] += delta_time
+
+        g, b, d, h = limites
+        morts = m & ((x < g) | (x > d) | (y < b) | (y > h))
+        if self.type["duree"] is not None:
+            morts |= m & (self.age >= self.type["duree"])
+        for i in np.flatnonzero(morts):
+            self.liberer(i)
+
+        # sprites replaces : pres de la vue (ou qui l'etaient), ou tous pour les balles du joueur
+        m = self.actif
+        if self.type.get("ami"):
+            a_placer = m.copy()
+        else:
+            gv, bv, dv, hv = vue
+            dedans = (x >= gv) & (x <= dv) & (y >= bv) & (y <= hv)
+            avant = (self.sx >= gv) & (self.sx <= dv) & (self.sy >= bv) & (self.sy <= hv)
+            a_placer = m & (dedans | avant)
+        frames = len(self.textures)
+        if frames > 1 and a_placer.any():
+            frame = (self.age * self.type["images_par_seconde"]).astype(np.int32) % frames
+            for i in np.flatnonzero(a_placer & (frame != self.frame_aff)):
+                self.sprites[i].texture = self.textures[frame[i]]
+                self.frame_aff[i] = frame[i]
+        for i in np.flatnonzero(a_placer):
+            self.sprites[i].position = (x.item(i), y.item(i))
+        self.sx[a_placer] = x[a_placer]
+        self.sy[a_placer] = y[a_placer]
+
+    def _rayon(self):
+        if self.rayon is None:
+            # plus grand ecart au centre de la hit box, quel que soit l'angle
+            points = self.sprites[int(np.argmax(self.actif))].hit_box.points
+            self.rayon = max(math.hypot(px, py) for px, py in points) * self.type["echelle"]
+        return self.rayon
+
+    def _placer(self, indices):
+        # sprites remis a leur position avant un test exact
+        for i in indices:
+            self.sprites[i].position = (self.x.item(i), self.y.item(i))
+            self.sx[i], self.sy[i] = self.x[i], self.y[i]
+        return [self.sprites[i] for i in indices]
+
+    def boites(self):
+        """ (sprite, gauche, bas, droite, haut) de chaque projectile actif, pour degats.py
+        (boites des tableaux : le sprite n'est replace que par placer, avant un test exact) """
+        if not self.actif.any():
+            return []
+        r = self._rayon()
+        indices = np.flatnonzero(self.actif)
+        x, y = self.x[indices], self.y[indices]
+        return list(zip([self.sprites[i] for i in indices], (x - r).tolist(), (y - r).tolist(),
+                        (x + r).tolist(), (y + r).tolist()))
+
+    def placer(self, sprite):
+        self._placer([sprite.indice])
+
+    def proches(self, gauche, bas, droite, haut):
+        """ projectiles actifs qui peuvent toucher le rectangle, pour degats.py """
+        m = self.actif
+        if not m.any():
+            return []
+        r = self._rayon()
+        proches = m & (self.x + r >= gauche) & (self.x - r <= droite) \
+                    & (self.y + r >= bas) & (self.y - r <= haut)
+        return self._placer(np.flatnonzero(proches))
+
+
+class Projectiles:
+    """ un pool par type de TYPES """
+
+    def __init__(self):
+        self.pools = {nom: PoolProjectiles(nom) for nom in TYPES}
+
+    def tirer(self, nom, x, y, cible_x, cible_y, degats=None):
+        self.pools[nom].tirer(x, y, cible_x, cible_y, degats)
+
+    def liste(self, nom):
+        return self.pools[nom].liste
+
+    def listes(self):
+        return [pool.liste for pool in self.pools.values()]
+
+    def vider(self):
+        for pool in self.pools.values():
+            pool.vider()
+
+    def update(self, delta_time, vue, limites):
+        for pool in self.pools.values():
+            pool.update(delta_time, vue, limites)
+
+    def ennemis(self):
+        """ projectiles qui visent le joueur (pas ses balles), comme un seul groupe pour degats.py """
+        return GroupePools([pool for pool in self.pools.values() if not pool.type.get("ami")])
+
+    def draw(self):
+        for pool in self.pools.values():
+            pool.liste.draw()
+
+
+class GroupePools:
+    """ plusieurs pools vus comme un seul groupe (boites, proches) """
+
+    def __init__(self, pools):
+        self.pools = pools
+
+    def __len__(self):
+        return sum(len(pool) for pool in self.pools)
+
+    def boites(self):
+        return [boite for pool in self.pools for boite in pool.boites()]
+
+    def placer(self, sprite):
+        sprite.pool.placer(sprite)
+
+    def proches(self, gauche, bas, droite, haut):
+        return [sprite for pool in self.pools for sprite in pool.proches(gauche, bas, droite, haut)]
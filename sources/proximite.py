@@ -0,0 +1,92 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# mises a jour selon la distance a la camera (niveaux de detail)
+# - distance mesuree en demi-vues : 1 = bord de l'ecran, quel que soit le zoom
+#   (les rayons grandissent dans le monde quand la camera dezoome)
+# - pres de la camera (PLEIN) : mise a jour a chaque tick
+# - a mi-distance (REDUIT) : un tick sur LOD_PERIODE, avec le temps ecoule
+#   depuis la derniere mise a jour ; les entites sont decalees entre elles
+#   pour ne pas toutes tomber sur le meme tick
+# - au dela (GELE) : plus de mise a jour, le temps s'arrete pour l'entite
+# ce qui bouge d'un pas fixe par tick (physique des boss, ennemis, mobs) n'est
+# que gele ou non, seul ce qui suit delta_time (animations) passe en reduit
+# chaque entite est comptee une fois par tick pour le menu F3 : les sprites
+# dans preparer, les mobs des zones (tableaux de mobs.py) par compter
+
+from constantes import LOD_PLEIN, LOD_REDUIT, LOD_PERIODE
+
+PLEIN = 0
+REDUIT = 1
+GELE = 2
+
+
+class Proximite:
+    """ niveau de detail de chaque entite, d'apres la camera du tick """
+
+    def __init__(self, plein=LOD_PLEIN, reduit=LOD_REDUIT, periode=LOD_PERIODE):
+        self.plein = plein
+        self.reduit = reduit
+        self.periode = periode
+        self.tick = 0
+        self.decalages = 0   # prochain decalage donne a une entite
+        self.cx = self.cy = 0.0
+        self.demi_l = self.demi_h = 1.0
+        self.compte = [0, 0, 0]   # entites par niveau au dernier tick, pour le menu F3
+        self._compte = [0, 0, 0]
+
+    def preparer(self, camera, largeur, hauteur, entites=()):
+        """ a appeler une fois par tick, avant les systemes qui utilisent les niveaux
+        entites : sprites a compter pour le menu F3 """
+        self.tick += 1
+        self.cx, self.cy = camera.position
+        self.demi_l = largeur / 2 / camera.zoom
+        self.demi_h = hauteur / 2 / camera.zoom
+        self.compte, self._compte = self._compte, [0, 0, 0]
+        for entite in entites:
+            self._compte[self.niveau(entite.center_x, entite.center_y)] += 1
+
+    def compter(self, plein=0, gele=0):
+        """ entites comptees hors de preparer (mobs des zones, mis a jour ou geles) """
+        self._compte[PLEIN] += plein
+        self._compte[GELE] += gele
+
+    def niveau(self, x, y):
+        distance = max(abs(x - self.cx) / self.demi_l, abs(y - self.cy) / self.demi_h)
+        if distance <= self.plein:
+            return PLEIN
+        if distance <= self.reduit:
+            return REDUIT
+        return GELE
+
+    def rectangle(self, rayon=None):
+        """ (gauche, bas, droite, haut) du monde a moins de rayon demi-vues (LOD_REDUIT par defaut) """
+        rayon = self.reduit if rayon is None else rayon
+        dl, dh = self.demi_l * rayon, self.demi_h * rayon
+        return self.cx - dl, self.cy - dh, self.cx + dl, self.cy + dh
+
+    def actif(self, entite):
+        """ pas gelee (pour les mises a jour a pas fixe) """
+        return self.niveau(entite.center_x, entite.center_y) != GELE
+
+    def pas(self, entite, delta_time):
+        """ temps a donner a la mise a jour de l'entite ce tick, None si elle attend """
+        n = self.niveau(entite.center_x, entite.center_y)
+        if n == GELE:
+            return None
+        attente = getattr(entite, "attente_lod", 0.0) + delta_time
+        decalage = getattr(entite, "decalage_lod", None)
+        if decalage is None:
+            # dans l'ordre de premiere rencontre (pas id() : meme decalage au rejeu)
+            decalage = entite.decalage_lod = self.decalages
+            self.decalages += 1
+        if n == REDUIT and (self.tick + decalage) % self.periode:
+            entite.attente_lod = attente
+            return None
+        entite.attente_lod = 0.0
+        return attente
+
+    def rapport(self):
+        """ ligne pour l'affichage de debug """
+        plein, reduit, gele = self.compte
+        return f"proximite : {plein} pleins, {reduit} reduits, {gele} geles"
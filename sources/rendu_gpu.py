@@ -0,0 +1,161 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# rendu des calques statiques de la carte par la carte graphique
+# chaque calque = une texture d'entiers (un gid par tuile) + un seul quad
+# le fragment shader retrouve la tuile sous chaque pixel et lit tile.png
+# le cout cpu par frame ne depend plus du nombre de tuiles
+
+import arcade
+from arcade.gl import geometry
+
+VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+uniform usampler2D gids;
+uniform sampler2D atlas;
+uniform ivec2 taille_carte;   // en tuiles
+uniform ivec2 taille_tuile;   // en pixels dans tile.png
+uniform int colonnes;
+uniform int marge;
+uniform int espacement;
+uniform uint firstgid;
+uniform float opacite;
+
+in vec2 v_uv;
+out vec4 f_color;
+
+void main() {
+    // tuile sous le pixel (y = 0 en bas) et position dans la tuile
+    vec2 cellule = v_uv * vec2(taille_carte);
+    ivec2 c = clamp(ivec2(floor(cellule)), ivec2(0), taille_carte - 1);
+    // la texture des gids garde l'ordre tiled (ligne 0 en haut)
+    uint gid = texelFetch(gids, ivec2(c.x, taille_carte.y - 1 - c.y), 0).r;
+    if (gid == 0u) discard;
+
+    // position dans la tuile, repere image (v vers le bas)
+    vec2 local = vec2(fract(cellule.x), 1.0 - fract(cellule.y));
+    if ((gid & 0x40000000u) != 0u) local.y = 1.0 - local.y;
+    if ((gid & 0x80000000u) != 0u) local.x = 1.0 - local.x;
+    if ((gid & 0x20000000u) != 0u) local = local.yx;
+
+    int index = int((gid & 0x1FFFFFFFu) - firstgid);
+    ivec2 origine = ivec2(index % colonnes, index / colonnes) * (taille_tuile + espacement) + marge;
+    ivec2 pixel = origine + min(ivec2(local * vec2(taille_tuile)), taille_tuile - 1);
+
+    f_color = texelFetch(atlas, pixel, 0);
+    f_color.a *= opacite;
+}
+"""
+
+
+class CalqueGPU:
+    """ un calque tiled dessine en un seul quad """
+
+    def __init__(self, ctx, programme, carte, nom, scaling, opacite):
+        self.ctx = ctx
+        self.programme = programme
+        self.visible = carte.visibles[nom]
+        # meme arrondi que sprite.alpha pour garder le rendu des sprites
+        self.opacite = int(opacite * 255) / 255
+
+        donnees = carte.calques[nom]
+        dtype = "u2" if donnees.itemsize == 2 else "u4"
+        self.gids = ctx.texture((carte.largeur, carte.hauteur), components=1, dtype=dtype,
+                                data=bytes(donnees), filter=(ctx.NEAREST, ctx.NEAREST))
+
+        # quad qui couvre tout le monde : la carte graphique coupe ce qui sort de l'ecran
+        largeur = carte.largeur * carte.largeur_tuile * scaling
+        hauteur = carte.hauteur * carte.hauteur_tuile * scaling
+        self.quad = geometry.quad_2d(size=(largeur, hauteur), pos=(largeur / 2, hauteur / 2))
+
+    def draw(self):
+        if not self.visible:
+            return
+        self.gids.use(0)
+        self.programme["opacite"] = self.opacite
+        with self.ctx.enabled(self.ctx.BLEND):
+            self.ctx.blend_func = self.ctx.BLEND_DEFAULT
+            self.quad.render(self.programme)
+
+
+class RenduTuilesGPU:
+    """ calques statiques dessines par shader (meme interface que GestionnaireChunks) """
+
+    def __init__(self, ctx, carte, noms, scaling=1.0, image_tileset=None, opacites=None, differe=False):
+        # differe : les calques sont envoyes plus tard par envoyer() (ecran de chargement)
+        self.ctx = ctx
+        self.carte = carte
+        self.scaling = scaling
+        self.opacites = opacites or {}
+        self.calques = {}
+        # calques pas encore envoyes a la carte graphique
+        self.en_attente = [nom for nom in noms if nom in carte.calques]
+        if not self.en_attente:
+            return
+
+        ts = carte.tileset
+        if image_tileset is None:
+            image_tileset = arcade.SpriteSheet(ts["image"]).image
+        if image_tileset.mode != "RGBA":
+            image_tileset = image_tileset.convert("RGBA")
+        self.atlas = ctx.texture(image_tileset.size, components=4, data=image_tileset.tobytes(),
+                                 filter=(ctx.NEAREST, ctx.NEAREST))
+
+        self.programme = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+        self.programme["gids"] = 0
+        self.programme["atlas"] = 1
+        self.programme["taille_carte"] = (carte.largeur, carte.hauteur)
+        self.programme["taille_tuile"] = (ts["largeur_tuile"], ts["hauteur_tuile"])
+        self.programme["colonnes"] = ts["colonnes"]
+        self.programme["marge"] = ts["marge"]
+        self.programme["espacement"] = ts["espacement"]
+        self.programme["firstgid"] = ts["firstgid"]
+
+        if not differe:
+            for _ in self.envoyer():
+                pass
+
+    def envoyer(self):
+        """ generateur : envoie un calque en attente a la carte graphique par tour """
+        while self.en_attente:
+            nom = self.en_attente.pop(0)
+            opacite = self.opacites.get(nom, self.carte.opacites[nom])
+            self.calques[nom] = CalqueGPU(self.ctx, self.programme, self.carte, nom, self.scaling, opacite)
+            yield nom
+
+    @staticmethod
+    def disponible(ctx, carte):
+        """ tile.png doit tenir dans une seule texture de la carte graphique """
+        ts = carte.tileset
+        lignes = -(-ts["nb_tuiles"] // ts["colonnes"])
+        largeur = 2 * ts["marge"] + ts["colonnes"] * (ts["largeur_tuile"] + ts["espacement"])
+        hauteur = 2 * ts["marge"] + lignes * (ts["hauteur_tuile"] + ts["espacement"])
+        return max(largeur, hauteur) <= ctx.info.MAX_TEXTURE_SIZE
+
+    def __contains__(self, nom):
+        return nom in self.calques or nom in self.en_attente
+
+    def dessiner(self, nom):
+        calque = self.calques.get(nom)
+        if calque is not None:
+            self.atlas.use(1)
+            calque.draw()
@@ -0,0 +1,71 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# objets de courte duree recycles au lieu d'etre reconstruits (effets d'attaque,
+# zones du boss robot, mobs des zones)
+# une classe Recyclable se construit avec Classe.prendre(...) : un objet libre de
+# sa reserve est remis a neuf par reinitialiser(...) (memes arguments que le
+# constructeur), sinon un nouveau est construit ; retire de ses listes de sprites,
+# il revient dans la reserve
+# le constructeur ne fait que ce qui ne change pas d'une vie a l'autre, puis
+# appelle reinitialiser : un objet sorti de la reserve est comme neuf
+
+_reserves = {}   # classe -> Reserve
+
+
+class Reserve:
+    """ objets libres d'une classe et compteurs pour le menu F3 """
+
+    def __init__(self, classe, taille_max=256):
+        self.classe = classe
+        self.taille_max = taille_max   # au dela, les objets rendus sont oublies
+        self.libres = []
+        self.crees = 0
+        self.reutilises = 0
+        self.en_jeu = 0
+
+    def prendre(self, *args, **kwargs):
+        if self.libres:
+            objet = self.libres.pop()
+            objet.en_reserve = False
+            objet.reinitialiser(*args, **kwargs)
+            self.reutilises += 1
+        else:
+            objet = self.classe(*args, **kwargs)
+            objet.en_reserve = False
+            self.crees += 1
+        self.en_jeu += 1
+        return objet
+
+    def rendre(self, objet):
+        if objet.en_reserve is not False:
+            return # deja rendu (retire deux fois) ou construit sans prendre
+        objet.en_reserve = True
+        self.en_jeu -= 1
+        if len(self.libres) < self.taille_max:
+            self.libres.append(objet)
+
+
+class Recyclable:
+    """ a mettre avant la classe de sprite : Classe.prendre(...) au lieu de Classe(...) """
+    en_reserve = None   # None : construit sans prendre, jamais recycle
+
+    @classmethod
+    def reserve(cls):
+        if cls not in _reserves:
+            _reserves[cls] = Reserve(cls)
+        return _reserves[cls]
+
+    @classmethod
+    def prendre(cls, *args, **kwargs):
+        return cls.reserve().prendre(*args, **kwargs)
+
+    def remove_from_sprite_lists(self):
+        super().remove_from_sprite_lists()
+        type(self).reserve().rendre(self)
+
+
+def rapport():
+    """ lignes 'classe : en jeu / libres / construits / reutilises' pour l'affichage de debug """
+    return [f"{r.classe.__name__} : {r.en_jeu} en jeu, {len(r.libres)} libres, "
+            f"{r.crees} construits, {r.reutilises} reutilises" for r in _reserves.values()]
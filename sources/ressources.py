@@ -0,0 +1,204 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# registre des images du jeu
+# chaque fichier est lu, decode et sa hit box calculee une seule fois
+# ensuite tous les sprites partagent la meme texture
+# chaque image existe aussi retournee (miroir gauche droite), calculee une seule
+# fois : les sprites choisissent le sens sans retourner de texture en jeu
+# les images et animations du jeu sont rangees par nom (IMAGES, ANIMATIONS)
+# precharger() les charge au chargement du niveau : les apparitions de mobs,
+# les attaques et les phases de boss ne lisent plus de fichier pendant la partie
+# si les pages d'atlas ont ete construites (paquets.py) les images sont decoupees
+# dans les pages, une page entiere a la fois, sinon lues une par une
+
+import os
+import arcade
+import paquets
+import demarrage
+from constantes import DOSSIER_DATA, DOSSIER_BOSS, DOSSIER_ATTAQUES
+
+
+def _data(*morceaux):
+    return os.path.join(DOSSIER_DATA, *morceaux)
+
+
+def _serie(dossier, modele, numeros):
+    """ chemins dossier/modele pour chaque numero (modele avec {}) """
+    return [os.path.join(dossier, modele.format(i)) for i in numeros]
+
+
+_ARBRE = os.path.join(DOSSIER_BOSS, "Boss arbre")
+_ROBOT = os.path.join(DOSSIER_BOSS, "Boss robot")
+_FIN = os.path.join(DOSSIER_BOSS, "boss fin")
+_VER = os.path.join(DOSSIER_BOSS, "Ver de terre")
+_ZONES = os.path.join(_FIN, "attaques")
+_MOUVEMENTS = _data("player", "mouvements")
+
+# images seules
+IMAGES = {
+    "joueur": _data("player", "player.png"),
+    "joueur_saut": os.path.join(_MOUVEMENTS, "saut.png"),
+    "joueur_dash": os.path.join(_MOUVEMENTS, "Dash.png"),
+    "pnj_1": _data("mobs", "PNJ", "PNJ1.png"),
+    "pnj_2": _data("mobs", "PNJ", "PNJ2.png"),
+    "balle": _data("mobs", "PNJ", "items", "balle.png"),
+    "boule": _data("mobs", "air", "boule.png"),
+    "projectile": _data("mobs", "projectile.png"),
+    "projectile_robot": os.path.join(_ZONES, "Attaque 4", "projectile.png"),
+    "arbre_p1": os.path.join(_ARBRE, "P1.png"),
+    "arbre_p2": os.path.join(_ARBRE, "P2.png"),
+    "arbre_p2_saut": os.path.join(_ARBRE, "P2.saut.png"),
+    "arbre_p3": os.path.join(_ARBRE, "P3.png"),
+}
+
+# animations : liste de chemins dans l'ordre des frames
+_zone_1 = _serie(os.path.join(_ZONES, "attaque 1"), "attaque.{}.png", range(1, 6))
+_zone_2 = _serie(os.path.join(_ZONES, "attaque 2"), "{}.png", range(1, 7))
+ANIMATIONS = {
+    "joueur_marche": _serie(_MOUVEMENTS, "avancer ({}).png", range(1, 5)),
+    "joueur_grimper": _serie(_MOUVEMENTS, "grimper ({}).png", range(1, 4)),
+    "attaque": _serie(DOSSIER_ATTAQUES, "attaque{}.png", range(1, 13)),
+    "baton": _serie(_ARBRE, "Attaque.{}.png", range(1, 6)),
+    # dossier : toutes ses frames dans l'ordre (voir frames())
+    "ver_anime": os.path.join(_VER, "anime"),
+    "ver_plongeon": os.path.join(_VER, "plongeon"),
+    "ver_saut_bougeant": os.path.join(_VER, "saut bougeant"),
+    "ver_saut_court": os.path.join(_VER, "saut court"),
+    "ver_saut_simple": os.path.join(_VER, "Saut simple"),
+    # aller puis retour
+    "zone_1": _zone_1 + _zone_1[-2::-1],
+    "zone_2": _zone_2 + _zone_2[-2::-1],
+    "zone_3": _serie(os.path.join(_ZONES, "attaque 3"), "{}.png", range(9)),
+    "robot_1": _serie(_ROBOT, "bot1.{}.png", range(1, 3)),
+    "robot_2": _serie(_ROBOT, "bot2.{}.png", range(1, 3)),
+    "robot_3": _serie(_ROBOT, "bot3.{}.png", range(1, 3)),
+    "boss_fin_marche": _serie(_FIN, "marche.{}.png", range(1, 4)),
+    "dvd": _serie(os.path.join(DOSSIER_BOSS, "DVD"), "DVD{}.png", range(1, 6)),
+    # mobs de chaque zone de la carte
+    "foret_sol": _serie(_data("mobs", "foret", "sol"), "spi{}.png", range(2)),
+    "foret_air": _serie(_data("mobs", "foret", "air"), "libu{}.png", range(4)),
+    "desert_sol": _serie(_data("mobs", "desert", "sol"), "sable{}.png", range(2)),
+    "desert_air": _serie(_data("mobs", "desert", "air"), "puce{}.png", range(2)),
+    "ville_sol": _serie(_data("mobs", "ville", "sol"), "mob_sol.{}.png", range(1, 6)),
+    "ville_air": _serie(_data("mobs", "ville", "air"), "drone{}.png", range(2)),
+}
+
+_textures = {}     # chemin -> texture
+_miroirs = {}      # chemin -> texture retournee gauche droite
+_animations = {}   # (nom, miroir) -> tuple de textures
+_ecrans = {}       # chemin -> image d'ecran sans hit box
+_manifeste = []    # [manifeste des pages ou None], lu a la premiere image
+
+
+def manifeste():
+    """ manifeste des pages d'atlas (None s'il n'a pas ete construit) """
+    if not _manifeste:
+        _manifeste.append(paquets.lire_manifeste())
+    return _manifeste[0]
+
+
+def charger(chemin, miroir=False):
+    """ texture du fichier, chargee une seule fois
+    miroir : la version retournee gauche droite (creee une seule fois aussi)
+    (FileNotFoundError comme arcade.load_texture si le fichier manque) """
+    tex = _textures.get(chemin)
+    if tex is None:
+        m = manifeste()
+        entree = m.entree(chemin) if m is not None else None
+        if entree is not None:
+            # toute la page d'un coup : les images voisines servent aussi
+            with demarrage.mesurer("page d'atlas"):
+                page = m.textures_page(entree["page"], deja=_textures)
+            for c, t in page.items():
+                _textures.setdefault(c, t)
+            tex = _textures[chemin]
+        else:
+            with demarrage.mesurer("image"):
+                tex = _textures.setdefault(chemin, arcade.load_texture(chemin))
+    if not miroir:
+        return tex
+    inverse = _miroirs.get(chemin)
+    if inverse is None:
+        inverse = _miroirs.setdefault(chemin, tex.flip_left_right())
+    return inverse
+
+
+def image_ecran(chemin):
+    """ image de menu ou d'ecran (fond, logo, bouton) chargee une seule fois
+    sans calcul de hit box : elle est seulement dessinee, jamais testee en collision """
+    tex = _ecrans.get(chemin)
+    if tex is None:
+        with demarrage.mesurer("image d'ecran"):
+            tex = arcade.load_texture(chemin, hit_box_algorithm=arcade.hitbox.algo_bounding_box)
+        tex = _ecrans.setdefault(chemin, tex)
+    return tex
+
+
+def existe(chemin):
+    """ vrai si l'image existe (dans les pages ou sur le disque) """
+    m = manifeste()
+    return (m is not None and m.entree(chemin) is not None) or os.path.exists(chemin)
+
+
+def frames(dossier):
+    """ [(chemin, delai)] des images du dossier dans l'ordre des frames
+    (delai lu dans le nom du fichier, None s'il n'y en a pas) """
+    m = manifeste()
+    liste = m.frames(dossier) if m is not None else None
+    return liste if liste is not None else paquets.lister_frames(dossier)
+
+
+def texture(nom, miroir=False):
+    """ image de IMAGES """
+    return charger(IMAGES[nom], miroir)
+
+
+def animation(nom, miroir=False):
+    """ frames de ANIMATIONS (les images manquantes sont ignorees) """
+    cle = (nom, miroir)
+    images = _animations.get(cle)
+    if images is None:
+        chemins = ANIMATIONS[nom]
+        if isinstance(chemins, str):
+            chemins = [c for c, _ in frames(chemins)]
+        images = tuple(charger(c, miroir) for c in chemins if existe(c))
+        _animations[cle] = images
+    return images
+
+
+def deux_sens(nom):
+    """ (vers la droite, vers la gauche) : frames de ANIMATIONS ou image seule de IMAGES
+    a indexer par un booleen face_gauche """
+    if nom in ANIMATIONS:
+        return animation(nom), animation(nom, miroir=True)
+    return (texture(nom),), (texture(nom, miroir=True),)
+
+
+def precharger(noms=None):
+    """ charge d'avance les images et animations donnees (toutes par defaut)
+    dans les deux sens
+    peut tourner sur le thread de chargement : pas d'opengl ici """
+    if noms is None:
+        noms = list(IMAGES) + list(ANIMATIONS)
+    for nom in noms:
+        if nom in ANIMATIONS:
+            animation(nom)
+            animation(nom, miroir=True)
+        else:
+            try:
+                texture(nom)
+                texture(nom, miroir=True)
+            except FileNotFoundError:
+                # l'erreur sortira a l'endroit ou l'image sert, comme avant
+                pass
+
+
+def envoyer(atlas, par_tour=1):
+    """ generateur : met les textures chargees dans l'atlas de la carte graphique
+    (par_tour textures a chaque tour, sinon la premiere apparition le fait en jeu) """
+    textures = list(_textures.values()) + list(_miroirs.values())
+    for i in range(0, len(textures), par_tour):
+        for tex in textures[i:i + par_tour]:
+            atlas.add(tex)
+        yield min(1.0, (i + par_tour) / len(textures))
@@ -0,0 +1,96 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# le monde du jeu sans fenetre ni carte graphique, pour mesurer les
+# performances sur une machine sans ecran
+# - MonJeu tourne sur une FenetreSimulee : taille de l'ecran, vue courante et
+#   cameras reduites a une position et un zoom
+# - le chargement ne garde que la carte, les images (pour les hit box), les
+#   murs et les zones : ni scene, ni decor, ni atlas, ni sons
+# - un tick est le meme qu'en jeu (planificateur, pas fixe de PAS_SIMULATION)
+#
+# python sources/simulation.py 10000 : 10000 ticks puis le temps par phase
+
+import sys
+import time
+import audio
+from pyglet.math import Vec2
+from constantes import LARGEUR, HAUTEUR, PAS_SIMULATION
+from main import MonJeu
+
+
+class CameraSimulee:
+    """ ce que le monde lit d'une camera : position (Vec2 comme Camera2D) et zoom """
+
+    def __init__(self):
+        self._position = Vec2(LARGEUR / 2, HAUTEUR / 2)
+        self.zoom = 1.0
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, position):
+        self._position = Vec2(*position)
+
+
+class FenetreSimulee:
+    """ remplace arcade.Window pour MonJeu (rendu = False) """
+    rendu = False
+
+    def __init__(self, largeur=LARGEUR, hauteur=HAUTEUR):
+        self.width = largeur
+        self.height = hauteur
+        self.current_view = None
+
+    def show_view(self, vue):
+        self.current_view = vue
+
+    def nouvelle_camera(self):
+        return CameraSimulee()
+
+
+class Simulation:
+    """ une partie sans fenetre, avancee tick par tick """
+
+    def __init__(self, mode_dev=False, entrees=None):
+        audio.couper()
+        self.fenetre = FenetreSimulee()
+        self.jeu = MonJeu(mode_dev, fenetre=self.fenetre, entrees=entrees)
+        self.fenetre.show_view(self.jeu)
+        self.jeu.setup()
+        self.ticks = 0
+
+    def avancer(self, ticks=1):
+        """ ticks du monde (s'arrete a la mort du joueur ou a la fin du jeu)
+        renvoie le nombre de ticks faits """
+        jeu = self.jeu
+        for i in range(ticks):
+            # rejeu : evenements d'avant ce tick, qui peuvent relancer la partie (voir enregistrement.py)
+            if jeu.entrees is not None:
+                jeu.entrees.avant_tick(jeu)
+            if jeu.etat != "JEU":
+                return i
+            jeu.simuler(PAS_SIMULATION)
+            self.ticks += 1
+        return ticks
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    debut = time.perf_counter()
+    simulation = Simulation()
+    chargement = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    faits = simulation.avancer(ticks)
+    duree = time.perf_counter() - debut
+
+    print(f"chargement : {chargement:.2f} s")
+    print(f"{faits} ticks en {duree:.2f} s : {faits / max(duree, 1e-9):.0f} ticks/s")
+    print("\n".join(simulation.jeu.planificateur.rapport()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#Projet : FLOIOIDE
+#Auteurs : Laure, Thomas, Corentin, Victor
+
+# zones de declenchement (fontaines, boss, spawn des mobs, fin du jeu)
+# au chargement les tuiles de chaque calque sont fusionnees en rectangles
+# puis rangees dans un dictionnaire case de la grille -> zones
+# chaque case garde aussi la hit box de sa tuile (les tuiles ne sont pas pleines)
+# chaque frame : une recherche par case sous le joueur au lieu de tester
+# le joueur contre toutes les tuiles de chaque calque
+
+from collisions import polygone_sprite
+
+class Zone:
+    """ rectangle de tuiles d'un calque, coordonnees monde en pixels """
+
+    def __init__(self, calque, numero, gauche, bas, droite, haut):
+        self.calque = calque
+        self.nom = f"{calque}#{numero}"
+        self.gauche = gauche
+        self.bas = bas
+        self.droite = droite
+        self.haut = haut
+
+    def __repr__(self):
+        return f"Zone({self.nom}, {self.gauche}, {self.bas}, {self.droite}, {self.haut})"
+
+
+def fusionner_rectangles(donnees, largeur, hauteur):
+    """ regroupe les tuiles non vides en rectangles (colonne, ligne, nb_colonnes, nb_lignes)
+    ligne 0 en haut comme dans tiled """
+    prises = set()
+    rectangles = []
+    for ligne in range(hauteur):
+        base = ligne * largeur
+        for colonne in range(largeur):
+            if not donnees[base + colonne] or (colonne, ligne) in prises:
+                continue
+
+            # etendre vers la droite
+            fin_x = colonne + 1
+            while fin_x < largeur and donnees[base + fin_x] and (fin_x, ligne) not in prises:
+                fin_x += 1
+
+            # puis vers le bas tant que toute la ligne est pleine
+            fin_y = ligne + 1
+            while fin_y < hauteur:
+                base_y = fin_y * largeur
+                if not all(donnees[base_y + x] and (x, fin_y) not in prises for x in range(colonne, fin_x)):
+                    break
+                fin_y += 1
+
+            for y in range(ligne, fin_y):
+                for x in range(colonne, fin_x):
+                    prises.add((x, y))
+            rectangles.append((colonne, ligne, fin_x - colonne, fin_y - ligne))
+    return rectangles
+
+
+class IndexZones:
+    """ zones des calques de declenchement rangees par case de la grille """
+
+    def __init__(self, carte, noms, scaling=1.0, textures=None):
+        # textures (TexturesTuiles) : hit box de chaque tuile, sinon case pleine
+        self.taille_x = carte.largeur_tuile * scaling
+        self.taille_y = carte.hauteur_tuile * scaling
+        self.zones = []
+        # (colonne, ligne depuis le bas) -> [(zone, gauche, bas, droite, haut)]
+        self.cases = {}
+
+        for calque in noms:
+            if calque not in carte.calques:
+                continue
+            rectangles = fusionner_rectangles(carte.calques[calque], carte.largeur, carte.hauteur)
+            for numero, (colonne, ligne, nb_x, nb_y) in enumerate(rectangles):
+                # passage en repere arcade (y vers le haut)
+                bas = carte.hauteur - ligne - nb_y
+                zone = Zone(calque, numero, colonne * self.taille_x, bas * self.taille_y,
+                            (colonne + nb_x) * self.taille_x, (bas + nb_y) * self.taille_y)
+                self.zones.append(zone)
+                for x in range(colonne, colonne + nb_x):
+                    for y in range(bas, bas + nb_y):
+                        gid = carte.gid(calque, x, carte.hauteur - 1 - y)
+                        boite = self._boite_tuile(x, y, gid, scaling, textures)
+                        self.cases.setdefault((x, y), []).append((zone,) + boite)
+
+        self.reinitialiser()
+
+    def _boite_tuile(self, x, y, gid, scaling, textures):
+        """ rectangle monde de la hit box de la tuile (x, y) """
+        gauche = x * self.taille_x
+        bas = y * self.taille_y
+        if textures is None:
+            return gauche, bas, gauche + self.taille_x, bas + self.taille_y
+        points = textures.texture(gid).hit_box_points
+        cx = gauche + self.taille_x / 2
+        cy = bas + self.taille_y / 2
+        xs = [px * scaling for px, _ in points]
+        ys = [py * scaling for _, py in points]
+        return cx + min(xs), cy + min(ys), cx + max(xs), cy + max(ys)
+
+    def zones_sous(self, gauche, bas, droite, haut):
+        """ zones dont une tuile touche le rectangle donne """
+        trouvees = set()
+        for x in range(int(gauche // self.taille_x), int(droite // self.taille_x) + 1):
+            for y in range(int(bas // self.taille_y), int(haut // self.taille_y) + 1):
+                for zone, g, b, d, h in self.cases.get((x, y), ()):
+                    if zone.calque in self.desactives:
+                        continue
+                    # bords qui se touchent : pas de contact (joueur pose sur une tuile)
+                    if gauche < d and droite > g and bas < h and haut > b:
+                        trouvees.add(zone)
+        return trouvees
+
+    def mettre_a_jour(self, sprite):
+        """ a appeler une fois par frame avec le joueur
+        renvoie (zones entrees, zones quittees) """
+        points = polygone_sprite(sprite)
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        actuelles = self.zones_sous(min(xs), min(ys), max(xs), max(ys))
+        self.entrees = actuelles - self.actives
+        self.sorties = self.actives - actuelles
+        self.actives = actuelles
+        self.calques_avant = self.calques_actifs
+        self.calques_actifs = {zone.calque for zone in actuelles}
+        return self.entrees, self.sorties
+
+    def dans(self, calque):
+        """ le joueur est dans une zone du calque """
+        return calque in self.calques_actifs
+
+    def entre(self, calque):
+        """ le joueur vient d'entrer dans le calque cette frame """
+        return calque in self.calques_actifs and calque not in self.calques_avant
+
+    def sort(self, calque):
+        """ le joueur vient de quitter le calque cette frame """
+        return calque in self.calques_avant and calque not in self.calques_actifs
+
+    def desactiver(self, calque):
+        """ declencheur a usage unique : le calque ne reagit plus """
+        self.desactives.add(calque)
+
+    def reinitialiser(self):
+        """ nouvelle partie : tous les declencheurs remarchent """
+        self.desactives = set()
+        self.actives = set()     # zones sous le joueur
+        self.entrees = set()     # zones entrees cette frame
+        self.sorties = set()     # zones quittees cette frame
+        self.calques_avant = set()
+        self.calques_actifs = set()